@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -25,6 +25,56 @@ class HuggingFaceSettings(BaseSettings):
     
     token: Optional[str] = Field(default=None, env="HF_TOKEN")
     cache_dir: str = Field(default="./cache/huggingface", env="HF_CACHE_DIR")
+    max_workers: int = Field(default=16, env="HF_MAX_WORKERS")
+    download_workers: int = Field(default=8, env="HF_DOWNLOAD_WORKERS")
+    download_progress_interval: float = Field(default=10.0, env="HF_DOWNLOAD_PROGRESS_INTERVAL")
+    
+    # HTTP connection pool shared by all Hub calls. The timeouts are defaults
+    # that huggingface_hub's own per-request timeouts override; keep-alive
+    # expiry and HTTP/2 only affect the httpx backend.
+    http_pool_size: int = Field(default=32, env="HF_HTTP_POOL_SIZE")
+    http_keep_alive: bool = Field(default=True, env="HF_HTTP_KEEP_ALIVE")
+    http_keepalive_expiry: float = Field(default=60.0, env="HF_HTTP_KEEPALIVE_EXPIRY")
+    http_connect_timeout: float = Field(default=10.0, env="HF_HTTP_CONNECT_TIMEOUT")
+    http_read_timeout: float = Field(default=30.0, env="HF_HTTP_READ_TIMEOUT")
+    http2: bool = Field(default=False, env="HF_HTTP2")
+    
+    # Client-side rate limiting of Hub API calls (requests per minute)
+    rate_limit_enabled: bool = Field(default=True, env="HF_RATE_LIMIT_ENABLED")
+    rate_limit_anonymous_rpm: float = Field(default=100.0, env="HF_RATE_LIMIT_ANONYMOUS_RPM")
+    rate_limit_authenticated_rpm: float = Field(default=200.0, env="HF_RATE_LIMIT_AUTHENTICATED_RPM")
+    rate_limit_burst: int = Field(default=20, env="HF_RATE_LIMIT_BURST")
+    rate_limit_max_retries: int = Field(default=6, env="HF_RATE_LIMIT_MAX_RETRIES")
+    rate_limit_backoff_base: float = Field(default=1.0, env="HF_RATE_LIMIT_BACKOFF_BASE")
+    rate_limit_backoff_max: float = Field(default=60.0, env="HF_RATE_LIMIT_BACKOFF_MAX")
+    # File resolves and downloads have their own, much higher, Hub limit; 0 disables pacing them
+    rate_limit_resolve_rpm: float = Field(default=3000.0, env="HF_RATE_LIMIT_RESOLVE_RPM")
+    rate_limit_resolve_burst: int = Field(default=100, env="HF_RATE_LIMIT_RESOLVE_BURST")
+    
+    # Header-only inspection of .safetensors weights
+    inspect_safetensors: bool = Field(default=True, env="HF_INSPECT_SAFETENSORS")
+    safetensors_max_files: int = Field(default=64, env="HF_SAFETENSORS_MAX_FILES")
+    safetensors_include_tensors: bool = Field(default=True, env="HF_SAFETENSORS_INCLUDE_TENSORS")
+    
+    # Prefetch of small text files (configs, model card, shard indexes)
+    small_file_prefetch: bool = Field(default=True, env="HF_SMALL_FILE_PREFETCH")
+    small_file_max_bytes: int = Field(default=1024 * 1024, env="HF_SMALL_FILE_MAX_BYTES")
+    small_file_patterns: List[str] = Field(
+        default=["*.json", "*.md", "*.txt", "*.py", "*.toml", "*.cfg", "*.yaml", "*.yml"],
+        env="HF_SMALL_FILE_PATTERNS"
+    )
+    
+    # SHA-256 of files the Hub or local cache has no LFS oid for, computed from local copies
+    hash_local_files: bool = Field(default=True, env="HF_HASH_LOCAL_FILES")
+    hash_workers: int = Field(default=0, env="HF_HASH_WORKERS")
+    
+    # Model metadata cache (stored under cache_dir)
+    metadata_cache_enabled: bool = Field(default=True, env="HF_METADATA_CACHE_ENABLED")
+    metadata_cache_ttl: int = Field(default=3600, env="HF_METADATA_CACHE_TTL")
+    metadata_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        env="HF_METADATA_CACHE_MAX_BYTES"
+    )
     
     class Config:
         env_prefix = "HF_"
@@ -40,6 +90,47 @@ class AIBOMSettings(BaseSettings):
     output_format: str = Field(default="json", env="AIBOM_OUTPUT_FORMAT")
     include_dependencies: bool = Field(default=True, env="AIBOM_INCLUDE_DEPS")
     
+    # CycloneDX 1.5 schema validation: "off", "warn" (log and record) or "strict" (reject)
+    validation_mode: str = Field(default="warn", env="AIBOM_VALIDATION_MODE")
+    schema_dir: Optional[str] = Field(default=None, env="AIBOM_SCHEMA_DIR")
+    validation_workers: int = Field(default=0, env="AIBOM_VALIDATION_WORKERS")
+    validation_batch_size: int = Field(default=32, env="AIBOM_VALIDATION_BATCH_SIZE")
+    
+    # CycloneDX JSON (.cdx.json) written next to each report
+    write_cyclonedx: bool = Field(default=True, env="AIBOM_WRITE_CYCLONEDX")
+    pretty_json: bool = Field(default=False, env="AIBOM_PRETTY_JSON")
+    
+    # Generated AIBOMs cached per (repo, commit, generator version, rules hash)
+    cache_enabled: bool = Field(default=True, env="AIBOM_CACHE_ENABLED")
+    cache_dir: str = Field(default="./cache/aibom", env="AIBOM_CACHE_DIR")
+    cache_max_bytes: int = Field(default=512 * 1024 * 1024, env="AIBOM_CACHE_MAX_BYTES")
+    
+    # JSON list of extra file classification rules, applied before the defaults
+    classification_rules_file: Optional[str] = Field(default=None, env="AIBOM_CLASSIFICATION_RULES_FILE")
+    
+    # Long-lived generator worker processes; the built-in generator is used when no command is set
+    generator_command: Optional[str] = Field(default=None, env="AIBOM_GENERATOR_COMMAND")
+    generator_pool_size: int = Field(default=2, env="AIBOM_GENERATOR_POOL_SIZE")
+    generator_timeout: float = Field(default=120.0, env="AIBOM_GENERATOR_TIMEOUT")
+    generator_health_interval: float = Field(default=30.0, env="AIBOM_GENERATOR_HEALTH_INTERVAL")
+    generator_health_timeout: float = Field(default=10.0, env="AIBOM_GENERATOR_HEALTH_TIMEOUT")
+    
+    # Debugging: keep the manifest handed to the generator for every model
+    persist_manifests: bool = Field(default=False, env="AIBOM_PERSIST_MANIFESTS")
+    manifest_dir: str = Field(default="./tmp/manifests", env="AIBOM_MANIFEST_DIR")
+    
+    # Deep scan: download pickle-based weights and inspect their opcodes
+    deep_scan_enabled: bool = Field(default=False, env="AIBOM_DEEP_SCAN_ENABLED")
+    pickle_scan_patterns: List[str] = Field(
+        default=["*.bin", "*.pt", "*.pth", "*.ckpt", "*.pkl", "*.pickle"],
+        env="AIBOM_PICKLE_SCAN_PATTERNS"
+    )
+    pickle_scan_workers: int = Field(default=0, env="AIBOM_PICKLE_SCAN_WORKERS")
+    pickle_scan_chunk_size: int = Field(default=1024 * 1024, env="AIBOM_PICKLE_SCAN_CHUNK_SIZE")
+    
+    # Streaming analysis of crawled models
+    crawl_concurrency: int = Field(default=4, env="AIBOM_CRAWL_CONCURRENCY")
+    
     class Config:
         env_prefix = "AIBOM_"
 
@@ -56,6 +147,10 @@ class Settings(BaseSettings):
     output_dir: str = Field(default="./reports", env="OUTPUT_DIR")
     temp_dir: str = Field(default="./tmp", env="TEMP_DIR")
     
+    # Model source: "hub", "local" (model directory or Hugging Face cache) or "archive"
+    model_source: str = Field(default="hub", env="MODEL_SOURCE")
+    model_source_path: Optional[str] = Field(default=None, env="MODEL_SOURCE_PATH")
+    
     # Component settings
     aws: AWSSettings = AWSSettings()
     huggingface: HuggingFaceSettings = HuggingFaceSettings()
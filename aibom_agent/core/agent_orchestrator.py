@@ -1,15 +1,17 @@
 """AIBOM Agent Orchestrator - coordinates all AIBOM analysis workflows."""
 
 import asyncio
-from typing import List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
 
 from loguru import logger
 
 from ..config.settings import Settings
-from ..models.analysis_result import AnalysisResult, ComparisonResult
+from ..models.analysis_result import AnalysisOutcome, AnalysisResult, ComparisonResult
 from ..services.aibom_generator import AIBOMGenerator
 from ..services.bedrock_agent import BedrockAgentService
-from ..services.huggingface_service import HuggingFaceService
+from ..services.model_source import create_model_source
+from ..services.pickle_scanner import PickleScanner
+from ..services.revision_backfill import RevisionBackfiller
 from ..services.comparison_engine import ComparisonEngine
 from ..services.report_generator import ReportGenerator
 
@@ -28,11 +30,15 @@ class AIBOMAgentOrchestrator:
         self.settings.ensure_directories()
         
         # Initialize services
-        self.hf_service = HuggingFaceService(settings.huggingface)
-        self.aibom_generator = AIBOMGenerator(settings.aibom)
+        self.model_source = create_model_source(settings)
+        self.aibom_generator = AIBOMGenerator(settings.aibom, settings.huggingface)
         self.bedrock_agent = BedrockAgentService(settings.aws)
         self.comparison_engine = ComparisonEngine()
-        self.report_generator = ReportGenerator(settings.output_dir)
+        self.pickle_scanner = PickleScanner(settings.aibom)
+        self.report_generator = ReportGenerator(settings.output_dir, pretty_json=settings.aibom.pretty_json)
+        self.revision_backfiller = RevisionBackfiller(
+            self.model_source, self.aibom_generator, self.pickle_scanner, settings.aibom
+        )
         
         self._initialized = False
     
@@ -44,7 +50,7 @@ class AIBOMAgentOrchestrator:
         logger.info(f"Initializing AIBOM Agent Orchestrator for session: {self.session_id}")
         
         # Initialize services
-        await self.hf_service.initialize()
+        await self.model_source.initialize()
         await self.aibom_generator.initialize()
         await self.bedrock_agent.initialize()
         
@@ -67,8 +73,8 @@ class AIBOMAgentOrchestrator:
         logger.info(f"[Session: {self.session_id}] Starting analysis for model: {model_name}")
         
         try:
-            # Step 1: Fetch model information from Hugging Face
-            model_info = await self.hf_service.get_model_info(model_name)
+            # Step 1: Fetch model information from the model source
+            model_info = await self.model_source.get_model_info(model_name)
             logger.info(f"Retrieved model info for {model_name}")
             
             # Step 2: Generate AIBOM using OWASP generator
@@ -79,6 +85,15 @@ class AIBOMAgentOrchestrator:
             security_analysis = await self.bedrock_agent.analyze_security(aibom, model_info)
             logger.info(f"Completed security analysis for {model_name}")
             
+            # Step 3b: Inspect pickle-based weights for unsafe imports
+            if self.settings.aibom.deep_scan_enabled:
+                local_files = await self.model_source.download_model_files(
+                    model_name, self.settings.aibom.pickle_scan_patterns, revision=model_info.sha
+                )
+                scan_results = await self.pickle_scanner.scan_files(local_files)
+                self.pickle_scanner.apply_results(security_analysis, scan_results)
+                logger.info(f"Completed pickle scan for {model_name}")
+            
             # Step 4: Generate analysis result
             result = AnalysisResult(
                 model_name=model_name,
@@ -92,6 +107,10 @@ class AIBOMAgentOrchestrator:
             report_path = await self.report_generator.generate_single_model_report(result)
             result.report_path = report_path
             
+            # Step 6: Write the CycloneDX document
+            if self.settings.aibom.write_cyclonedx:
+                result.aibom_path = await self.report_generator.write_aibom(result)
+            
             logger.info(f"Analysis completed for {model_name}")
             return result
             
@@ -145,4 +164,142 @@ class AIBOMAgentOrchestrator:
             
         except Exception as e:
             logger.error(f"Failed to compare models {model_names}: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    async def analyze_stream(
+        self,
+        model_names: AsyncIterable[str],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[AnalysisOutcome]:
+        """
+        Analyze models from an async stream, yielding outcomes as they finish.
+        
+        Names are pulled from the stream only when a worker is free, so a
+        crawler feeding this method pages through the Hub no faster than
+        models are analyzed and memory stays bounded however many match.
+        A failure for one model is reported in its outcome.
+        
+        Args:
+            model_names: Async iterable of model names, e.g. from iter_models
+            concurrency: Number of models analyzed at once
+            
+        Returns:
+            Async iterator of AnalysisOutcome objects in completion order
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        workers = concurrency or self.settings.aibom.crawl_concurrency
+        names: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=workers)
+        outcomes: "asyncio.Queue[Optional[AnalysisOutcome]]" = asyncio.Queue(maxsize=workers)
+        
+        async def stop_workers() -> None:
+            for _ in range(workers):
+                await names.put(None)
+        
+        async def produce() -> None:
+            try:
+                async for name in model_names:
+                    await names.put(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await stop_workers()
+                raise
+            await stop_workers()
+        
+        async def work() -> None:
+            try:
+                while (name := await names.get()) is not None:
+                    try:
+                        outcome = AnalysisOutcome(model_name=name, result=await self.analyze_single_model(name))
+                    except Exception as e:
+                        outcome = AnalysisOutcome(model_name=name, error=e)
+                    await outcomes.put(outcome)
+            finally:
+                await outcomes.put(None)
+        
+        logger.info(f"[Session: {self.session_id}] Starting streaming analysis with {workers} workers")
+        producer = asyncio.ensure_future(produce())
+        worker_tasks = [asyncio.ensure_future(work()) for _ in range(workers)]
+        
+        try:
+            finished = 0
+            while finished < workers:
+                outcome = await outcomes.get()
+                if outcome is None:
+                    finished += 1
+                else:
+                    yield outcome
+            # Surface crawler errors once the models already queued are done
+            await producer
+        finally:
+            for task in [producer, *worker_tasks]:
+                task.cancel()
+    
+    async def analyze_crawl(
+        self,
+        concurrency: Optional[int] = None,
+        **filters: Any
+    ) -> AsyncIterator[AnalysisOutcome]:
+        """
+        Crawl the model source with filters and analyze every match.
+        
+        Args:
+            concurrency: Number of models analyzed at once
+            **filters: Filters accepted by ModelSource.iter_models
+                (author, pipeline_tag, search, tags, min_downloads, limit)
+            
+        Returns:
+            Async iterator of AnalysisOutcome objects in completion order
+        """
+        async def crawled_names() -> AsyncIterator[str]:
+            async for listing in self.model_source.iter_models(**filters):
+                yield listing.name
+        
+        async for outcome in self.analyze_stream(crawled_names(), concurrency):
+            yield outcome
+    
+    async def backfill_revisions(self, model_name: str, max_revisions: Optional[int] = None) -> str:
+        """
+        Generate AIBOMs for every historical revision of a model.
+        
+        Args:
+            model_name: Name of the model
+            max_revisions: Only process the most recent N revisions
+            
+        Returns:
+            Path to the JSON document holding one AIBOM per revision
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        logger.info(f"[Session: {self.session_id}] Starting revision backfill for model: {model_name}")
+        
+        try:
+            results = await self.revision_backfiller.backfill(model_name, max_revisions)
+            return await self.report_generator.generate_backfill_report(model_name, results)
+            
+        except Exception as e:
+            logger.error(f"Failed to backfill revisions for {model_name}: {e}")
+            raise
+    
+    def status(self) -> Dict[str, Any]:
+        """Report orchestrator and model source state without network calls."""
+        return {
+            "session_id": self.session_id,
+            "initialized": self._initialized,
+            "model_source": self.model_source.status(),
+            "generator_pool": self.aibom_generator.pool.stats() if self.aibom_generator.pool else None
+        }
+    
+    async def cleanup(self) -> None:
+        """Clean up resources held by the services."""
+        logger.info(f"Cleaning up AIBOM Agent Orchestrator for session: {self.session_id}")
+        
+        await self.model_source.cleanup()
+        await self.aibom_generator.cleanup()
+        await self.bedrock_agent.cleanup()
+        await self.pickle_scanner.cleanup()
+        
+        self._initialized = False
@@ -11,7 +11,7 @@ from ..config.settings import Settings
 from ..models.analysis_result import AnalysisResult, ComparisonResult
 from ..services.aibom_generator import AIBOMGenerator
 from ..services.bedrock_agent import BedrockAgentService
-from ..services.huggingface_service import HuggingFaceService
+from ..services.model_source import create_model_source
 from ..services.comparison_engine import ComparisonEngine
 from ..services.report_generator import ReportGenerator
 
@@ -29,11 +29,11 @@ class AIBOMAgentSystem:
         self.settings.ensure_directories()
         
         # Initialize services
-        self.hf_service = HuggingFaceService(settings.huggingface)
-        self.aibom_generator = AIBOMGenerator(settings.aibom)
+        self.model_source = create_model_source(settings)
+        self.aibom_generator = AIBOMGenerator(settings.aibom, settings.huggingface)
         self.bedrock_agent = BedrockAgentService(settings.aws)
         self.comparison_engine = ComparisonEngine()
-        self.report_generator = ReportGenerator(settings.output_dir)
+        self.report_generator = ReportGenerator(settings.output_dir, pretty_json=settings.aibom.pretty_json)
         
         self._initialized = False
     
@@ -45,7 +45,7 @@ class AIBOMAgentSystem:
         logger.info("Initializing AIBOM Agent System...")
         
         # Initialize services
-        await self.hf_service.initialize()
+        await self.model_source.initialize()
         await self.aibom_generator.initialize()
         await self.bedrock_agent.initialize()
         
@@ -68,8 +68,8 @@ class AIBOMAgentSystem:
         logger.info(f"Starting analysis for model: {model_name}")
         
         try:
-            # Step 1: Fetch model information from Hugging Face
-            model_info = await self.hf_service.get_model_info(model_name)
+            # Step 1: Fetch model information from the model source
+            model_info = await self.model_source.get_model_info(model_name)
             logger.info(f"Retrieved model info for {model_name}")
             
             # Step 2: Generate AIBOM using OWASP generator
@@ -93,6 +93,10 @@ class AIBOMAgentSystem:
             report_path = await self.report_generator.generate_single_model_report(result)
             result.report_path = report_path
             
+            # Step 6: Write the CycloneDX document
+            if self.settings.aibom.write_cyclonedx:
+                result.aibom_path = await self.report_generator.write_aibom(result)
+            
             logger.info(f"Analysis completed for {model_name}")
             return result
             
@@ -153,7 +157,7 @@ class AIBOMAgentSystem:
         logger.info("Cleaning up AIBOM Agent System...")
         
         # Cleanup services
-        await self.hf_service.cleanup()
+        await self.model_source.cleanup()
         await self.aibom_generator.cleanup()
         await self.bedrock_agent.cleanup()
         
@@ -1,9 +1,11 @@
 """Data models for analysis results."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+from .file_table import FileTable
+
 
 @dataclass
 class ModelInfo:
@@ -21,7 +23,49 @@ class ModelInfo:
     last_modified: str
     model_size: Optional[int]
     config: Dict[str, Any]
-    files: List[Dict[str, Any]]
+    files: FileTable
+    sha: Optional[str] = None
+    size_breakdown: Dict[str, Any] = field(default_factory=dict)
+    safetensors: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    small_files: Dict[str, str] = field(default_factory=dict)
+    file_hashes: Dict[str, str] = field(default_factory=dict)
+    # Inputs that could not be read this time (e.g. "safetensors:model.safetensors");
+    # such an info is used, but not cached as the final word on its commit
+    incomplete: List[str] = field(default_factory=list)
+    
+    def __post_init__(self) -> None:
+        # Accept a list of file dicts, or the columnar form stored in caches
+        if isinstance(self.files, dict):
+            self.files = FileTable.from_dict(self.files)
+        elif not isinstance(self.files, FileTable):
+            self.files = FileTable(self.files)
+
+
+@dataclass
+class ModelFetchResult:
+    """Outcome of fetching one model in a bulk request."""
+    model_name: str
+    model_info: Optional[ModelInfo] = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        """Whether the model information was fetched."""
+        return self.error is None
+
+
+@dataclass
+class ModelListing:
+    """A model found by crawling the Hub's model listing."""
+    name: str
+    author: Optional[str] = None
+    pipeline_tag: Optional[str] = None
+    library_name: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    downloads: Optional[int] = None
+    likes: Optional[int] = None
+    last_modified: Optional[str] = None
+    sha: Optional[str] = None
 
 
 @dataclass
@@ -36,6 +80,57 @@ class AIBOM:
     dependencies: List[Dict[str, Any]]
     vulnerabilities: List[Dict[str, Any]]
     compositions: List[Dict[str, Any]]
+    # Kept outside the CycloneDX body so identical content hashes identically
+    generated_at: Optional[str] = None
+    content_hash: Optional[str] = None
+    # CycloneDX schema violations found at generation time (None if not validated)
+    validation_errors: Optional[List[str]] = None
+    
+    def to_cyclonedx(self) -> Dict[str, Any]:
+        """The CycloneDX document, without generation bookkeeping."""
+        return {
+            "bomFormat": self.bom_format,
+            "specVersion": self.spec_version,
+            "serialNumber": self.serial_number,
+            "version": self.version,
+            "metadata": self.metadata,
+            "components": self.components,
+            "dependencies": self.dependencies,
+            "vulnerabilities": self.vulnerabilities,
+            "compositions": self.compositions
+        }
+    
+    def dependency_components(self) -> List[Dict[str, Any]]:
+        """Components the described model depends on, per the dependency graph."""
+        model_ref = self.metadata.get("component", {}).get("bom-ref")
+        refs = {
+            ref
+            for edge in self.dependencies if edge.get("ref") == model_ref
+            for ref in edge.get("dependsOn", [])
+        }
+        return [component for component in self.components if component.get("bom-ref") in refs]
+
+
+@dataclass
+class ModelRevision:
+    """A commit in a model repository's history."""
+    sha: str
+    committed_at: str = ""
+    title: str = ""
+
+
+@dataclass
+class RevisionAIBOM:
+    """AIBOM generated for one historical revision of a model."""
+    model_name: str
+    revision: ModelRevision
+    aibom: Optional[AIBOM]
+    added_files: List[str] = field(default_factory=list)
+    modified_files: List[str] = field(default_factory=list)
+    removed_files: List[str] = field(default_factory=list)
+    reused_files: int = 0
+    pickle_findings: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
 
 
 @dataclass
@@ -60,6 +155,7 @@ class AnalysisResult:
     security_analysis: SecurityAnalysis
     timestamp: float
     report_path: Optional[str] = None
+    aibom_path: Optional[str] = None
     
     @property
     def security_issues_count(self) -> int:
@@ -72,6 +168,19 @@ class AnalysisResult:
         return len(self.security_analysis.compliance_issues)
 
 
+@dataclass
+class AnalysisOutcome:
+    """Outcome of analyzing one model in a streamed batch."""
+    model_name: str
+    result: Optional[AnalysisResult] = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        """Whether the analysis completed."""
+        return self.error is None
+
+
 @dataclass
 class ModelComparison:
     """Comparison between multiple models."""
@@ -0,0 +1,174 @@
+"""Compact columnar storage for repository file listings."""
+
+import sys
+from array import array
+from fnmatch import fnmatch
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Storage kinds: how the file is stored in the repository
+KIND_NONE = 0
+KIND_GIT = 1
+KIND_LFS = 2
+
+KIND_NAMES = {KIND_NONE: None, KIND_GIT: "git", KIND_LFS: "lfs"}
+
+# Expected digest length per kind; each oid occupies a fixed 32-byte slot
+OID_BYTES = {KIND_GIT: 20, KIND_LFS: 32}
+OID_SLOT = 32
+
+
+class FileTable:
+    """
+    Repository file listing stored as parallel arrays.
+    
+    Each file is a directory id (into a table of interned path prefixes),
+    an interned base name, a size, a storage kind and a binary oid: the LFS
+    sha256 for LFS files, the git blob id otherwise. That is a few dozen
+    bytes per file instead of a dict with four string values, which matters
+    for repositories listing tens of thousands of files.
+    
+    Iterating or indexing yields the same dicts as the old list-of-dicts
+    representation ({"name", "size", "blob_id", "sha256"}, plus "kind"),
+    built on demand, so existing callers and templates keep working.
+    Rows are views: modifying them does not change the table.
+    """
+    
+    __slots__ = ("_dirs", "_dir_index", "_dir_ids", "_basenames", "_sizes", "_kinds", "_oids", "_odd_oids")
+    
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self._dirs: List[str] = []
+        self._dir_index: Dict[str, int] = {}
+        self._dir_ids = array("I")
+        self._basenames: List[str] = []
+        self._sizes = array("q")
+        self._kinds = array("B")
+        self._oids = bytearray()
+        # Oids that are not plain hex digests, by row
+        self._odd_oids: Dict[int, str] = {}
+        
+        for record in records:
+            self.append(record)
+    
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add a file given as a {"name", "size", "blob_id", "sha256"} dict."""
+        directory, _, basename = record["name"].rpartition("/")
+        dir_id = self._dir_index.get(directory)
+        if dir_id is None:
+            dir_id = self._dir_index[directory] = len(self._dirs)
+            self._dirs.append(directory)
+        
+        if record.get("sha256"):
+            kind, oid = KIND_LFS, record["sha256"]
+        elif record.get("blob_id"):
+            kind, oid = KIND_GIT, record["blob_id"]
+        else:
+            kind, oid = KIND_NONE, None
+        
+        row = len(self._basenames)
+        self._dir_ids.append(dir_id)
+        self._basenames.append(sys.intern(basename))
+        self._sizes.append(-1 if record.get("size") is None else record["size"])
+        self._kinds.append(kind)
+        self._oids.extend(self._pack_oid(row, kind, oid))
+    
+    def _pack_oid(self, row: int, kind: int, oid: Optional[str]) -> bytes:
+        if oid is not None:
+            try:
+                digest = bytes.fromhex(oid)
+            except ValueError:
+                digest = b""
+            if len(digest) == OID_BYTES[kind]:
+                return digest.ljust(OID_SLOT, b"\0")
+            self._odd_oids[row] = oid
+        return bytes(OID_SLOT)
+    
+    def name_at(self, row: int) -> str:
+        directory = self._dirs[self._dir_ids[row]]
+        basename = self._basenames[row]
+        return f"{directory}/{basename}" if directory else basename
+    
+    def size_at(self, row: int) -> Optional[int]:
+        size = self._sizes[row]
+        return None if size < 0 else size
+    
+    def oid_at(self, row: int) -> Optional[str]:
+        kind = self._kinds[row]
+        if kind == KIND_NONE:
+            return None
+        if row in self._odd_oids:
+            return self._odd_oids[row]
+        start = row * OID_SLOT
+        return self._oids[start:start + OID_BYTES[kind]].hex()
+    
+    def names(self) -> Iterator[str]:
+        """Iterate over file names without building row dicts."""
+        for row in range(len(self)):
+            yield self.name_at(row)
+    
+    def matching(self, allow_patterns: List[str]) -> List[Dict[str, Any]]:
+        """Rows whose names match any of the glob patterns (a trailing "/" matches a folder)."""
+        patterns = [f"{pattern}*" if pattern.endswith("/") else pattern for pattern in allow_patterns]
+        return [
+            self[row] for row in range(len(self))
+            if any(fnmatch(self.name_at(row), pattern) for pattern in patterns)
+        ]
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Materialize the table as a list of dicts."""
+        return list(self)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Columnar, JSON-serializable form of the table."""
+        return {
+            "dirs": self._dirs,
+            "dir_ids": self._dir_ids.tolist(),
+            "basenames": self._basenames,
+            "sizes": self._sizes.tolist(),
+            "kinds": self._kinds.tolist(),
+            "oids": self._oids.hex(),
+            "odd_oids": {str(row): oid for row, oid in self._odd_oids.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FileTable":
+        """Rebuild a table from the output of to_dict."""
+        table = cls()
+        table._dirs = list(data["dirs"])
+        table._dir_index = {directory: i for i, directory in enumerate(table._dirs)}
+        table._dir_ids = array("I", data["dir_ids"])
+        table._basenames = [sys.intern(name) for name in data["basenames"]]
+        table._sizes = array("q", data["sizes"])
+        table._kinds = array("B", data["kinds"])
+        table._oids = bytearray.fromhex(data["oids"])
+        table._odd_oids = {int(row): oid for row, oid in data.get("odd_oids", {}).items()}
+        return table
+    
+    def __len__(self) -> int:
+        return len(self._basenames)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(len(self)):
+            yield self[row]
+    
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        if row < 0:
+            row += len(self)
+        kind = self._kinds[row]
+        oid = self.oid_at(row)
+        return {
+            "name": self.name_at(row),
+            "size": self.size_at(row),
+            "blob_id": oid if kind == KIND_GIT else None,
+            "sha256": oid if kind == KIND_LFS else None,
+            "kind": KIND_NAMES[kind],
+        }
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FileTable):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, list):
+            return self.to_records() == other
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"FileTable({len(self)} files in {len(self._dirs)} directories)"
@@ -0,0 +1,56 @@
+"""Persistent cache of generated AIBOMs keyed by repository commit."""
+
+import dataclasses
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+from ..models.analysis_result import AIBOM
+from .disk_cache import DiskCache
+from .metadata_cache import is_commit_sha
+
+
+class AIBOMCache:
+    """
+    Disk-backed cache of generated AIBOMs.
+    
+    An AIBOM is a function of the repository contents at a commit, the
+    generator that produced it, the file classification rules and the
+    settings that shape the output, so entries are keyed by (repo id,
+    commit sha, generator version, config hash). Upgrading the generator or
+    changing the rules or settings changes the key, which retires old
+    entries without explicit invalidation; they leave the cache through
+    LRU eviction.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.store = DiskCache(Path(cache_dir) / "aibom", max_bytes)
+    
+    def get(self, repo_id: str, sha: Optional[str], generator_version: str, config_hash: str) -> Optional[AIBOM]:
+        """Return the cached AIBOM for a repo at a commit, or None on a miss."""
+        if not is_commit_sha(sha):
+            return None
+        
+        key = self._key(repo_id, sha, generator_version, config_hash)
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        try:
+            return AIBOM(**entry.value)
+        except TypeError:
+            # Written by an incompatible version of AIBOM
+            self.store.delete(key)
+            return None
+    
+    def put(self, repo_id: str, sha: Optional[str], generator_version: str, config_hash: str, aibom: AIBOM) -> None:
+        """Store an AIBOM; only content pinned to a commit sha is cached."""
+        if not is_commit_sha(sha):
+            return
+        try:
+            self.store.put(self._key(repo_id, sha, generator_version, config_hash), dataclasses.asdict(aibom))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache AIBOM for {repo_id}@{sha}: {e}")
+    
+    def _key(self, repo_id: str, sha: str, generator_version: str, config_hash: str) -> str:
+        return f"aibom:{repo_id}@{sha}:{generator_version}:{config_hash}"
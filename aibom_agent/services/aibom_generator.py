@@ -1,26 +1,120 @@
 """AIBOM Generator service using OWASP AIBOM Generator."""
 
 import asyncio
+import hashlib
 import json
+import re
 import subprocess
-import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import uuid
 
 from loguru import logger
 
-from ..config.settings import AIBOMSettings
+from ..config.settings import AIBOMSettings, HuggingFaceSettings
 from ..models.analysis_result import AIBOM, ModelInfo
+from ..models.file_table import FileTable
+from .aibom_cache import AIBOMCache
+from .aibom_validator import AIBOMValidationError, AIBOMValidationService
+from .blob_store import content_id
+from .dependency_inference import DependencyInferrer, dependency_component
+from .file_classifier import FileClassifier, FileRule
+from .generator_pool import GeneratorPool
+
+# Version of the built-in generator; bump whenever its output changes
+GENERATOR_VERSION = "1.6.0"
+
+# Model source settings that change what ends up in an AIBOM
+SOURCE_OUTPUT_SETTINGS = (
+    "inspect_safetensors",
+    "safetensors_max_files",
+    "safetensors_include_tensors",
+    "small_file_prefetch",
+    "small_file_max_bytes",
+    "small_file_patterns",
+    "hash_local_files",
+)
+
+# Namespace for the uuid5 serial numbers and ids derived from AIBOM content
+AIBOM_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "urn:aibom-agent:aibom")
+
+# CycloneDX component types for the classifier's component types; the
+# classifier's own type is kept in the aibom:component-type property
+CYCLONEDX_COMPONENT_TYPES = {
+    "model-weights": "machine-learning-model",
+    "tokenizer": "data",
+    "configuration": "file",
+    "source-code": "file",
+}
+
+# Per-file classification output: (components, vulnerabilities)
+FileClassification = Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+
+# Keys of prefetched configuration files recorded as component properties
+CONFIG_PROPERTIES = {
+    "config.json": ["model_type", "architectures", "torch_dtype", "transformers_version"],
+    "generation_config.json": ["transformers_version", "max_length", "max_new_tokens"],
+    "tokenizer_config.json": ["tokenizer_class", "model_max_length"],
+}
+
+
+def canonical_hash(document: Dict[str, Any]) -> str:
+    """SHA-256 of a document serialized with sorted keys and no whitespace."""
+    canonical = json.dumps(document, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def stable_id(*parts: Any) -> uuid.UUID:
+    """uuid5 over the given parts, stable across runs."""
+    return uuid.uuid5(AIBOM_NAMESPACE, "\x1f".join(map(str, parts)))
+
+
+def _utc_timestamp(value: Optional[str]) -> Optional[str]:
+    """Normalize a datetime string to CycloneDX's UTC form, or None if unparsable."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 class AIBOMGenerator:
     """Service for generating AI Bill of Materials using OWASP standards."""
     
-    def __init__(self, settings: AIBOMSettings):
+    def __init__(self, settings: AIBOMSettings, source_settings: Optional[HuggingFaceSettings] = None):
         self.settings = settings
-        self.temp_dir = Path(tempfile.gettempdir()) / "aibom_generator"
-        self.temp_dir.mkdir(exist_ok=True)
+        self.source_settings = source_settings
+        self.pool: Optional[GeneratorPool] = None
+        self.classifier = FileClassifier.from_settings(settings.classification_rules_file)
+        self.validation = AIBOMValidationService(settings)
+        self.dependency_inferrer = DependencyInferrer()
+        self.cache: Optional[AIBOMCache] = None
+        if settings.cache_enabled:
+            self.cache = AIBOMCache(settings.cache_dir, settings.cache_max_bytes)
+    
+    @property
+    def generator_version(self) -> str:
+        """Identifies the generator producing AIBOMs, external command included."""
+        if not self.settings.generator_command:
+            return GENERATOR_VERSION
+        command_hash = hashlib.sha256(self.settings.generator_command.encode()).hexdigest()[:12]
+        return f"{GENERATOR_VERSION}+{command_hash}"
+    
+    @property
+    def config_hash(self) -> str:
+        """Hash of the classification rules and every setting that changes the output."""
+        config: Dict[str, Any] = {
+            "rules": self.classifier.rules_hash,
+            "include_dependencies": self.settings.include_dependencies,
+        }
+        if self.source_settings is not None:
+            config.update({name: getattr(self.source_settings, name) for name in SOURCE_OUTPUT_SETTINGS})
+        return canonical_hash(config)
     
     async def initialize(self) -> None:
         """Initialize the AIBOM generator."""
@@ -29,18 +123,35 @@ class AIBOMGenerator:
         # Check if OWASP AIBOM Generator is available
         await self._ensure_owasp_generator()
         
+        # Compile the CycloneDX schema once, up front
+        self.validation.initialize()
+        
         logger.info("AIBOM Generator service initialized successfully")
     
-    async def generate_aibom(self, model_info: ModelInfo) -> AIBOM:
+    async def generate_aibom(
+        self,
+        model_info: ModelInfo,
+        file_memo: Optional[Dict[Tuple, FileClassification]] = None
+    ) -> AIBOM:
         """
         Generate an AIBOM for a Hugging Face model.
         
         Args:
             model_info: Information about the model
+            file_memo: Optional per-file classification results keyed by file
+                content; entries are reused and new ones added, so AIBOMs for
+                successive revisions only classify the files that changed
             
         Returns:
             AIBOM object with bill of materials data
         """
+        cache_key = (model_info.name, model_info.sha, self.generator_version, self.config_hash)
+        if self.cache is not None:
+            cached = await self._run_blocking(self.cache.get, *cache_key)
+            if cached is not None:
+                logger.info(f"Using cached AIBOM for {model_info.name}@{model_info.sha[:8]}")
+                return cached
+        
         logger.info(f"Generating AIBOM for model: {model_info.name}")
         
         try:
@@ -48,23 +159,56 @@ class AIBOMGenerator:
             manifest = await self._create_model_manifest(model_info)
             
             # Generate AIBOM using OWASP generator
-            aibom_data = await self._run_owasp_generator(manifest, model_info.name)
+            aibom_data = await self._run_owasp_generator(manifest, model_info.name, file_memo)
             
             # Convert to our AIBOM structure
-            aibom = self._convert_to_aibom(aibom_data, model_info)
+            aibom = self._finalize(self._convert_to_aibom(aibom_data, model_info))
+            
+            # Validate against the CycloneDX schema before it is cached or published
+            self.validation.check(aibom, model_info.name)
+            
+            if self.cache is not None:
+                if model_info.incomplete:
+                    # A transient failure must not be cached forever for an immutable sha
+                    logger.info(
+                        f"Not caching AIBOM for {model_info.name}: incomplete inputs "
+                        f"({', '.join(model_info.incomplete[:3])})"
+                    )
+                else:
+                    await self._run_blocking(self.cache.put, *cache_key, aibom)
             
             logger.info(f"AIBOM generated successfully for {model_info.name}")
             return aibom
             
+        except AIBOMValidationError as e:
+            # Strict mode: an invalid AIBOM must not be replaced by a stub
+            logger.error(str(e))
+            raise
         except Exception as e:
             logger.error(f"Failed to generate AIBOM for {model_info.name}: {e}")
             # Return a basic AIBOM on failure
-            return self._create_basic_aibom(model_info)
+            return self._finalize(self._create_basic_aibom(model_info))
+    
+    def _finalize(self, aibom: AIBOM) -> AIBOM:
+        """Stamp generation time and content hash; neither is part of the hashed body."""
+        aibom.generated_at = datetime.now(timezone.utc).isoformat()
+        aibom.content_hash = canonical_hash(aibom.to_cyclonedx())
+        return aibom
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run blocking filesystem work off the event loop."""
+        return await asyncio.get_event_loop().run_in_executor(None, func, *args)
     
     async def _ensure_owasp_generator(self) -> None:
         """Ensure OWASP AIBOM Generator is available."""
-        # For now, we'll simulate the OWASP generator
-        # In production, you would install/check the actual OWASP AIBOM Generator
+        if not self.settings.generator_command:
+            # Without a generator command, simulate the OWASP generator
+            logger.info("OWASP AIBOM Generator check completed (using built-in generator)")
+            return
+        
+        if self.pool is None:
+            self.pool = GeneratorPool(self.settings, json_default=self._json_default)
+            self.pool.start()
         logger.info("OWASP AIBOM Generator check completed")
     
     async def _create_model_manifest(self, model_info: ModelInfo) -> Dict[str, Any]:
@@ -72,7 +216,7 @@ class AIBOMGenerator:
         return {
             "model": {
                 "name": model_info.name,
-                "version": "latest",
+                "version": model_info.sha or "latest",
                 "author": model_info.author,
                 "description": model_info.description,
                 "license": model_info.license,
@@ -81,6 +225,9 @@ class AIBOMGenerator:
                 "tags": model_info.tags,
                 "files": model_info.files,
                 "config": model_info.config,
+                "safetensors": model_info.safetensors,
+                "small_files": model_info.small_files,
+                "file_hashes": model_info.file_hashes,
                 "metadata": {
                     "downloads": model_info.downloads,
                     "likes": model_info.likes,
@@ -91,120 +238,132 @@ class AIBOMGenerator:
             }
         }
     
-    async def _run_owasp_generator(self, manifest: Dict[str, Any], model_name: str) -> Dict[str, Any]:
-        """Run the OWASP AIBOM Generator."""
-        # Create temporary files
-        manifest_file = self.temp_dir / f"{uuid.uuid4()}_manifest.json"
-        output_file = self.temp_dir / f"{uuid.uuid4()}_aibom.json"
+    async def _run_owasp_generator(
+        self,
+        manifest: Dict[str, Any],
+        model_name: str,
+        file_memo: Optional[Dict[Tuple, FileClassification]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the OWASP AIBOM Generator.
+        
+        The manifest is handed over in memory. With persist_manifests enabled
+        it is also written to manifest_dir for debugging. When a generator
+        command is configured the manifest goes to the worker pool, which
+        classifies files itself, so file_memo only applies to the built-in
+        generator.
+        """
+        if self.settings.persist_manifests:
+            await self._run_blocking(self._persist_manifest, manifest, model_name)
+        
+        if self.pool is not None:
+            return await self.pool.generate(manifest)
+        
+        # Otherwise simulate OWASP generator with our own logic
+        return await self._simulate_owasp_generator(manifest, model_name, file_memo)
+    
+    def _persist_manifest(self, manifest: Dict[str, Any], model_name: str) -> None:
+        """Write a manifest to manifest_dir; failures are logged, not raised."""
+        manifest_dir = Path(self.settings.manifest_dir)
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        manifest_file = manifest_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)}_{timestamp}_manifest.json"
         
         try:
-            # Write manifest to file
+            manifest_dir.mkdir(parents=True, exist_ok=True)
             with open(manifest_file, 'w') as f:
-                json.dump(manifest, f, indent=2)
-            
-            # For now, simulate OWASP generator with our own logic
-            # In production, you would call the actual OWASP AIBOM Generator
-            aibom_data = await self._simulate_owasp_generator(manifest, model_name)
-            
-            return aibom_data
-            
-        finally:
-            # Cleanup temporary files
-            manifest_file.unlink(missing_ok=True)
-            output_file.unlink(missing_ok=True)
+                json.dump(manifest, f, indent=2, default=self._json_default)
+            logger.debug(f"Manifest for {model_name} written to {manifest_file}")
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not persist manifest for {model_name}: {e}")
     
-    async def _simulate_owasp_generator(self, manifest: Dict[str, Any], model_name: str) -> Dict[str, Any]:
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        if isinstance(obj, FileTable):
+            return obj.to_records()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    async def _simulate_owasp_generator(
+        self,
+        manifest: Dict[str, Any],
+        model_name: str,
+        file_memo: Optional[Dict[Tuple, FileClassification]] = None
+    ) -> Dict[str, Any]:
         """Simulate OWASP AIBOM Generator output."""
         model_data = manifest["model"]
         
         # Analyze model files for components
         components = []
-        dependencies = []
+        dependencies: List[Dict[str, Any]] = []
         vulnerabilities = []
         
-        # Extract components from model files
-        for file_info in model_data.get("files", []):
-            file_name = file_info["name"]
-            
-            if file_name.endswith(('.bin', '.safetensors')):
-                components.append({
-                    "type": "model-weights",
-                    "name": file_name,
-                    "version": "unknown",
-                    "description": f"Model weights file: {file_name}",
-                    "supplier": model_data.get("author", "unknown"),
-                    "licenses": [{"license": {"name": model_data.get("license", "unknown")}}]
-                })
+        safetensors_headers = model_data.get("safetensors", {})
+        
+        # Extract components from model files, matching all names in one pass
+        files = model_data.get("files", [])
+        names = files.names() if isinstance(files, FileTable) else (f["name"] for f in files)
+        rules = self.classifier.classify_all(names)
+        
+        for file_info, rule in zip(files, rules):
+            if rule is None:
+                continue
+            memo_key = self._file_memo_key(file_info, model_data) if file_memo is not None else None
             
-            elif file_name.endswith('.json'):
-                components.append({
-                    "type": "configuration",
-                    "name": file_name,
-                    "version": "unknown", 
-                    "description": f"Configuration file: {file_name}",
-                    "supplier": model_data.get("author", "unknown")
-                })
+            if memo_key is not None and memo_key in file_memo:
+                file_components, file_vulnerabilities = file_memo[memo_key]
+            else:
+                file_components, file_vulnerabilities = self._classify_file(
+                    file_info, rule, model_data, safetensors_headers
+                )
+                if memo_key is not None:
+                    file_memo[memo_key] = (file_components, file_vulnerabilities)
             
-            elif file_name.endswith('.py'):
-                components.append({
-                    "type": "source-code",
-                    "name": file_name,
-                    "version": "unknown",
-                    "description": f"Python source file: {file_name}",
-                    "supplier": model_data.get("author", "unknown")
+            components.extend(file_components)
+            vulnerabilities.extend(file_vulnerabilities)
+        
+        # Versioned framework and library dependencies from the prefetched repository files,
+        # as components the model depends on; reading the files is blocking work
+        if self.settings.include_dependencies:
+            inferred = await self._run_blocking(self.dependency_inferrer.infer, model_data)
+            dependency_components = [dependency_component(dependency) for dependency in inferred]
+            components.extend(dependency_components)
+            if dependency_components:
+                dependencies.append({
+                    "ref": model_name,
+                    "dependsOn": [component["bom-ref"] for component in dependency_components]
                 })
-                
-                # Check for potentially unsafe Python files
-                if "pickle" in file_name.lower():
-                    vulnerabilities.append({
-                        "id": f"AIBOM-{uuid.uuid4().hex[:8]}",
-                        "source": {"name": "AIBOM Security Analysis"},
-                        "ratings": [{"severity": "high", "method": "other"}],
-                        "description": f"Potentially unsafe pickle file detected: {file_name}",
-                        "affects": [{"ref": file_name}]
-                    })
-        
-        # Add framework dependencies based on library_name
-        library_name = model_data.get("library_name")
-        if library_name:
-            dependencies.append({
-                "type": "framework",
-                "name": library_name,
-                "version": "unknown",
-                "description": f"ML framework dependency: {library_name}",
-                "supplier": "community"
-            })
         
         # Check for common security issues
         if model_data.get("license") in [None, "unknown"]:
             vulnerabilities.append({
-                "id": f"AIBOM-{uuid.uuid4().hex[:8]}",
+                "id": f"AIBOM-{stable_id(model_name, 'license').hex[:8]}",
                 "source": {"name": "AIBOM License Analysis"},
                 "ratings": [{"severity": "medium", "method": "other"}],
                 "description": "Model license is not specified or unknown",
                 "affects": [{"ref": model_name}]
             })
         
-        return {
+        metadata = model_data.get("metadata") or {}
+        document = {
             "bomFormat": "CycloneDX",
             "specVersion": "1.5",
-            "serialNumber": f"urn:uuid:{uuid.uuid4()}",
             "version": 1,
             "metadata": {
-                "timestamp": "2024-01-01T00:00:00Z",
+                # The model's last change, not the time of generation, so the output is reproducible
+                "timestamp": _utc_timestamp(metadata.get("last_modified")),
                 "tools": [
                     {
                         "vendor": "OWASP",
                         "name": "AIBOM Generator",
-                        "version": "1.0.0"
+                        "version": GENERATOR_VERSION
                     }
                 ],
                 "component": {
                     "type": "machine-learning-model",
+                    "bom-ref": model_name,
                     "name": model_name,
-                    "version": "latest",
-                    "description": model_data.get("description", ""),
-                    "supplier": {"name": model_data.get("author", "unknown")}
+                    "version": model_data.get("version") or "latest",
+                    "description": model_data.get("description") or "",
+                    "supplier": {"name": model_data.get("author") or "unknown"}
                 }
             },
             "components": components,
@@ -212,6 +371,142 @@ class AIBOMGenerator:
             "vulnerabilities": vulnerabilities,
             "compositions": []
         }
+        if document["metadata"]["timestamp"] is None:
+            del document["metadata"]["timestamp"]
+        
+        # Identical content gets the same serial number
+        document["serialNumber"] = f"urn:uuid:{uuid.uuid5(AIBOM_NAMESPACE, canonical_hash(document))}"
+        return document
+    
+    def _file_memo_key(self, file_info: Dict[str, Any], model_data: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Key under which a file's classification can be reused.
+        
+        Besides the file's name and content, the key covers the model-level
+        fields copied into its components.
+        """
+        file_content = content_id(file_info)
+        if file_content is None:
+            sha256 = self._file_sha256(file_info, model_data)
+            if sha256 is None:
+                return None
+            file_content = f"sha256:{sha256}"
+        return (file_info["name"], file_content, model_data.get("author"), model_data.get("license"))
+    
+    def _classify_file(
+        self,
+        file_info: Dict[str, Any],
+        rule: FileRule,
+        model_data: Dict[str, Any],
+        safetensors_headers: Dict[str, Dict[str, Any]]
+    ) -> FileClassification:
+        """Build the components and vulnerabilities contributed by one file."""
+        vulnerabilities = []
+        file_name = file_info["name"]
+        
+        component = {
+            "type": CYCLONEDX_COMPONENT_TYPES.get(rule.component_type, "file"),
+            "bom-ref": file_name,
+            "name": file_name,
+            "version": "unknown",
+            "description": f"{rule.description}: {file_name}",
+            "supplier": {"name": model_data.get("author") or "unknown"}
+        }
+        sha256 = self._file_sha256(file_info, model_data)
+        if sha256:
+            component["hashes"] = [{"alg": "SHA-256", "content": sha256}]
+        properties = [{"name": "aibom:component-type", "value": rule.component_type}]
+        
+        if rule.component_type == "model-weights":
+            if model_data.get("license"):
+                component["licenses"] = [{"license": {"name": model_data["license"]}}]
+            
+            # Tensor inventory read from the safetensors header
+            if file_name in safetensors_headers:
+                properties.extend(self._safetensors_properties(safetensors_headers[file_name]))
+        
+        elif rule.component_type == "configuration" and file_name.endswith(".json"):
+            # Key settings read from the prefetched file
+            properties.extend(self._config_properties(file_name, model_data.get("small_files", {})))
+        
+        if rule.format:
+            properties.append({"name": "aibom:format", "value": rule.format})
+        properties.extend({"name": "aibom:risk", "value": tag} for tag in rule.risk_tags)
+        component["properties"] = properties
+        
+        if rule.finding:
+            vulnerabilities.append({
+                "id": f"AIBOM-{stable_id(file_name, content_id(file_info), rule.finding).hex[:8]}",
+                "source": {"name": "AIBOM Security Analysis"},
+                "ratings": [{"severity": rule.severity, "method": "other"}],
+                "description": f"{rule.finding}: {file_name}",
+                "affects": [{"ref": file_name}]
+            })
+        
+        return [component], vulnerabilities
+    
+    @staticmethod
+    def _safetensors_properties(summary: Dict[str, Any]) -> List[Dict[str, str]]:
+        """CycloneDX properties for a safetensors header summary."""
+        properties = [
+            {"name": f"aibom:safetensors:{key}", "value": str(summary[key])}
+            for key in ("parameter_count", "tensor_count")
+            if summary.get(key) is not None
+        ]
+        properties.extend(
+            {"name": f"aibom:safetensors:dtype:{dtype}", "value": str(count)}
+            for dtype, count in sorted((summary.get("parameters_by_dtype") or {}).items())
+        )
+        properties.extend(
+            {"name": f"aibom:safetensors:metadata:{key}", "value": str(value)}
+            for key, value in sorted((summary.get("metadata") or {}).items())
+        )
+        if summary.get("tensors"):
+            properties.append({
+                "name": "aibom:safetensors:tensors",
+                "value": json.dumps(summary["tensors"], separators=(',', ':'))
+            })
+        return properties
+    
+    @staticmethod
+    def _file_sha256(file_info: Dict[str, Any], model_data: Dict[str, Any]) -> Optional[str]:
+        """The LFS oid of a file, or the digest computed from a local copy."""
+        return file_info.get("sha256") or (model_data.get("file_hashes") or {}).get(file_info["name"])
+    
+    def _config_properties(self, file_name: str, small_files: Dict[str, str]) -> List[Dict[str, str]]:
+        """Extract CycloneDX properties from a prefetched configuration file."""
+        path = small_files.get(file_name)
+        if not path:
+            return []
+        
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read {file_name}: {e}")
+            return []
+        if not isinstance(data, dict):
+            return []
+        
+        base_name = file_name.rsplit("/", 1)[-1]
+        if base_name.endswith(".index.json"):
+            weight_map = data.get("weight_map") or {}
+            values = {
+                "total_size": (data.get("metadata") or {}).get("total_size"),
+                "shard_count": len(set(weight_map.values())),
+                "tensor_count": len(weight_map),
+            }
+        else:
+            values = {key: data.get(key) for key in CONFIG_PROPERTIES.get(base_name, [])}
+        
+        return [
+            {
+                "name": f"{base_name}:{key}",
+                "value": ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+            }
+            for key, value in values.items()
+            if value is not None
+        ]
     
     def _convert_to_aibom(self, aibom_data: Dict[str, Any], model_info: ModelInfo) -> AIBOM:
         """Convert OWASP generator output to our AIBOM structure."""
@@ -229,13 +524,18 @@ class AIBOMGenerator:
     
     def _create_basic_aibom(self, model_info: ModelInfo) -> AIBOM:
         """Create a basic AIBOM when generation fails."""
+        metadata: Dict[str, Any] = {}
+        timestamp = _utc_timestamp(model_info.last_modified)
+        if timestamp:
+            metadata["timestamp"] = timestamp
+        
         return AIBOM(
             bom_format="CycloneDX",
             spec_version="1.5",
-            serial_number=f"urn:uuid:{uuid.uuid4()}",
+            serial_number=f"urn:uuid:{stable_id(model_info.name, model_info.sha, 'basic')}",
             version=1,
             metadata={
-                "timestamp": "2024-01-01T00:00:00Z",
+                **metadata,
                 "component": {
                     "type": "machine-learning-model",
                     "name": model_info.name,
@@ -244,6 +544,7 @@ class AIBOMGenerator:
             },
             components=[{
                 "type": "machine-learning-model",
+                "bom-ref": model_info.name,
                 "name": model_info.name,
                 "version": "latest",
                 "description": model_info.description or "",
@@ -255,10 +556,11 @@ class AIBOMGenerator:
         )
     
     async def cleanup(self) -> None:
-        """Clean up temporary files and resources."""
+        """Clean up resources."""
         logger.info("Cleaning up AIBOM Generator service...")
         
-        # Clean up temporary directory
-        if self.temp_dir.exists():
-            import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
\ No newline at end of file
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        
+        await self.validation.cleanup()
\ No newline at end of file
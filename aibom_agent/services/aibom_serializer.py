@@ -0,0 +1,120 @@
+"""Streaming CycloneDX JSON serialization of AIBOMs."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Union
+
+from ..models.analysis_result import AIBOM
+from ..models.file_table import FileTable
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+# Top-level arrays written one element at a time
+STREAMED_SECTIONS = {"components", "dependencies", "vulnerabilities", "compositions"}
+
+# Bytes buffered before a chunk is handed to the writer
+CHUNK_SIZE = 64 * 1024
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, FileTable):
+        return obj.to_records()
+    return str(obj)
+
+
+class AIBOMSerializer:
+    """
+    Writes an AIBOM as a CycloneDX JSON document, piece by piece.
+    
+    The large arrays (components, dependencies, vulnerabilities) are encoded
+    one element at a time and flushed in chunks of about CHUNK_SIZE bytes,
+    so the encoded document never exists in memory as a whole and the first
+    bytes reach a file or socket before the last component is encoded.
+    orjson is used when installed, the standard library otherwise; both
+    produce the same bytes as dumping the document in one call (compact, or
+    indented by two spaces in pretty mode).
+    """
+    
+    def __init__(self, pretty: bool = False, use_orjson: bool = True):
+        self.pretty = pretty
+        self.backend = "orjson" if orjson is not None and use_orjson else "json"
+    
+    def iter_chunks(self, aibom: AIBOM) -> Iterator[bytes]:
+        """Yield the encoded document in chunks."""
+        newline, indent, colon = (b"\n", b"  ", b": ") if self.pretty else (b"", b"", b":")
+        buffer = bytearray(b"{")
+        
+        for position, (key, value) in enumerate(aibom.to_cyclonedx().items()):
+            if position:
+                buffer += b","
+            buffer += newline + indent + self._encode(key) + colon
+            
+            if key not in STREAMED_SECTIONS or not value:
+                buffer += self._encode(value, depth=1)
+                continue
+            
+            buffer += b"["
+            for index, item in enumerate(value):
+                if index:
+                    buffer += b","
+                buffer += newline + indent * 2 + self._encode(item, depth=2)
+                if len(buffer) >= CHUNK_SIZE:
+                    yield bytes(buffer)
+                    buffer.clear()
+            buffer += newline + indent + b"]"
+        
+        buffer += newline + b"}"
+        yield bytes(buffer)
+    
+    def write(self, aibom: AIBOM, fp: BinaryIO) -> int:
+        """Write the document to a binary file-like object; returns bytes written."""
+        written = 0
+        for chunk in self.iter_chunks(aibom):
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+    
+    def write_file(self, aibom: AIBOM, path: Union[str, Path]) -> int:
+        """Write the document to a file, replacing it atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                written = self.write(aibom, f)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return written
+    
+    async def stream(self, aibom: AIBOM, writer: Any) -> int:
+        """
+        Write the document to an asyncio StreamWriter (or anything with
+        write() and an awaitable drain()), draining after every chunk.
+        """
+        written = 0
+        for chunk in self.iter_chunks(aibom):
+            writer.write(chunk)
+            await writer.drain()
+            written += len(chunk)
+        return written
+    
+    def _encode(self, value: Any, depth: int = 0) -> bytes:
+        if self.backend == "orjson":
+            option = orjson.OPT_INDENT_2 if self.pretty else 0
+            data = orjson.dumps(value, default=_json_default, option=option)
+        elif self.pretty:
+            data = json.dumps(value, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+        else:
+            data = json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=_json_default).encode('utf-8')
+        
+        if self.pretty and depth:
+            # Nested values start at the caller's indentation
+            data = data.replace(b"\n", b"\n" + b"  " * depth)
+        return data
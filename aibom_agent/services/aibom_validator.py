@@ -0,0 +1,338 @@
+"""CycloneDX 1.5 JSON schema validation of generated AIBOMs."""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from ..config.settings import AIBOMSettings
+from ..models.analysis_result import AIBOM
+
+BOM_SCHEMA_ID = "http://cyclonedx.org/schema/bom-1.5.schema.json"
+
+# Top-level arrays validated element by element
+SECTIONS = ("components", "dependencies", "vulnerabilities", "compositions")
+
+# The smallest valid document; elements are validated wrapped in one
+MINIMAL_DOCUMENT = {"bomFormat": "CycloneDX", "specVersion": "1.5"}
+
+# Per-element results remembered across documents
+VALIDATION_MEMO_SIZE = 100_000
+
+# Errors reported per document before truncating
+MAX_REPORTED_ERRORS = 20
+
+
+class AIBOMValidationError(ValueError):
+    """A generated AIBOM does not conform to the CycloneDX schema."""
+    
+    def __init__(self, model_name: str, errors: List[str]):
+        self.errors = errors
+        super().__init__(f"AIBOM for {model_name} failed schema validation: {'; '.join(errors[:3])}")
+
+
+def _library_schema() -> Callable[[Dict[str, Any]], Iterable[Any]]:
+    """The CycloneDX 1.5 JSON schema through cyclonedx-python-lib's public validator."""
+    from cyclonedx.exception import MissingOptionalDependencyException
+    from cyclonedx.schema import SchemaVersion
+    from cyclonedx.validation.json import JsonStrictValidator
+    
+    validator = JsonStrictValidator(SchemaVersion.V1_5)
+    
+    def iter_errors(document: Dict[str, Any]) -> Iterable[Any]:
+        errors = validator.validate_str(json.dumps(document, default=str), all_errors=True)
+        # Library errors wrap the jsonschema error in .data
+        return [error.data for error in errors or ()]
+    
+    try:
+        iter_errors(MINIMAL_DOCUMENT)
+    except MissingOptionalDependencyException as e:
+        raise ImportError(str(e)) from e
+    return iter_errors
+
+
+def _directory_schema(schema_dir: str) -> Callable[[Dict[str, Any]], Iterable[Any]]:
+    """The CycloneDX 1.5 JSON schema (and its SPDX/JSF references) read from schema_dir."""
+    from jsonschema import Draft7Validator
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT7
+    
+    resources = []
+    for path in sorted(Path(schema_dir).glob("*.schema.json")):
+        with open(path, encoding="utf-8") as f:
+            schema = json.load(f)
+        if "$id" in schema:
+            resources.append((schema["$id"], Resource.from_contents(schema, default_specification=DRAFT7)))
+    
+    registry = Registry().with_resources(resources)
+    bom_schema = registry.contents(BOM_SCHEMA_ID)
+    Draft7Validator.check_schema(bom_schema)
+    validator = Draft7Validator(bom_schema, registry=registry, format_checker=Draft7Validator.FORMAT_CHECKER)
+    return validator.iter_errors
+
+
+class AIBOMValidator:
+    """
+    Validates AIBOMs against the CycloneDX 1.5 JSON schema.
+    
+    The schema comes from cyclonedx-python-lib's public JSON validator, or
+    from the schema files in `schema_dir`, and is compiled once. A document
+    is checked as a shell (metadata and scalars, with the large arrays
+    emptied) plus one check per array element, each wrapped in a minimal
+    document. Element results are memoized by content digest, so
+    components repeated across documents, such as the unchanged files of
+    successive revisions, are validated once. Callers that changed only
+    some sections can revalidate just those.
+    
+    Split this way, the schema never sees a whole array, so the rules that
+    span elements are checked separately, once per document: uniqueItems
+    on each section (by the element digests), unique bom-refs, one
+    dependency entry per ref, and dependency refs that name a bom-ref in
+    the document. The last three come from the CycloneDX specification
+    rather than the JSON schema. Arrays nested in an element, such as
+    dependsOn, are checked with the element.
+    """
+    
+    def __init__(self, schema_dir: Optional[str] = None):
+        self._iter_errors = _directory_schema(schema_dir) if schema_dir else _library_schema()
+        self._memo: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+    
+    def validate(self, aibom: AIBOM, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Validate an AIBOM.
+        
+        Args:
+            aibom: AIBOM to validate
+            sections: Only validate these top-level arrays (e.g. ["components"]),
+                skipping the rest of the document except the cross-element
+                reference checks; all of it by default
+        
+        Returns:
+            Error messages, each prefixed with the JSON pointer of the offending value
+        """
+        return self.validate_document(aibom.to_cyclonedx(), sections)
+    
+    def validate_document(self, document: Dict[str, Any], sections: Optional[Iterable[str]] = None) -> List[str]:
+        """Validate a CycloneDX document given as a dict; see validate."""
+        errors: List[str] = []
+        
+        if sections is None:
+            shell = {key: [] if key in SECTIONS else value for key, value in document.items()}
+            errors.extend(self._errors(shell))
+            sections = SECTIONS
+        
+        for section in sections:
+            items = document.get(section) or []
+            if not isinstance(items, list):
+                errors.append(f"/{section}: expected an array")
+                continue
+            
+            first_index: Dict[bytes, int] = {}
+            for index, item in enumerate(items):
+                digest, item_errors = self._item_errors(section, item)
+                errors.extend(f"/{section}/{index}{error}" for error in item_errors)
+                if digest in first_index:
+                    errors.append(f"/{section}/{index}: duplicate of /{section}/{first_index[digest]} (uniqueItems)")
+                else:
+                    first_index[digest] = index
+        
+        errors.extend(self._reference_errors(document))
+        return errors
+    
+    def _item_errors(self, section: str, item: Any) -> Tuple[bytes, Tuple[str, ...]]:
+        """Content digest of an array element and its errors, relative to the element."""
+        canonical = json.dumps(item, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.blake2b(f"{section}\0{canonical}".encode('utf-8'), digest_size=16).digest()
+        
+        cached = self._memo.get(digest)
+        if cached is None:
+            # Errors point into the wrapper ("/components/0/..."); keep the part within the element
+            wrapper_prefix = f"/{section}/0"
+            cached = tuple(
+                error[len(wrapper_prefix):] if error.startswith(wrapper_prefix) else error
+                for error in self._errors({**MINIMAL_DOCUMENT, section: [item]})
+            )
+            self._memo[digest] = cached
+            if len(self._memo) > VALIDATION_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(digest)
+        
+        return digest, cached
+    
+    @staticmethod
+    def _reference_errors(document: Dict[str, Any]) -> List[str]:
+        """bom-ref uniqueness and dependency graph references across the document."""
+        errors: List[str] = []
+        bom_refs: Dict[str, str] = {}
+        
+        def collect(element: Any, pointer: str) -> None:
+            if not isinstance(element, dict):
+                return
+            ref = element.get("bom-ref")
+            if isinstance(ref, str):
+                if ref in bom_refs:
+                    errors.append(f"{pointer}/bom-ref: {ref!r} is already used by {bom_refs[ref]}")
+                else:
+                    bom_refs[ref] = pointer
+            for key in ("components", "services"):
+                children = element.get(key)
+                if isinstance(children, list):
+                    for index, child in enumerate(children):
+                        collect(child, f"{pointer}/{key}/{index}")
+        
+        metadata = document.get("metadata")
+        if isinstance(metadata, dict):
+            collect(metadata.get("component"), "/metadata/component")
+        collect({key: document.get(key) for key in ("components", "services")}, "")
+        
+        dependencies = document.get("dependencies")
+        if not isinstance(dependencies, list):
+            return errors
+        
+        dependency_index: Dict[str, int] = {}
+        for index, dependency in enumerate(dependencies):
+            if not isinstance(dependency, dict):
+                continue
+            ref = dependency.get("ref")
+            if isinstance(ref, str):
+                if ref in dependency_index:
+                    errors.append(f"/dependencies/{index}/ref: {ref!r} already has an entry at /dependencies/{dependency_index[ref]}")
+                else:
+                    dependency_index[ref] = index
+                if ref not in bom_refs:
+                    errors.append(f"/dependencies/{index}/ref: {ref!r} does not match any bom-ref")
+            
+            # Duplicates within dependsOn are caught with the element itself
+            depends_on = dependency.get("dependsOn")
+            if isinstance(depends_on, list):
+                for position, target in enumerate(depends_on):
+                    if isinstance(target, str) and target not in bom_refs:
+                        errors.append(f"/dependencies/{index}/dependsOn/{position}: {target!r} does not match any bom-ref")
+        return errors
+    
+    def _errors(self, document: Dict[str, Any]) -> List[str]:
+        return [
+            f"{''.join(f'/{part}' for part in error.absolute_path)}: {error.message}"
+            for error in self._iter_errors(document)
+        ]
+
+
+# One validator per worker process, compiled on first use
+_worker_validator: Optional[AIBOMValidator] = None
+
+
+def _init_worker(schema_dir: Optional[str]) -> None:
+    global _worker_validator
+    _worker_validator = AIBOMValidator(schema_dir)
+
+
+def _validate_files(paths: List[str]) -> List[Tuple[str, List[str]]]:
+    """Validate a batch of CycloneDX JSON files in a worker process."""
+    results = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError) as e:
+            results.append((path, [f"unreadable: {e}"]))
+            continue
+        results.append((path, _worker_validator.validate_document(document)))
+    return results
+
+
+class AIBOMValidationService:
+    """
+    Schema validation stage for generated and published AIBOMs.
+    
+    Generated AIBOMs are validated inline with a validator compiled at
+    startup. Existing .cdx.json files are validated in bulk: batches of
+    paths go to a process pool whose workers each compile the schema once.
+    With validation_mode "warn" problems are logged and recorded on the
+    AIBOM; with "strict" an invalid AIBOM raises AIBOMValidationError.
+    """
+    
+    def __init__(self, settings: AIBOMSettings):
+        self.settings = settings
+        self.validator: Optional[AIBOMValidator] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.validator is not None
+    
+    def initialize(self) -> None:
+        """Compile the schema; in warn mode a missing validation backend only disables the stage."""
+        if self.settings.validation_mode == "off" or self.validator is not None:
+            return
+        
+        try:
+            self.validator = AIBOMValidator(self.settings.schema_dir)
+        except (ImportError, OSError, KeyError, ValueError) as e:
+            if self.settings.validation_mode == "strict":
+                raise
+            logger.warning(
+                f"CycloneDX schema validation disabled ({e}); "
+                "install cyclonedx-python-lib[json-validation] to enable it"
+            )
+            return
+        logger.info("CycloneDX 1.5 schema validator compiled")
+    
+    def check(self, aibom: AIBOM, model_name: str, sections: Optional[Iterable[str]] = None) -> AIBOM:
+        """
+        Validate a generated AIBOM and record the outcome on it.
+        
+        Raises:
+            AIBOMValidationError: In strict mode, if the AIBOM is invalid
+        """
+        if self.validator is None:
+            return aibom
+        
+        errors = self.validator.validate(aibom, sections)
+        aibom.validation_errors = errors[:MAX_REPORTED_ERRORS]
+        if errors:
+            if self.settings.validation_mode == "strict":
+                raise AIBOMValidationError(model_name, errors)
+            logger.warning(
+                f"AIBOM for {model_name} has {len(errors)} schema violations, first: {errors[0]}"
+            )
+        return aibom
+    
+    async def validate_files(self, paths: List[str]) -> Dict[str, List[str]]:
+        """
+        Validate CycloneDX JSON files in parallel batches.
+        
+        Returns:
+            Mapping of path to error messages (empty for valid files)
+        """
+        if not paths:
+            return {}
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.settings.validation_workers or os.cpu_count(),
+                initializer=_init_worker,
+                initargs=(self.settings.schema_dir,)
+            )
+        
+        batch_size = max(1, self.settings.validation_batch_size)
+        batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+        logger.info(f"Validating {len(paths)} AIBOMs in {len(batches)} batches")
+        
+        loop = asyncio.get_event_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _validate_files, batch) for batch in batches
+        ])
+        return {path: errors for batch in results for path, errors in batch}
+    
+    async def cleanup(self) -> None:
+        """Shut down the bulk validation workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
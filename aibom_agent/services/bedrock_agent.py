@@ -111,11 +111,11 @@ Model Information:
 
 AIBOM Summary:
 - Components: {len(aibom.components)}
-- Dependencies: {len(aibom.dependencies)}
+- Dependencies: {len(aibom.dependency_components())}
 - Known Vulnerabilities: {len(aibom.vulnerabilities)}
 
 AIBOM Components:
-{json.dumps(aibom.components[:10], indent=2)}  # First 10 components
+{json.dumps([self._prompt_component(c) for c in aibom.components[:10]], indent=2)}  # First 10 components
 
 Please provide a comprehensive security analysis in JSON format with:
 {{
@@ -141,6 +141,16 @@ Focus on:
 5. Security best practices violations
 """
     
+    def _prompt_component(self, component: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop per-tensor listings from a component to keep prompts small."""
+        properties = component.get("properties") or []
+        if not any(p.get("name") == "aibom:safetensors:tensors" for p in properties):
+            return component
+        return {
+            **component,
+            "properties": [p for p in properties if p.get("name") != "aibom:safetensors:tensors"]
+        }
+    
     def _create_comparison_insights_prompt(self, comparison: ModelComparison) -> str:
         """Create a prompt for comparison insights."""
         return f"""
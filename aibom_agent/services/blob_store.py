@@ -0,0 +1,108 @@
+"""Content-addressed store of repository files shared across models."""
+
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+
+def content_id(file_info: Dict[str, Any]) -> Optional[str]:
+    """Content address of a file entry: its LFS sha256, else its git blob id."""
+    if file_info.get("sha256"):
+        return f"sha256:{file_info['sha256']}"
+    if file_info.get("blob_id"):
+        return f"git:{file_info['blob_id']}"
+    return None
+
+
+class BlobStore:
+    """
+    Content-addressed file store backed by hardlinks.
+    
+    Files are addressed by their LFS sha256 when available, otherwise by
+    their git blob id. Fine-tunes frequently ship byte-identical shards,
+    tokenizers and configs; linking those into each repository's Hugging
+    Face cache from this store means every distinct blob is downloaded and
+    stored once, however many repositories reference it.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+    
+    def path_for(self, file_info: Dict[str, Any]) -> Optional[Path]:
+        """Store path for a file entry, or None if it has no content address."""
+        if file_info.get("sha256"):
+            digest, namespace = file_info["sha256"], "sha256"
+        elif file_info.get("blob_id"):
+            digest, namespace = file_info["blob_id"], "git"
+        else:
+            return None
+        return self.root / namespace / digest[:2] / digest
+    
+    def get(self, file_info: Dict[str, Any]) -> Optional[Path]:
+        """Return the stored copy of a file, if the store has one."""
+        path = self.path_for(file_info)
+        if path is not None and path.exists():
+            return path
+        return None
+    
+    def add(self, file_info: Dict[str, Any], source: Path) -> Optional[Path]:
+        """Hardlink a local file into the store."""
+        path = self.path_for(file_info)
+        if path is None or path.exists():
+            return path
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            os.link(Path(source).resolve(), tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not add {source} to blob store: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+        return path
+    
+    def seed_hf_cache(self, blobs_dir: Path, files: Iterable[Dict[str, Any]]) -> int:
+        """
+        Hardlink known blobs into a repository's Hugging Face cache.
+        
+        huggingface_hub names cached blobs by etag, which is the sha256 for
+        LFS files and the git blob id otherwise, and skips the download when
+        the blob is already present.
+        
+        Returns:
+            Number of bytes that are available locally and will not be downloaded
+        """
+        local_bytes = 0
+        for file_info in files:
+            path = self.path_for(file_info)
+            if path is None:
+                continue
+            
+            blob_path = Path(blobs_dir) / path.name
+            if not blob_path.exists():
+                if not path.exists():
+                    continue
+                try:
+                    blob_path.parent.mkdir(parents=True, exist_ok=True)
+                    os.link(path, blob_path)
+                except OSError as e:
+                    # Hardlinks cannot cross filesystems; fall back to downloading
+                    logger.debug(f"Could not link {path} into {blobs_dir}: {e}")
+                    continue
+            
+            local_bytes += file_info.get("size") or 0
+        
+        return local_bytes
+    
+    def absorb_hf_cache(self, blobs_dir: Path, files: Iterable[Dict[str, Any]]) -> None:
+        """Add freshly downloaded blobs from a repository cache to the store."""
+        for file_info in files:
+            path = self.path_for(file_info)
+            if path is None:
+                continue
+            blob_path = Path(blobs_dir) / path.name
+            if blob_path.exists():
+                self.add(file_info, blob_path)
@@ -204,6 +204,8 @@ class ComparisonEngine:
         """Compare model sizes."""
         size_comparison = {
             'sizes_by_model': {},
+            'total_bytes_by_model': {},
+            'bytes_by_format': {},
             'largest_model': '',
             'smallest_model': '',
             'average_size': 0,
@@ -218,6 +220,10 @@ class ComparisonEngine:
             sizes[result.model_name] = model_size
             size_comparison['sizes_by_model'][result.model_name] = model_size
             
+            size_breakdown = result.model_info.size_breakdown
+            size_comparison['total_bytes_by_model'][result.model_name] = size_breakdown.get('total_bytes')
+            size_comparison['bytes_by_format'][result.model_name] = size_breakdown.get('bytes_by_format', {})
+            
             if model_size:
                 valid_sizes.append(model_size)
         
@@ -240,7 +246,7 @@ class ComparisonEngine:
         all_deps = {}
         
         for result in results:
-            model_deps = result.aibom.dependencies
+            model_deps = result.aibom.dependency_components()
             dependency_analysis['dependencies_by_model'][result.model_name] = model_deps
             all_deps[result.model_name] = {dep.get('name', ''): dep for dep in model_deps}
         
@@ -0,0 +1,306 @@
+"""Inference of framework and library dependencies from repository files."""
+
+import ast
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from loguru import logger
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# "name[extras] (specifier) ; marker" in requirements files and PEP 621 lists
+REQUIREMENT_PATTERN = re.compile(
+    r"^\s*(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*\(?(?P<spec>[^;#)]*)\)?"
+)
+
+# Version keys written by libraries into the files they save
+LIBRARY_VERSION_KEYS = {
+    "config.json": {"transformers_version": "transformers"},
+    "generation_config.json": {"transformers_version": "transformers"},
+    "model_index.json": {"_diffusers_version": "diffusers"},
+    "config_sentence_transformers.json": {},
+}
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalized package name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def is_exact_version(version: str) -> bool:
+    """Whether a dependency version is a single release rather than a range or unknown."""
+    return version not in ("unknown", "*", "") and version[:1] not in "<>=!~^" and "," not in version
+
+
+def dependency_component(dependency: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    CycloneDX component for an inferred dependency entry.
+    
+    Packages become library/framework components identified by their PyPI
+    purl; remote code becomes a file component, with a Hugging Face purl
+    when it lives in another repository. Version ranges are kept as a
+    property, since a component version names a single release.
+    """
+    name = dependency["name"]
+    version = dependency["version"]
+    exact = is_exact_version(version)
+    
+    if dependency["type"] == "remote-code":
+        component = {"type": "file", "bom-ref": f"remote-code:{name}", "name": name}
+        if "/" in name:
+            component["purl"] = f"pkg:huggingface/{name.rsplit('/', 1)[0]}"
+    else:
+        purl = f"pkg:pypi/{normalize_name(name)}"
+        if exact:
+            purl += f"@{quote(version, safe='.-_~')}"
+        component = {"type": dependency["type"], "bom-ref": purl, "name": name, "purl": purl}
+    
+    if exact:
+        component["version"] = version
+    component["description"] = dependency["description"]
+    component["supplier"] = {"name": dependency["supplier"]}
+    
+    properties = [{"name": "aibom:dependency-type", "value": dependency["type"]}]
+    if not exact and version != "unknown":
+        properties.append({"name": "aibom:version-constraint", "value": version})
+    properties.extend({"name": "aibom:dependency-source", "value": source} for source in dependency["sources"])
+    for key, value in dependency.items():
+        if key in ("type", "name", "version", "description", "supplier", "sources"):
+            continue
+        value = ",".join(map(str, value)) if isinstance(value, list) else str(value)
+        properties.append({"name": f"aibom:{key}", "value": value})
+    component["properties"] = properties
+    return component
+
+
+def parse_requirement(line: str) -> Optional[Tuple[str, str]]:
+    """Split a requirement line into (name, version); None for comments, options and URLs."""
+    line = line.split("#", 1)[0].strip()
+    if not line or line.startswith("-") or "://" in line:
+        return None
+    match = REQUIREMENT_PATTERN.match(line)
+    if not match:
+        return None
+    
+    spec = match.group("spec").strip().replace(" ", "")
+    if spec.startswith("==") and "," not in spec and "*" not in spec:
+        spec = spec[2:]
+    return match.group("name"), spec or "unknown"
+
+
+class DependencyInferrer:
+    """
+    Derives versioned dependencies from the files of a model repository.
+    
+    Sources, all read from the prefetched small files rather than fetched
+    one by one: library version stamps in saved configs (config.json's
+    transformers_version, diffusers' model_index.json, sentence-transformers'
+    __version__ table), the tensor dtype (implying torch), requirements*.txt,
+    the install_requires of setup.py (read with ast, never executed),
+    pyproject.toml dependencies, and auto_map entries pointing at custom
+    code loaded with trust_remote_code. Dependencies are merged by package
+    name, keeping the most specific version and every file that mentions it.
+    
+    Repository files are untrusted input: values of unexpected types are
+    ignored, and a file that cannot be read only loses its own findings.
+    The inferrer keeps no state between calls and reads files itself, so
+    callers in async code run infer() in an executor.
+    """
+    
+    def infer(self, model_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Infer the dependencies of a model from its manifest.
+        
+        Args:
+            model_data: The "model" section of the generator manifest
+        
+        Returns:
+            Dependency entries ({"type", "name", "version", "description", "supplier", "sources"})
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        small_files: Dict[str, str] = model_data.get("small_files") or {}
+        
+        library_name = model_data.get("library_name")
+        if isinstance(library_name, str) and library_name:
+            self._add(found, "framework", library_name, "unknown", "model card library_name")
+        
+        try:
+            config = model_data.get("config") or self._read_json(small_files, "config.json")
+            if isinstance(config, dict):
+                self._from_config(found, config, "config.json")
+        except (OSError, ValueError, SyntaxError, AttributeError, TypeError) as e:
+            logger.debug(f"Could not infer dependencies from config.json: {e}")
+        
+        for file_name in sorted(small_files):
+            base_name = file_name.rsplit("/", 1)[-1]
+            try:
+                if base_name in LIBRARY_VERSION_KEYS and file_name != "config.json":
+                    self._from_saved_versions(found, base_name, self._read_json(small_files, file_name) or {}, file_name)
+                if base_name == "tokenizer_config.json":
+                    self._from_auto_map(found, (self._read_json(small_files, file_name) or {}).get("auto_map"), file_name)
+                elif base_name.startswith("requirements") and base_name.endswith(".txt"):
+                    self._from_requirements(found, self._read_text(small_files[file_name]).splitlines(), file_name)
+                elif base_name == "setup.py":
+                    self._from_setup_py(found, self._read_text(small_files[file_name]), file_name)
+                elif base_name == "pyproject.toml":
+                    self._from_pyproject(found, self._read_text(small_files[file_name]), file_name)
+            except (OSError, ValueError, SyntaxError, AttributeError, TypeError) as e:
+                logger.debug(f"Could not infer dependencies from {file_name}: {e}")
+        
+        return list(found.values())
+    
+    def _from_config(self, found: Dict[str, Dict[str, Any]], config: Dict[str, Any], source: str) -> None:
+        self._from_saved_versions(found, "config.json", config, source)
+        
+        if isinstance(config.get("torch_dtype"), str):
+            self._add(found, "framework", "torch", "unknown", source, dtype=config["torch_dtype"])
+        
+        architectures = config.get("architectures")
+        transformers = found.get(normalize_name("transformers"))
+        if isinstance(architectures, list) and transformers is not None and config.get("transformers_version"):
+            transformers["architectures"] = [str(architecture) for architecture in architectures]
+        
+        self._from_auto_map(found, config.get("auto_map"), source)
+    
+    def _from_saved_versions(
+        self,
+        found: Dict[str, Dict[str, Any]],
+        base_name: str,
+        data: Dict[str, Any],
+        source: str
+    ) -> None:
+        for key, package in LIBRARY_VERSION_KEYS.get(base_name, {}).items():
+            if isinstance(data.get(key), str) and data[key]:
+                self._add(found, "framework", package, data[key], source)
+        
+        # sentence-transformers: {"__version__": {"sentence_transformers": "2.2.2", "pytorch": "1.13.0"}}
+        versions = data.get("__version__")
+        if isinstance(versions, dict):
+            for package, version in versions.items():
+                if not (isinstance(version, str) and version):
+                    continue
+                package = "torch" if package == "pytorch" else package
+                self._add(found, "framework", package, version, source)
+    
+    def _from_auto_map(self, found: Dict[str, Dict[str, Any]], auto_map: Any, source: str) -> None:
+        """auto_map values are "module.Class" or "org/repo--module.Class", possibly in [slow, fast] lists."""
+        if not isinstance(auto_map, dict):
+            return
+        
+        references: List[str] = []
+        for value in auto_map.values():
+            references.extend(v for v in (value if isinstance(value, list) else [value]) if isinstance(v, str))
+        
+        for reference in references:
+            repo, _, target = reference.rpartition("--")
+            module = target.rsplit(".", 1)[0]
+            name = f"{repo}/{module}.py" if repo else f"{module}.py"
+            self._add(
+                found, "remote-code", name, "unknown", source,
+                description=f"Custom code loaded with trust_remote_code: {reference}",
+                supplier=repo.split("/")[0] if repo else None
+            )
+    
+    def _from_requirements(self, found: Dict[str, Dict[str, Any]], lines: Iterable[Any], source: str) -> None:
+        for line in lines:
+            requirement = parse_requirement(line) if isinstance(line, str) else None
+            if requirement:
+                self._add(found, "library", *requirement, source)
+    
+    def _from_setup_py(self, found: Dict[str, Dict[str, Any]], text: str, source: str) -> None:
+        """Read literal install_requires lists from setup() calls without running the script."""
+        for node in ast.walk(ast.parse(text)):
+            if not isinstance(node, ast.Call):
+                continue
+            for keyword in node.keywords:
+                if keyword.arg != "install_requires":
+                    continue
+                try:
+                    requirements = ast.literal_eval(keyword.value)
+                except (ValueError, TypeError, SyntaxError):
+                    continue
+                # A bare string would otherwise be read one character at a time
+                if isinstance(requirements, (list, tuple)):
+                    self._from_requirements(found, requirements, source)
+    
+    def _from_pyproject(self, found: Dict[str, Dict[str, Any]], text: str, source: str) -> None:
+        if tomllib is None:
+            logger.debug(f"Skipping {source}: no TOML parser available")
+            return
+        data = tomllib.loads(text)
+        
+        project = data.get("project")
+        if isinstance(project, dict) and isinstance(project.get("dependencies"), list):
+            self._from_requirements(found, project["dependencies"], source)
+        
+        tool = data.get("tool")
+        poetry = tool.get("poetry") if isinstance(tool, dict) else None
+        dependencies = poetry.get("dependencies") if isinstance(poetry, dict) else None
+        if not isinstance(dependencies, dict):
+            return
+        for name, spec in dependencies.items():
+            if name.lower() == "python":
+                continue
+            # "^1.2", {version = "^1.2", extras = [...]}, or a list of such tables
+            version = spec.get("version") if isinstance(spec, dict) else spec
+            self._add(found, "library", name, version if isinstance(version, str) and version else "unknown", source)
+    
+    def _add(
+        self,
+        found: Dict[str, Dict[str, Any]],
+        dependency_type: str,
+        name: str,
+        version: str,
+        source: str,
+        description: Optional[str] = None,
+        supplier: Optional[str] = None,
+        **properties: Any
+    ) -> None:
+        key = normalize_name(name)
+        existing = found.get(key)
+        if existing is None:
+            found[key] = {
+                "type": dependency_type,
+                "name": name,
+                "version": version,
+                "description": description or f"ML framework dependency: {name}",
+                "supplier": supplier or "community",
+                "sources": [source],
+                **properties
+            }
+            return
+        
+        # Prefer a concrete version over a range, and a range over nothing
+        if existing["version"] == "unknown" or (version != "unknown" and existing["version"][:1] in "<>=!~^"):
+            existing["version"] = version
+        if existing["type"] == "library" and dependency_type == "framework":
+            existing["type"] = dependency_type
+        if source not in existing["sources"]:
+            existing["sources"].append(source)
+        existing.update(properties)
+    
+    @staticmethod
+    def _read_json(small_files: Dict[str, str], file_name: str) -> Optional[Dict[str, Any]]:
+        path = small_files.get(file_name)
+        if not path:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read {file_name}: {e}")
+            return None
+        return data if isinstance(data, dict) else None
+    
+    @staticmethod
+    def _read_text(path: str) -> str:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read()
@@ -0,0 +1,149 @@
+"""Size-bounded JSON cache stored on local disk."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+
+@dataclass
+class CacheEntry:
+    """A value read back from the disk cache."""
+    value: Any
+    stored_at: float
+    
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was written."""
+        return time.time() - self.stored_at
+
+
+class DiskCache:
+    """
+    JSON key/value store with least-recently-used eviction.
+    
+    Every entry lives in its own file so several worker processes can share
+    one cache directory. File modification times double as the LRU clock:
+    reads touch the file, and eviction removes the oldest files first until
+    the directory fits in the byte budget again.
+    """
+    
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        
+        if data.get("key") != key:
+            return None
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        return CacheEntry(value=data.get("value"), stored_at=data.get("stored_at", 0.0))
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key, evicting old entries if over budget."""
+        path = self._path(key)
+        payload = json.dumps(
+            {"key": key, "stored_at": time.time(), "value": value},
+            separators=(',', ':')
+        ).encode('utf-8')
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        previous_size = self._file_size(path)
+        
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(payload) - previous_size
+            over_budget = self._total_bytes > self.max_bytes
+        
+        if over_budget:
+            self._evict()
+    
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under key, if any."""
+        self._remove(self._path(key))
+    
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.root / digest[:2] / f"{digest}.json"
+    
+    def _remove(self, path: Path) -> None:
+        size = self._file_size(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+    
+    def _file_size(self, path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+    
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.root.glob("*/*.json"))
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        with self._lock:
+            entries = []
+            for path in self.root.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            # Evict down to 90% of the budget so we do not rescan on every put
+            target = int(self.max_bytes * 0.9)
+            evicted = 0
+            
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                evicted += 1
+            
+            self._total_bytes = total
+        
+        if evicted:
+            logger.debug(f"Evicted {evicted} entries from cache {self.root}")
@@ -0,0 +1,209 @@
+"""Rule-based classification of repository files into AIBOM components."""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from fnmatch import translate
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from loguru import logger
+
+# Default rules, first match wins. Patterns are globs matched against the
+# lower-cased path; "*" also matches "/", so "*.bin" matches in any folder.
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    # Source files whose name suggests they (de)serialize pickles
+    {
+        "patterns": ["*pickle*.py"],
+        "component_type": "source-code",
+        "description": "Python source file",
+        "risk_tags": ["executable-code", "pickle"],
+        "finding": "Potentially unsafe pickle file detected",
+        "severity": "high",
+    },
+    # Path-specific rules come before the extension rules their files would
+    # otherwise hit ("*.bin" inside a Core ML package is not a pickle)
+    {"patterns": ["*.mlpackage/*"], "component_type": "model-weights", "description": "Model weights file", "format": "coreml"},
+    {
+        "patterns": ["*/variables/variables.data-*"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "tensorflow",
+    },
+    {
+        "patterns": ["*.safetensors"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "safetensors",
+    },
+    {
+        "patterns": ["*.pt", "*.pth", "*.ckpt", "*.pkl", "*.pickle", "*.joblib", "*.nemo"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "pickle",
+        "risk_tags": ["pickle"],
+    },
+    {
+        # Usually a torch pickle, but GGML and ONNX external data use .bin
+        # too; the pickle scanner (deep scan) tells them apart
+        "patterns": ["*.bin"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "pickle",
+        "risk_tags": ["pickle", "unverified-format"],
+    },
+    {"patterns": ["*.onnx", "*.ort"], "component_type": "model-weights", "description": "Model weights file", "format": "onnx"},
+    {"patterns": ["*.gguf", "*.ggml"], "component_type": "model-weights", "description": "Model weights file", "format": "gguf"},
+    {"patterns": ["*.msgpack"], "component_type": "model-weights", "description": "Model weights file", "format": "flax"},
+    {"patterns": ["*.tflite", "*.lite"], "component_type": "model-weights", "description": "Model weights file", "format": "tflite"},
+    {
+        "patterns": ["*.h5", "*.hdf5", "*.keras"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "keras",
+        # Keras models can embed Lambda layers holding serialized code
+        "risk_tags": ["embedded-code"],
+    },
+    {
+        "patterns": ["*.pb", "*.index"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "tensorflow",
+    },
+    {"patterns": ["*.mlmodel"], "component_type": "model-weights", "description": "Model weights file", "format": "coreml"},
+    {
+        "patterns": ["*.npy", "*.npz"],
+        "component_type": "model-weights",
+        "description": "Model weights file",
+        "format": "numpy",
+        # Object arrays are stored as pickles
+        "risk_tags": ["pickle"],
+    },
+    {"patterns": ["*.engine", "*.plan", "*.trt"], "component_type": "model-weights", "description": "Model weights file", "format": "tensorrt"},
+    {"patterns": ["*.ot"], "component_type": "model-weights", "description": "Model weights file", "format": "rust-bert"},
+    {
+        "patterns": ["*.model", "*.spm", "*.tiktoken", "*vocab.txt", "*merges.txt", "*.vocab"],
+        "component_type": "tokenizer",
+        "description": "Tokenizer file",
+    },
+    {"patterns": ["*.json", "*.yaml", "*.yml", "*.toml", "*.cfg", "*.ini"], "component_type": "configuration", "description": "Configuration file"},
+    {
+        "patterns": ["*.py"],
+        "component_type": "source-code",
+        "description": "Python source file",
+        "risk_tags": ["executable-code"],
+    },
+]
+
+# Patterns of the form "*.ext" are looked up by extension instead of regex
+SUFFIX_PATTERN = re.compile(r"^\*\.([^.*?\[\]/]+)$")
+
+# Literal text at the end of a glob, after its last wildcard
+LITERAL_TAIL = re.compile(r"[^*?\]]*$")
+
+
+@dataclass(frozen=True)
+class FileRule:
+    """How files matching a set of glob patterns become AIBOM components."""
+    patterns: List[str]
+    component_type: str
+    description: str
+    format: Optional[str] = None
+    risk_tags: List[str] = field(default_factory=list)
+    finding: Optional[str] = None
+    severity: str = "medium"
+
+
+class FileClassifier:
+    """
+    Matches file paths against an ordered rule table.
+    
+    Patterns are compiled once. "*.ext" patterns go into an extension
+    table; the others become regex alternatives, indexed by the extension
+    their literal tail requires ("*pickle*.py" only applies to ".py" files)
+    or kept as generic ones. For each extension the classifier then builds,
+    on first use, a plan: the rule the extension table gives, plus one
+    regex over only the alternatives that could beat it. Most files end up
+    needing a single dict lookup. When several rules match, the earliest
+    one wins.
+    """
+    
+    def __init__(self, rules: Iterable[Dict[str, Any]] = DEFAULT_RULES):
+        self.rules = [FileRule(**rule) for rule in rules]
+        self.rules_hash = hashlib.sha256(
+            json.dumps([asdict(rule) for rule in self.rules], sort_keys=True).encode()
+        ).hexdigest()
+        
+        # extension -> index of the first rule matching it
+        self._extensions: Dict[str, int] = {}
+        # (rule index, required extension or None, regex source)
+        self._alternatives: List[Tuple[int, Optional[str], str]] = []
+        for index, rule in enumerate(self.rules):
+            for pattern in rule.patterns:
+                pattern = pattern.lower()
+                suffix = SUFFIX_PATTERN.match(pattern)
+                if suffix:
+                    self._extensions.setdefault(suffix.group(1), index)
+                    continue
+                
+                tail = LITERAL_TAIL.search(pattern).group()
+                extension = tail.rsplit(".", 1)[1] if "." in tail and "/" not in tail.rsplit(".", 1)[1] else None
+                self._alternatives.append((index, extension, translate(pattern)))
+        
+        self._plans: Dict[str, Tuple[int, Optional[Pattern]]] = {}
+    
+    @classmethod
+    def from_settings(cls, rules_file: Optional[str]) -> "FileClassifier":
+        """
+        Build a classifier from the default rules plus an optional rules file.
+        
+        The file holds a JSON list of rule objects with the FileRule fields.
+        Its rules take precedence over the defaults.
+        """
+        if not rules_file:
+            return cls()
+        
+        try:
+            extra_rules = json.loads(Path(rules_file).read_text(encoding="utf-8"))
+            classifier = cls(list(extra_rules) + DEFAULT_RULES)
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Could not load classification rules from {rules_file}: {e}")
+            return cls()
+        
+        logger.info(f"Loaded {len(extra_rules)} classification rules from {rules_file}")
+        return classifier
+    
+    def classify(self, file_name: str) -> Optional[FileRule]:
+        """Return the first rule matching a file, or None."""
+        name = file_name.lower()
+        base_name = name.rsplit("/", 1)[-1]
+        extension = base_name.rsplit(".", 1)[1] if "." in base_name else ""
+        
+        plan = self._plans.get(extension)
+        if plan is None:
+            plan = self._plans[extension] = self._plan(extension)
+        best, regex = plan
+        
+        if regex is not None:
+            match = regex.match(name)
+            if match:
+                # Alternatives are in rule order, so the first match is the earliest rule
+                best = int(match.lastgroup[1:].split("_", 1)[0])
+        
+        return self.rules[best] if best < len(self.rules) else None
+    
+    def classify_all(self, file_names: Iterable[str]) -> List[Optional[FileRule]]:
+        """Classify many files at once, e.g. every name in a FileTable."""
+        classify = self.classify
+        return [classify(name) for name in file_names]
+    
+    def _plan(self, extension: str) -> Tuple[int, Optional[Pattern]]:
+        """Extension-table rule for an extension, and a regex of the alternatives that could beat it."""
+        best = self._extensions.get(extension, len(self.rules))
+        alternatives = [
+            f"(?P<r{index}_{i}>{source})"
+            for i, (index, required, source) in enumerate(self._alternatives)
+            if index < best and required in (None, extension)
+        ]
+        return best, re.compile("|".join(alternatives)) if alternatives else None
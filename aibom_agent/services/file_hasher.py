@@ -0,0 +1,84 @@
+"""Parallel SHA-256 hashing of local files."""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+# Digests remembered by (path, size, mtime) so unchanged files are not re-read
+HASH_MEMO_SIZE = 100_000
+
+
+class FileHasher:
+    """
+    Computes SHA-256 digests of local files in parallel.
+    
+    hashlib releases the GIL while digesting, so a thread pool hashes
+    several files at disk speed without the cost of worker processes.
+    Results are memoized by (real path, size, mtime), which makes repeated
+    analyses of the same directory or cached small files free.
+    """
+    
+    def __init__(self, workers: int = 0, chunk_size: int = 1024 * 1024):
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.chunk_size = chunk_size
+        self._memo: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def hash_files(self, paths: Dict[str, str]) -> Dict[str, str]:
+        """
+        Hash files concurrently.
+        
+        Args:
+            paths: Mapping of repository file names to local paths
+        
+        Returns:
+            Mapping of file names to hex SHA-256 digests; unreadable files are left out
+        """
+        if not paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(paths))) as executor:
+            digests = dict(zip(paths, executor.map(self.hash_file, paths.values())))
+        return {name: digest for name, digest in digests.items() if digest is not None}
+    
+    def hash_file(self, path: str) -> Optional[str]:
+        """SHA-256 of one file, or None if it cannot be read."""
+        try:
+            real_path = os.path.realpath(path)
+            stat = os.stat(real_path)
+        except OSError as e:
+            logger.debug(f"Cannot hash {path}: {e}")
+            return None
+        
+        key = (real_path, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._memo.get(key)
+            if digest is not None:
+                self._memo.move_to_end(key)
+                return digest
+        
+        sha256 = hashlib.sha256()
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        try:
+            with open(real_path, 'rb', buffering=0) as f:
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    sha256.update(view[:read])
+        except OSError as e:
+            logger.debug(f"Cannot hash {path}: {e}")
+            return None
+        
+        digest = sha256.hexdigest()
+        with self._lock:
+            self._memo[key] = digest
+            if len(self._memo) > HASH_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return digest
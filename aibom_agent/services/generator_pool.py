@@ -0,0 +1,299 @@
+"""Pool of long-lived AIBOM generator worker processes."""
+
+import asyncio
+import itertools
+import json
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from ..config.settings import AIBOMSettings
+
+
+class GeneratorWorkerError(RuntimeError):
+    """A generator worker failed, exited or returned an error."""
+
+
+class GeneratorWorker:
+    """
+    One generator process speaking line-delimited JSON.
+    
+    Requests are written to stdin as {"id", "method", ...} objects, one per
+    line; the process answers on stdout with {"id", "result"} or
+    {"id", "error"} lines, in any order. A reader thread matches responses
+    to pending requests, so several requests can be in flight at once.
+    Anything the process writes to stderr is logged.
+    """
+    
+    def __init__(self, index: int, command: List[str], cwd: Optional[str]):
+        self.index = index
+        self.command = command
+        self.cwd = cwd
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.completed = 0
+        self.last_response = 0.0
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+    
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+    
+    def start(self) -> None:
+        """Start (or restart) the worker process."""
+        with self._lock:
+            self._start_locked()
+    
+    def _start_locked(self) -> None:
+        if self.process is not None:
+            self.restarts += 1
+            self._stop_locked()
+        
+        self.process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1
+        )
+        self.last_response = time.monotonic()
+        
+        for target, name in ((self._read_stdout, "stdout"), (self._read_stderr, "stderr")):
+            threading.Thread(
+                target=target,
+                args=(self.process,),
+                name=f"aibom-generator-{self.index}-{name}",
+                daemon=True
+            ).start()
+        
+        logger.debug(f"Generator worker {self.index} started (pid {self.process.pid})")
+    
+    def submit(self, method: str, payload: Dict[str, Any], default: Optional[Callable] = None) -> Future:
+        """
+        Send a request to the worker, restarting it first if it has exited.
+        
+        Returns:
+            Future resolved with the "result" of the response
+        """
+        future: Future = Future()
+        with self._lock:
+            if not self.alive:
+                if self.process is not None:
+                    logger.warning(f"Generator worker {self.index} exited, restarting")
+                self._start_locked()
+            
+            request_id = next(self._ids)
+            line = json.dumps({"id": request_id, "method": method, **payload}, default=default)
+            self._pending[request_id] = future
+            try:
+                self.process.stdin.write(line + "\n")
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._pending.pop(request_id, None)
+                future.set_exception(GeneratorWorkerError(f"Generator worker {self.index} is not accepting input: {e}"))
+        return future
+    
+    def stop(self) -> None:
+        """Terminate the worker, failing any pending requests."""
+        with self._lock:
+            self._stop_locked()
+    
+    def _stop_locked(self) -> None:
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._fail_pending(GeneratorWorkerError(f"Generator worker {self.index} was stopped"))
+    
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    def _read_stdout(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                self._handle_response(line)
+            except Exception as e:
+                # The reader must outlive any one response, or later requests hang
+                logger.error(f"Generator worker {self.index}: could not handle response: {e!r}")
+        
+        # EOF: the process exited or closed stdout
+        with self._lock:
+            if self.process is process:
+                returncode = process.wait()
+                logger.warning(f"Generator worker {self.index} exited with code {returncode}")
+                self._fail_pending(GeneratorWorkerError(
+                    f"Generator worker {self.index} exited with code {returncode}"
+                ))
+    
+    def _handle_response(self, line: str) -> None:
+        """Resolve the pending request answered by one line of output."""
+        try:
+            response = json.loads(line)
+            with self._lock:
+                future = self._pending.pop(response["id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Generator worker {self.index}: unexpected output: {line[:200]}")
+            return
+        
+        self.last_response = time.monotonic()
+        self.completed += 1
+        if future.done():
+            # The caller was cancelled or gave up waiting
+            return
+        try:
+            if "error" in response:
+                future.set_exception(GeneratorWorkerError(str(response["error"])))
+            else:
+                future.set_result(response.get("result"))
+        except InvalidStateError:
+            # Cancelled between the check and now
+            pass
+    
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            if line.strip():
+                logger.debug(f"Generator worker {self.index}: {line.rstrip()}")
+
+
+class GeneratorPool:
+    """
+    Long-lived pool of OWASP AIBOM generator processes.
+    
+    Starting the generator (interpreter, tool imports) costs far more than
+    generating one AIBOM, so the processes are started once and reused for
+    every model. Requests go to the worker with the fewest in flight. A
+    worker that exits is restarted on its next request; one that misses a
+    timeout or fails a periodic ping is restarted straight away.
+    
+    The pool is thread-based and not tied to an event loop, so it can be
+    shared by successive asyncio.run calls.
+    """
+    
+    def __init__(self, settings: AIBOMSettings, json_default: Optional[Callable] = None):
+        self.settings = settings
+        self.json_default = json_default
+        
+        generator_path = Path(settings.owasp_generator_path)
+        cwd = str(generator_path) if generator_path.is_dir() else None
+        command = shlex.split(settings.generator_command or "")
+        
+        self.workers = [GeneratorWorker(i, command, cwd) for i in range(max(1, settings.generator_pool_size))]
+        self._stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self.failed_health_checks = 0
+    
+    def start(self) -> None:
+        """Start every worker and the health check thread."""
+        for worker in self.workers:
+            worker.start()
+        logger.info(f"Started {len(self.workers)} AIBOM generator workers: {self.settings.generator_command}")
+        
+        if self.settings.generator_health_interval > 0:
+            self._stop.clear()
+            self._health_thread = threading.Thread(
+                target=self._health_loop,
+                name="aibom-generator-health",
+                daemon=True
+            )
+            self._health_thread.start()
+    
+    async def generate(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate an AIBOM from a manifest on one of the workers.
+        
+        Raises:
+            GeneratorWorkerError: If the worker fails, exits or times out
+        """
+        worker = min(self.workers, key=lambda w: w.pending)
+        future = worker.submit("generate", {"manifest": manifest}, default=self.json_default)
+        
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.settings.generator_timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Generator worker {worker.index} did not answer within "
+                f"{self.settings.generator_timeout:.0f}s, restarting it"
+            )
+            worker.start()
+            raise GeneratorWorkerError(f"Generator timed out after {self.settings.generator_timeout:.0f}s")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Worker state for status reports."""
+        return {
+            "workers": [
+                {
+                    "index": worker.index,
+                    "alive": worker.alive,
+                    "pid": worker.process.pid if worker.process else None,
+                    "pending": worker.pending,
+                    "completed": worker.completed,
+                    "restarts": worker.restarts,
+                }
+                for worker in self.workers
+            ],
+            "failed_health_checks": self.failed_health_checks,
+        }
+    
+    def close(self) -> None:
+        """Stop the health check thread and every worker."""
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=5)
+            self._health_thread = None
+        for worker in self.workers:
+            worker.stop()
+    
+    def _health_loop(self) -> None:
+        interval = self.settings.generator_health_interval
+        while not self._stop.wait(interval):
+            for worker in self.workers:
+                if self._stop.is_set():
+                    return
+                self._check_worker(worker)
+    
+    def _check_worker(self, worker: GeneratorWorker) -> None:
+        """Ping an idle worker and restart it if it is dead or unresponsive."""
+        if worker.pending:
+            # Busy workers prove themselves by answering requests
+            return
+        
+        try:
+            if not worker.alive:
+                raise GeneratorWorkerError("process is not running")
+            worker.submit("ping", {}).result(timeout=self.settings.generator_health_timeout)
+        except Exception as e:
+            self.failed_health_checks += 1
+            logger.warning(f"Generator worker {worker.index} failed its health check ({e}), restarting")
+            try:
+                worker.start()
+            except OSError as start_error:
+                logger.error(f"Could not restart generator worker {worker.index}: {start_error}")
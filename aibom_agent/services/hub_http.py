@@ -0,0 +1,122 @@
+"""Shared, connection-pooled HTTP session for Hugging Face Hub calls."""
+
+import threading
+from functools import partial
+from typing import Any, Callable, Optional
+
+import huggingface_hub
+from loguru import logger
+
+from ..config.settings import HuggingFaceSettings
+
+
+def configure_hub_session(settings: HuggingFaceSettings) -> None:
+    """
+    Route every huggingface_hub request through one pooled session.
+    
+    huggingface_hub keeps its HTTP backend in process-wide state, so this
+    affects all Hub calls made by the process, including HfApi methods and
+    file downloads. Older releases use requests, newer ones use httpx; both
+    are supported. HTTP/2 and keep-alive expiry are only available with the
+    httpx backend.
+    """
+    if hasattr(huggingface_hub, "set_client_factory"):
+        # huggingface_hub caches the client itself and calls the factory
+        # again after close_session() (e.g. when retrying a ConnectError),
+        # so each call must build a fresh client
+        huggingface_hub.set_client_factory(partial(_build_httpx_client, settings))
+    else:
+        if settings.http2:
+            logger.warning(
+                "HTTP/2 requires a huggingface_hub release with the httpx backend; "
+                "continuing with HTTP/1.1"
+            )
+        huggingface_hub.configure_http_backend(
+            backend_factory=_shared(lambda: _build_requests_session(settings))
+        )
+    
+    logger.info(
+        f"Hub HTTP session configured (pool size {settings.http_pool_size}, "
+        f"keep-alive {'on' if settings.http_keep_alive else 'off'})"
+    )
+
+
+def _shared(factory: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Wrap a factory so every caller gets the same instance.
+    
+    huggingface_hub releases using requests ask for one session per thread; handing all worker
+    threads the same pooled session lets them reuse each other's TLS
+    connections instead of each paying for its own handshakes.
+    """
+    lock = threading.Lock()
+    instance: Optional[Any] = None
+    
+    def get() -> Any:
+        nonlocal instance
+        with lock:
+            if instance is None:
+                instance = factory()
+            return instance
+    
+    return get
+
+
+def _build_requests_session(settings: HuggingFaceSettings) -> Any:
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    class TimeoutHTTPAdapter(HTTPAdapter):
+        """HTTPAdapter that applies default timeouts to every request."""
+        
+        def send(self, request: Any, timeout: Any = None, **kwargs: Any) -> Any:
+            if timeout is None:
+                timeout = (settings.http_connect_timeout, settings.http_read_timeout)
+            return super().send(request, timeout=timeout, **kwargs)
+    
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=settings.http_pool_size,
+        pool_maxsize=settings.http_pool_size,
+        pool_block=False
+    )
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not settings.http_keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def _build_httpx_client(settings: HuggingFaceSettings) -> Any:
+    """
+    Build a client like huggingface_hub's default one, with tuned pooling.
+    
+    hf's request event hook (offline mode, request ids, download flags)
+    is kept, and its per-request timeouts still override the client's
+    default timeouts, which bound calls that set none.
+    """
+    from huggingface_hub.utils import _http as hf_http
+    
+    # huggingface_hub 2.x ships its httpx fork as httpx2
+    httpx = getattr(hf_http, "httpx2", None) or hf_http.httpx
+    hook = getattr(hf_http, "hf_request_event_hook", None)
+    
+    limits = httpx.Limits(
+        max_connections=settings.http_pool_size,
+        max_keepalive_connections=settings.http_pool_size if settings.http_keep_alive else 0,
+        keepalive_expiry=settings.http_keepalive_expiry
+    )
+    options = {
+        "event_hooks": {"request": [hook] if hook else []},
+        "follow_redirects": True,
+        "timeout": httpx.Timeout(settings.http_read_timeout, connect=settings.http_connect_timeout),
+        "limits": limits,
+    }
+    
+    try:
+        return httpx.Client(http2=settings.http2, **options)
+    except ImportError:
+        # http2=True needs the optional 'h2' package
+        logger.warning("HTTP/2 support is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+        return httpx.Client(**options)
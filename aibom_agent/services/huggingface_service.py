@@ -1,117 +1,744 @@
 """Hugging Face integration service."""
 
 import asyncio
-from typing import Optional
+import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from huggingface_hub import HfApi, model_info, list_repo_files
+from huggingface_hub import HfApi, hf_hub_download, snapshot_download
+from huggingface_hub.file_download import repo_folder_name
+from huggingface_hub.utils import (
+    GatedRepoError,
+    HfHubHTTPError,
+    RepositoryNotFoundError,
+    get_token,
+)
 from loguru import logger
 
 from ..config.settings import HuggingFaceSettings
-from ..models.analysis_result import ModelInfo
+from ..models.analysis_result import ModelInfo, ModelListing, ModelRevision
+from ..models.file_table import FileTable
+from .blob_store import BlobStore, content_id
+from .file_hasher import FileHasher
+from .hub_http import configure_hub_session
+from .metadata_cache import ModelMetadataCache, is_commit_sha
+from .model_source import ModelSource
+from .rate_limiter import HubRateLimiter
+from .size_calculator import ModelSizeCalculator
 
+# Authentication states reported by HuggingFaceService.auth_status
+AUTH_UNKNOWN = "unknown"
+AUTH_ANONYMOUS = "anonymous"
+AUTH_AUTHENTICATED = "authenticated"
+AUTH_FAILED = "failed"
 
-class HuggingFaceService:
+# Safetensors header summaries kept in memory, keyed by file content
+SAFETENSORS_MEMO_SIZE = 1024
+
+# Model listing fields requested while crawling, and models pulled per
+# executor hop (the Hub's listing page size)
+LISTING_FIELDS = ["author", "pipeline_tag", "library_name", "tags", "downloads", "likes", "lastModified", "sha"]
+LISTING_BATCH_SIZE = 1000
+
+
+class HuggingFaceService(ModelSource):
     """Service for interacting with Hugging Face Hub."""
     
     def __init__(self, settings: HuggingFaceSettings):
         self.settings = settings
+        self.max_concurrency = settings.max_workers
         self.api: Optional[HfApi] = None
+        self.metadata_cache: Optional[ModelMetadataCache] = None
+        self.size_calculator = ModelSizeCalculator()
+        self.blob_store = BlobStore(Path(settings.cache_dir) / "blob-store")
+        self.file_hasher = FileHasher(settings.hash_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[Tuple[str, Optional[str]], "asyncio.Future[ModelInfo]"] = {}
+        self._small_file_inflight: Dict[str, "asyncio.Future[Optional[Path]]"] = {}
+        self._auth_probe: Optional["asyncio.Future[str]"] = None
+        self.rate_limiter: Optional[HubRateLimiter] = None
+        self._safetensors_memo: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Resolved lazily by check_auth and kept for the life of the service
+        self.auth_status = AUTH_UNKNOWN
+        self.auth_user: Optional[str] = None
+        
+        if settings.rate_limit_enabled:
+            self.rate_limiter = HubRateLimiter(settings, authenticated=bool(settings.token or get_token()))
+        
+        if settings.metadata_cache_enabled:
+            self.metadata_cache = ModelMetadataCache(
+                settings.cache_dir,
+                ttl=settings.metadata_cache_ttl,
+                max_bytes=settings.metadata_cache_max_bytes
+            )
     
     async def initialize(self) -> None:
         """Initialize the Hugging Face API client."""
         logger.info("Initializing Hugging Face service...")
         
+        configure_hub_session(self.settings)
         self.api = HfApi(token=self.settings.token)
         
-        # Test connection
+        # Public models need no token, so authentication is only verified
+        # when a gated or private repository is refused (see check_auth)
+        if self.auth_status == AUTH_UNKNOWN and not (self.settings.token or get_token()):
+            self._set_auth_status(AUTH_ANONYMOUS)
+        
+        logger.info("Hugging Face service initialized successfully")
+    
+    async def check_auth(self) -> str:
+        """
+        Verify the configured token with the Hub, once per service lifetime.
+        
+        Concurrent callers share one probe. Transient failures leave the
+        status unknown so that a later call can retry.
+        
+        Returns:
+            One of "anonymous", "authenticated", "failed" or "unknown"
+        """
+        if self.auth_status != AUTH_UNKNOWN:
+            return self.auth_status
+        
+        loop = asyncio.get_event_loop()
+        if self._auth_probe is None or self._auth_probe.get_loop() is not loop or self._auth_probe.done():
+            self._auth_probe = asyncio.ensure_future(self._probe_auth())
+        return await asyncio.shield(self._auth_probe)
+    
+    async def _probe_auth(self) -> str:
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.api.whoami
-            )
-            logger.info("Hugging Face service initialized successfully")
+            user = await self._call_hub(self.api.whoami)
+        except HfHubHTTPError as e:
+            status_code = getattr(e.response, 'status_code', None)
+            if status_code != 401:
+                logger.warning(f"Hugging Face authentication check failed: {e}")
+                return self.auth_status
+            logger.warning("Hugging Face token was rejected, continuing without authentication")
+            self._set_auth_status(AUTH_FAILED)
         except Exception as e:
-            logger.warning(f"Hugging Face authentication failed: {e}")
-            # Continue without authentication for public models
+            logger.warning(f"Hugging Face authentication check failed: {e}")
+            return self.auth_status
+        else:
+            self.auth_user = user.get("name")
+            self._set_auth_status(AUTH_AUTHENTICATED)
+            logger.info(f"Authenticated to Hugging Face as {self.auth_user}")
+        return self.auth_status
+    
+    def _set_auth_status(self, status: str) -> None:
+        self.auth_status = status
+        if self.rate_limiter is not None:
+            self.rate_limiter.set_authenticated(status == AUTH_AUTHENTICATED)
+    
+    async def _explain_access_error(self, model_name: str, error: Exception) -> None:
+        """Log why a gated or private repository was refused."""
+        status = await self.check_auth()
+        
+        if status == AUTH_ANONYMOUS:
+            reason = "no Hugging Face token is configured (set HF_TOKEN)"
+        elif status == AUTH_FAILED:
+            reason = "the configured Hugging Face token was rejected"
+        elif status == AUTH_AUTHENTICATED:
+            reason = f"user {self.auth_user} has not been granted access"
+        else:
+            reason = "the Hugging Face token could not be verified"
+        
+        kind = "gated" if isinstance(error, GatedRepoError) else "private or missing"
+        logger.warning(f"Access to {kind} model {model_name} was refused: {reason}")
+    
+    def status(self) -> Dict[str, Any]:
+        """Describe the source and its authentication state."""
+        return {
+            **super().status(),
+            "auth_status": self.auth_status,
+            "auth_user": self.auth_user,
+            "rate_limit": self.rate_limiter.stats() if self.rate_limiter is not None else None
+        }
     
-    async def get_model_info(self, model_name: str) -> ModelInfo:
+    async def get_model_info(self, model_name: str, revision: Optional[str] = None) -> ModelInfo:
         """
         Fetch comprehensive information about a Hugging Face model.
         
         Args:
             model_name: Name of the model (e.g., 'microsoft/DialoGPT-medium')
+            revision: Branch, tag or commit sha (defaults to the main branch)
             
         Returns:
             ModelInfo object with model details
         """
+        # Concurrent requests for the same repo and revision share one fetch
+        key = (model_name, revision)
+        if key in self._inflight:
+            logger.debug(f"Joining in-flight request for {model_name}")
+        return await self._single_flight(
+            self._inflight, key, lambda: self._load_model_info(model_name, revision)
+        )
+    
+    async def _single_flight(
+        self,
+        registry: Dict[Any, "asyncio.Future[Any]"],
+        key: Any,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run `factory` once for all concurrent callers using the same key."""
+        loop = asyncio.get_event_loop()
+        inflight = registry.get(key)
+        
+        if inflight is not None and inflight.get_loop() is loop:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.ensure_future(factory())
+        registry[key] = future
+        future.add_done_callback(lambda _: self._release_inflight(registry, key, future))
+        return await asyncio.shield(future)
+    
+    def _release_inflight(
+        self,
+        registry: Dict[Any, "asyncio.Future[Any]"],
+        key: Any,
+        future: "asyncio.Future[Any]"
+    ) -> None:
+        if registry.get(key) is future:
+            del registry[key]
+    
+    async def _load_model_info(self, model_name: str, revision: Optional[str]) -> ModelInfo:
+        """Load model information from the metadata cache or the Hub."""
         logger.info(f"Fetching model info for: {model_name}")
         
         try:
-            # Get model information
-            info = await asyncio.get_event_loop().run_in_executor(
-                None, model_info, model_name
-            )
+            if self.metadata_cache is not None:
+                cached = await self._get_cached_model_info(model_name, revision)
+                if cached is not None:
+                    logger.info(f"Using cached model info for {model_name}@{cached.sha}")
+                    if self.settings.small_file_prefetch:
+                        # Cached paths may have been cleaned up; refill from the blob store
+                        await self.prefetch_small_files([cached])
+                    return cached
             
-            # Get file list
-            files = await asyncio.get_event_loop().run_in_executor(
-                None, list_repo_files, model_name
-            )
+            model_info_obj = await self._fetch_model_info(model_name, revision)
             
-            # Convert to our ModelInfo structure
-            model_info_obj = ModelInfo(
-                name=model_name,
-                author=info.author or "unknown",
-                description=getattr(info, 'description', None),
-                tags=info.tags or [],
-                pipeline_tag=getattr(info, 'pipeline_tag', None),
-                library_name=getattr(info, 'library_name', None),
-                license=getattr(info, 'license', None),
-                downloads=getattr(info, 'downloads', 0),
-                likes=getattr(info, 'likes', 0),
-                created_at=str(getattr(info, 'created_at', '')),
-                last_modified=str(getattr(info, 'last_modified', '')),
-                model_size=self._estimate_model_size(files),
-                config=getattr(info, 'config', {}) or {},
-                files=[{"name": f, "size": None} for f in files]
-            )
+            if self.settings.inspect_safetensors or self.settings.small_file_prefetch:
+                await asyncio.gather(
+                    self._inspect_safetensors(model_info_obj),
+                    self.prefetch_small_files([model_info_obj])
+                )
+            
+            if self.metadata_cache is not None and not model_info_obj.incomplete:
+                self.metadata_cache.put(model_info_obj, revision)
             
             logger.info(f"Successfully fetched info for {model_name}")
             return model_info_obj
             
+        except (GatedRepoError, RepositoryNotFoundError) as e:
+            await self._explain_access_error(model_name, e)
+            logger.error(f"Failed to fetch model info for {model_name}: {e}")
+            raise
         except Exception as e:
             logger.error(f"Failed to fetch model info for {model_name}: {e}")
             raise
     
-    def _estimate_model_size(self, files: list) -> Optional[int]:
-        """Estimate model size based on file list."""
-        # This is a simplified estimation
-        # In practice, you'd want to get actual file sizes
-        model_files = [f for f in files if f.endswith(('.bin', '.safetensors', '.h5'))]
-        if model_files:
-            # Rough estimation based on number of model files
-            return len(model_files) * 500_000_000  # 500MB per file estimate
-        return None
+    async def _fetch_model_info(self, model_name: str, revision: Optional[str]) -> ModelInfo:
+        """Fetch model metadata, including per-file sizes, in a single Hub request."""
+        info = await self._call_hub(
+            self.api.model_info, model_name, revision=revision, files_metadata=True
+        )
+        
+        files = FileTable(self._sibling_to_file(sibling) for sibling in info.siblings or [])
+        size_breakdown = self.size_calculator.calculate(files)
+        
+        # Convert to our ModelInfo structure
+        return ModelInfo(
+            name=model_name,
+            author=info.author or "unknown",
+            description=getattr(info, 'description', None),
+            tags=info.tags or [],
+            pipeline_tag=getattr(info, 'pipeline_tag', None),
+            library_name=getattr(info, 'library_name', None),
+            license=getattr(info, 'license', None),
+            downloads=getattr(info, 'downloads', 0),
+            likes=getattr(info, 'likes', 0),
+            created_at=str(getattr(info, 'created_at', '')),
+            last_modified=str(getattr(info, 'last_modified', '')),
+            model_size=size_breakdown["weights_bytes"] or None,
+            config=getattr(info, 'config', {}) or {},
+            files=files,
+            sha=getattr(info, 'sha', None),
+            size_breakdown=size_breakdown
+        )
+    
+    def _sibling_to_file(self, sibling: Any) -> Dict[str, Any]:
+        """Convert a Hub repo sibling into our file entry."""
+        lfs = getattr(sibling, 'lfs', None)
+        sha256 = None
+        if lfs:
+            # Older huggingface_hub versions return LFS info as a plain dict
+            sha256 = lfs.get('sha256') if isinstance(lfs, dict) else getattr(lfs, 'sha256', None)
+        
+        return {
+            "name": sibling.rfilename,
+            "size": getattr(sibling, 'size', None),
+            "blob_id": getattr(sibling, 'blob_id', None),
+            "sha256": sha256
+        }
     
-    async def download_model_files(self, model_name: str, file_patterns: list[str]) -> dict:
+    async def _get_cached_model_info(
+        self,
+        model_name: str,
+        revision: Optional[str]
+    ) -> Optional[ModelInfo]:
+        """
+        Look up model metadata in the disk cache.
+        
+        Commit shas are immutable and served straight from the cache. Branches
+        and tags are trusted for `metadata_cache_ttl` seconds; after that a
+        lightweight sha/lastModified request decides whether the cached copy
+        is still current.
+        """
+        if is_commit_sha(revision):
+            return self.metadata_cache.get(model_name, revision)
+        
+        ref = self.metadata_cache.resolve(model_name, revision)
+        if ref is None:
+            return None
+        
+        cached = self.metadata_cache.get(model_name, ref.value["sha"])
+        if cached is None:
+            return None
+        
+        if self.metadata_cache.is_fresh(ref):
+            return cached
+        
+        # Revalidate: only fetch the fields that tell us whether the repo moved,
+        # plus the counters that change without a new commit
+        latest = await self._call_hub(
+            self.api.model_info,
+            model_name,
+            revision=revision,
+            expand=["sha", "lastModified", "downloads", "likes"]
+        )
+        
+        if getattr(latest, 'sha', None) != cached.sha:
+            logger.info(f"Cached metadata for {model_name} is stale, refetching")
+            return None
+        
+        cached.downloads = getattr(latest, 'downloads', None) or cached.downloads
+        cached.likes = getattr(latest, 'likes', None) or cached.likes
+        self.metadata_cache.put(cached, revision)
+        return cached
+    
+    async def list_revisions(self, model_name: str) -> List[ModelRevision]:
+        """List the commits of a model repository, oldest first."""
+        commits = await self._call_hub(self.api.list_repo_commits, model_name, repo_type="model")
+        return [
+            ModelRevision(
+                sha=commit.commit_id,
+                committed_at=str(getattr(commit, 'created_at', '')),
+                title=getattr(commit, 'title', '') or ""
+            )
+            for commit in reversed(commits)
+        ]
+    
+    async def iter_models(
+        self,
+        author: Optional[str] = None,
+        pipeline_tag: Optional[str] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        min_downloads: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[ModelListing]:
+        """
+        Stream the Hub models that match a set of filters.
+        
+        Listing pages are fetched lazily as the caller consumes them, so a
+        slow consumer holds at most one page in memory. With
+        `min_downloads` the listing is sorted by downloads and stops at the
+        first model below the threshold.
+        
+        Args:
+            author: Only models owned by this user or organization
+            pipeline_tag: Only models with this task (e.g. 'text-generation')
+            search: Substring to match against model names
+            tags: Only models carrying all of these tags
+            min_downloads: Only models with at least this many downloads
+            limit: Maximum number of models to yield
+            
+        Returns:
+            Async iterator of ModelListing objects
+        """
+        kwargs: Dict[str, Any] = {
+            "author": author,
+            "pipeline_tag": pipeline_tag,
+            "search": search,
+            "filter": tags or None,
+            "limit": limit,
+            "expand": LISTING_FIELDS
+        }
+        if min_downloads:
+            # The Hub sorts in descending order; huggingface_hub >= 1.0 no
+            # longer accepts a `direction` argument
+            kwargs["sort"] = "downloads"
+        
+        filters = {k: v for k, v in kwargs.items() if v and k != "expand"}
+        logger.info(f"Crawling Hub models with filters: {filters}")
+        listing = self.api.list_models(**kwargs)
+        
+        while True:
+            # Pages are requested inside next(); a throttled page cannot be
+            # retried without restarting the listing, so only pace them
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            batch = await self._run_blocking(self._next_batch, listing, LISTING_BATCH_SIZE)
+            
+            for model in batch:
+                item = self._to_listing(model)
+                if min_downloads and (item.downloads or 0) < min_downloads:
+                    return
+                yield item
+            
+            if len(batch) < LISTING_BATCH_SIZE:
+                return
+    
+    @staticmethod
+    def _next_batch(iterator: Iterator[Any], size: int) -> List[Any]:
+        batch = []
+        for item in iterator:
+            batch.append(item)
+            if len(batch) == size:
+                break
+        return batch
+    
+    def _to_listing(self, model: Any) -> ModelListing:
+        last_modified = getattr(model, 'last_modified', None)
+        return ModelListing(
+            name=model.id,
+            author=getattr(model, 'author', None),
+            pipeline_tag=getattr(model, 'pipeline_tag', None),
+            library_name=getattr(model, 'library_name', None),
+            tags=getattr(model, 'tags', None) or [],
+            downloads=getattr(model, 'downloads', None),
+            likes=getattr(model, 'likes', None),
+            last_modified=str(last_modified) if last_modified else None,
+            sha=getattr(model, 'sha', None)
+        )
+    
+    async def _inspect_safetensors(self, model_info: ModelInfo) -> None:
+        if self.settings.inspect_safetensors:
+            model_info.safetensors = await self.get_safetensors_headers(model_info)
+    
+    async def prefetch_small_files(self, model_infos: Iterable[ModelInfo]) -> None:
+        """
+        Fetch the small text files of a batch of models concurrently.
+        
+        Files matching `small_file_patterns` and no larger than
+        `small_file_max_bytes` (configs, model cards, shard indexes) are
+        stored in the shared blob store. Files are deduplicated by blob oid,
+        both against the store and against downloads already in flight for
+        other models. Local paths are recorded in `ModelInfo.small_files`,
+        and config.json is merged into `ModelInfo.config`. The fetched copies
+        are hashed into `ModelInfo.file_hashes`, giving SHA-256s for the
+        non-LFS files the Hub only identifies by git blob id.
+        
+        Args:
+            model_infos: Models whose small files should be fetched
+        """
+        if not self.settings.small_file_prefetch:
+            return
+        await asyncio.gather(*[self._prefetch_model_small_files(info) for info in model_infos])
+    
+    async def _prefetch_model_small_files(self, model_info: ModelInfo) -> None:
+        candidates = [
+            f for f in model_info.files.matching(self.settings.small_file_patterns)
+            if f.get("size") is not None and f["size"] <= self.settings.small_file_max_bytes
+        ]
+        missing = [
+            f for f in candidates
+            if not Path(model_info.small_files.get(f["name"], "")).is_file()
+        ]
+        if missing:
+            paths = await asyncio.gather(*[self._fetch_small_file(model_info, f) for f in missing])
+            for file_info, path in zip(missing, paths):
+                if path is not None:
+                    model_info.small_files[file_info["name"]] = str(path)
+                else:
+                    model_info.incomplete.append(f"small_file:{file_info['name']}")
+            
+            if "config.json" in model_info.small_files:
+                config = await self._run_blocking(self._read_json, model_info.small_files["config.json"])
+                if isinstance(config, dict):
+                    # The Hub only returns a subset of config.json; the file is authoritative
+                    model_info.config = {**model_info.config, **config}
+        
+        await self._hash_small_files(model_info)
+    
+    async def _hash_small_files(self, model_info: ModelInfo) -> None:
+        """
+        Hash the prefetched copies of files not yet in `file_hashes`.
+        
+        Git blob ids are SHA-1s of a "blob <size>" header plus the content,
+        not file digests, so non-LFS files get their SHA-256 from the local
+        copy. Larger non-LFS files are not downloaded just to be hashed.
+        """
+        if not self.settings.hash_local_files:
+            return
+        
+        paths = {
+            name: path for name, path in model_info.small_files.items()
+            if name not in model_info.file_hashes
+        }
+        if paths:
+            model_info.file_hashes.update(await self._run_blocking(self.file_hasher.hash_files, paths))
+    
+    async def _fetch_small_file(self, model_info: ModelInfo, file_info: Dict[str, Any]) -> Optional[Path]:
+        """Return a local copy of a small file, downloading each distinct blob once."""
+        stored = self.blob_store.get(file_info)
+        if stored is not None:
+            return stored
+        
+        key = content_id(file_info)
+        download = partial(self._download_small_file, model_info, file_info)
+        if key is None:
+            return await download()
+        return await self._single_flight(self._small_file_inflight, key, download)
+    
+    async def _download_small_file(self, model_info: ModelInfo, file_info: Dict[str, Any]) -> Optional[Path]:
+        try:
+            path = await self._call_resolve(
+                hf_hub_download,
+                repo_id=model_info.name,
+                filename=file_info["name"],
+                revision=model_info.sha,
+                cache_dir=self.settings.cache_dir,
+                token=self.settings.token
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prefetch {model_info.name}/{file_info['name']}: {e}")
+            return None
+        
+        stored = await self._run_blocking(self.blob_store.add, file_info, Path(path))
+        return stored or Path(path)
+    
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read {path}: {e}")
+            return None
+    
+    async def get_safetensors_headers(self, model_info: ModelInfo) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the headers of a model's .safetensors files without downloading them.
+        
+        Each header is fetched with HTTP range requests: the 8-byte length
+        prefix followed by the JSON header, typically a few KB per file.
+        
+        Args:
+            model_info: Model whose safetensors files should be inspected
+            
+        Returns:
+            Dictionary mapping file names to tensor and parameter summaries
+        """
+        safetensors_files = model_info.files.matching(["*.safetensors"])
+        file_names = [f["name"] for f in safetensors_files]
+        if not file_names:
+            return {}
+        
+        if len(file_names) > self.settings.safetensors_max_files:
+            logger.info(
+                f"Inspecting the first {self.settings.safetensors_max_files} of "
+                f"{len(file_names)} safetensors files in {model_info.name}"
+            )
+            file_names = file_names[:self.settings.safetensors_max_files]
+        
+        revision = model_info.sha
+        content_ids = {f["name"]: content_id(f) for f in safetensors_files}
+        
+        async def read_header(file_name: str) -> Optional[Dict[str, Any]]:
+            # Unchanged shards across revisions and forks share one header read
+            file_content = content_ids.get(file_name)
+            if file_content in self._safetensors_memo:
+                self._safetensors_memo.move_to_end(file_content)
+                return self._safetensors_memo[file_content]
+            
+            try:
+                header = await self._call_resolve(
+                    self.api.parse_safetensors_file_metadata,
+                    model_info.name,
+                    file_name,
+                    revision=revision
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read safetensors header {model_info.name}/{file_name}: {e}")
+                model_info.incomplete.append(f"safetensors:{file_name}")
+                return None
+            
+            summary = self._summarize_safetensors_header(header)
+            if file_content is not None:
+                self._safetensors_memo[file_content] = summary
+                if len(self._safetensors_memo) > SAFETENSORS_MEMO_SIZE:
+                    self._safetensors_memo.popitem(last=False)
+            return summary
+        
+        headers = await asyncio.gather(*[read_header(name) for name in file_names])
+        return {name: header for name, header in zip(file_names, headers) if header is not None}
+    
+    def _summarize_safetensors_header(self, header: Any) -> Dict[str, Any]:
+        """Convert a parsed safetensors header into a JSON-friendly summary."""
+        parameters_by_dtype = dict(header.parameter_count)
+        summary: Dict[str, Any] = {
+            "parameter_count": sum(parameters_by_dtype.values()),
+            "parameters_by_dtype": parameters_by_dtype,
+            "tensor_count": len(header.tensors),
+            "metadata": dict(header.metadata or {}),
+        }
+        
+        if self.settings.safetensors_include_tensors:
+            summary["tensors"] = [
+                {"name": name, "dtype": tensor.dtype, "shape": list(tensor.shape)}
+                for name, tensor in header.tensors.items()
+            ]
+        
+        return summary
+    
+    async def download_model_files(
+        self,
+        model_name: str,
+        file_patterns: List[str],
+        revision: Optional[str] = None
+    ) -> Dict[str, str]:
         """
         Download specific model files for analysis.
         
+        Files are fetched with an allow-pattern snapshot download into
+        `cache_dir`, using parallel workers and resuming any partial
+        downloads left by an interrupted run. Blobs already downloaded for
+        another repository are hardlinked in from the shared blob store
+        instead of being fetched again.
+        
         Args:
             model_name: Name of the model
             file_patterns: List of file patterns to download
+            revision: Branch, tag or commit sha (defaults to the main branch)
             
         Returns:
             Dictionary mapping file names to local paths
         """
         logger.info(f"Downloading files for {model_name}: {file_patterns}")
         
-        # Implementation would use huggingface_hub.snapshot_download
-        # with allow_patterns parameter
+        info = await self.get_model_info(model_name, revision)
+        revision = info.sha or revision
+        files = info.files.matching(file_patterns)
+        if not files:
+            logger.info(f"No files in {model_name} match {file_patterns}")
+            return {}
+        
+        repo_dir = Path(self.settings.cache_dir) / repo_folder_name(repo_id=model_name, repo_type="model")
+        blobs_dir = repo_dir / "blobs"
+        total_bytes = sum(f.get("size") or 0 for f in files)
+        local_bytes = await self._run_blocking(self.blob_store.seed_hf_cache, blobs_dir, files)
+        
+        logger.info(
+            f"Fetching {len(files)} files ({total_bytes / 1e6:.1f} MB) for {model_name}, "
+            f"{local_bytes / 1e6:.1f} MB already available locally"
+        )
         
-        # Placeholder implementation
-        return {}
+        started = time.monotonic()
+        progress = asyncio.ensure_future(
+            self._report_download_progress(model_name, blobs_dir, files, total_bytes, started)
+        )
+        
+        try:
+            snapshot_dir = await self._call_resolve(
+                snapshot_download,
+                repo_id=model_name,
+                revision=revision,
+                allow_patterns=file_patterns,
+                cache_dir=self.settings.cache_dir,
+                token=self.settings.token,
+                max_workers=self.settings.download_workers
+            )
+        finally:
+            progress.cancel()
+        
+        elapsed = time.monotonic() - started
+        fetched_bytes = total_bytes - local_bytes
+        logger.info(
+            f"Downloaded {fetched_bytes / 1e6:.1f} MB for {model_name} in {elapsed:.1f}s "
+            f"({fetched_bytes / 1e6 / max(elapsed, 1e-6):.1f} MB/s)"
+        )
+        
+        await self._run_blocking(self.blob_store.absorb_hf_cache, blobs_dir, files)
+        
+        return {f["name"]: str(Path(snapshot_dir) / f["name"]) for f in files}
+    
+    async def _report_download_progress(
+        self,
+        model_name: str,
+        blobs_dir: Path,
+        files: List[Dict[str, Any]],
+        total_bytes: int,
+        started: float
+    ) -> None:
+        """Periodically log how much of a snapshot download is on disk."""
+        blob_names = [self.blob_store.path_for(f) for f in files]
+        
+        while True:
+            await asyncio.sleep(self.settings.download_progress_interval)
+            done_bytes = 0
+            for blob_name in blob_names:
+                if blob_name is None:
+                    continue
+                for candidate in (blobs_dir / blob_name.name, blobs_dir / f"{blob_name.name}.incomplete"):
+                    try:
+                        done_bytes += candidate.stat().st_size
+                        break
+                    except FileNotFoundError:
+                        continue
+            
+            elapsed = time.monotonic() - started
+            percent = 100.0 * done_bytes / total_bytes if total_bytes else 100.0
+            logger.info(
+                f"Downloading {model_name}: {percent:.0f}% "
+                f"({done_bytes / 1e6:.1f}/{total_bytes / 1e6:.1f} MB, "
+                f"{done_bytes / 1e6 / max(elapsed, 1e-6):.1f} MB/s)"
+            )
+    
+    async def _call_hub(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Hub API request under the rate limiter, retrying when throttled."""
+        run = partial(self._run_blocking, func, *args, **kwargs)
+        if self.rate_limiter is None:
+            return await run()
+        return await self.rate_limiter.call(run, description=getattr(func, '__name__', 'Hub request'))
+    
+    async def _call_resolve(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Like _call_hub, for file resolve/download traffic paced by its own bucket."""
+        run = partial(self._run_blocking, func, *args, **kwargs)
+        if self.rate_limiter is None:
+            return await run()
+        return await self.rate_limiter.call(
+            run, description=getattr(func, '__name__', 'Hub download'), resolve=True
+        )
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Hub call on the service's own thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings.max_workers,
+                thread_name_prefix="hf-hub"
+            )
+        return await asyncio.get_event_loop().run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
     
     async def cleanup(self) -> None:
         """Clean up resources."""
         logger.info("Cleaning up Hugging Face service...")
-        # Clean up any cached files or connections
-        pass
\ No newline at end of file
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
\ No newline at end of file
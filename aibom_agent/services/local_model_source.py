@@ -0,0 +1,460 @@
+"""Model sources backed by local directories and model archives."""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import struct
+import tarfile
+import zipfile
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from huggingface_hub.file_download import repo_folder_name
+from huggingface_hub.repocard import metadata_load
+from loguru import logger
+
+from ..config.settings import HuggingFaceSettings
+from ..models.analysis_result import ModelInfo, ModelRevision
+from ..models.file_table import FileTable
+from .file_hasher import FileHasher
+from .metadata_cache import is_commit_sha
+from .model_source import ModelSource
+from .size_calculator import ModelSizeCalculator
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".zip")
+
+# Hugging Face cache blobs are named by etag: the LFS sha256 or the git blob id
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+GIT_OID_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+SKIPPED_DIRS = {".git", ".cache", "__pycache__"}
+
+# Upper bound on a plausible safetensors JSON header
+SAFETENSORS_MAX_HEADER_BYTES = 100 * 1024 * 1024
+
+
+class LocalDirectoryModelSource(ModelSource):
+    """
+    Model source that reads repositories from local disk.
+    
+    `root` may contain plain model directories (`root/org/name`) or be a
+    Hugging Face cache directory (`root/models--org--name/snapshots/<sha>`),
+    in which case branch and tag revisions are resolved through `refs/`.
+    Model names that are absolute paths are read from that directory.
+    """
+    
+    def __init__(self, root: str, settings: HuggingFaceSettings):
+        self.root = Path(root).expanduser()
+        self.settings = settings
+        self.max_concurrency = settings.max_workers
+        self.size_calculator = ModelSizeCalculator()
+        self.file_hasher = FileHasher(settings.hash_workers)
+    
+    async def initialize(self) -> None:
+        """Check that the source directory exists."""
+        logger.info(f"Initializing local model source at {self.root}...")
+        
+        if not self.root.is_dir():
+            raise FileNotFoundError(f"Model source directory not found: {self.root}")
+    
+    async def get_model_info(self, model_name: str, revision: Optional[str] = None) -> ModelInfo:
+        """
+        Read model information from a local repository directory.
+        
+        Args:
+            model_name: Name of the model (e.g., 'microsoft/DialoGPT-medium')
+            revision: Branch, tag or commit sha; only Hugging Face cache
+                layouts hold more than one revision
+        
+        Returns:
+            ModelInfo object with model details
+        """
+        logger.info(f"Reading local model info for: {model_name}")
+        
+        model_dir, sha = await self._run_blocking(self.locate, model_name, revision)
+        return await self._run_blocking(self._build_model_info, model_name, model_dir, sha)
+    
+    async def download_model_files(
+        self,
+        model_name: str,
+        file_patterns: List[str],
+        revision: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Return local paths of the model files matching the patterns.
+        
+        Files are already on disk, so nothing is copied.
+        
+        Args:
+            model_name: Name of the model
+            file_patterns: List of file patterns to match
+            revision: Branch, tag or commit sha
+        
+        Returns:
+            Dictionary mapping file names to local paths
+        """
+        model_dir, _ = await self._run_blocking(self.locate, model_name, revision)
+        files = await self._run_blocking(self._list_files, model_dir)
+        return {f["name"]: str(model_dir / f["name"]) for f in files.matching(file_patterns)}
+    
+    async def list_revisions(self, model_name: str) -> List[ModelRevision]:
+        """
+        List the snapshots of a model in a Hugging Face cache, oldest first.
+        
+        The cache records no commit history, so snapshots are ordered by
+        modification time.
+        """
+        return await self._run_blocking(self._list_snapshots, model_name)
+    
+    def _list_snapshots(self, model_name: str) -> List[ModelRevision]:
+        cache_dir = self._cache_repo_dir(model_name)
+        if cache_dir is None:
+            raise NotImplementedError(f"{model_name} is not stored in a Hugging Face cache layout")
+        
+        snapshots_dir = cache_dir / "snapshots"
+        snapshots = sorted(
+            (p for p in snapshots_dir.iterdir() if p.is_dir()),
+            key=lambda p: p.stat().st_mtime
+        ) if snapshots_dir.is_dir() else []
+        return [
+            ModelRevision(sha=snapshot.name, committed_at=self._last_modified(snapshot))
+            for snapshot in snapshots
+        ]
+    
+    def _cache_repo_dir(self, model_name: str) -> Optional[Path]:
+        """Hugging Face cache folder of a model, if the source has one."""
+        for base in (self.root, self.root / "hub"):
+            cache_dir = base / repo_folder_name(repo_id=model_name, repo_type="model")
+            if cache_dir.is_dir():
+                return cache_dir
+        return None
+    
+    def locate(self, model_name: str, revision: Optional[str] = None) -> Tuple[Path, Optional[str]]:
+        """
+        Find the directory holding a model revision.
+        
+        Returns:
+            Tuple of the model directory and its commit sha, if known
+        """
+        if Path(model_name).is_absolute():
+            model_dir = Path(model_name)
+            if not model_dir.is_dir():
+                raise FileNotFoundError(f"Model directory not found: {model_dir}")
+            return model_dir, None
+        
+        cache_dir = self._cache_repo_dir(model_name)
+        if cache_dir is not None:
+            return self._locate_snapshot(cache_dir, revision)
+        
+        model_dir = self.root / model_name
+        if model_dir.is_dir():
+            return model_dir, None
+        
+        raise FileNotFoundError(f"Model {model_name} not found under {self.root}")
+    
+    def _locate_snapshot(self, cache_dir: Path, revision: Optional[str]) -> Tuple[Path, str]:
+        """Resolve a revision inside a Hugging Face cache repository folder."""
+        snapshots_dir = cache_dir / "snapshots"
+        
+        if is_commit_sha(revision):
+            sha = revision
+        else:
+            ref_file = cache_dir / "refs" / (revision or "main")
+            if ref_file.is_file():
+                sha = ref_file.read_text().strip()
+            elif revision is None:
+                # No refs recorded (e.g. a copied snapshot); use the newest one
+                snapshots = sorted(
+                    (p for p in snapshots_dir.iterdir() if p.is_dir()),
+                    key=lambda p: p.stat().st_mtime
+                ) if snapshots_dir.is_dir() else []
+                if not snapshots:
+                    raise FileNotFoundError(f"No snapshots in {cache_dir}")
+                sha = snapshots[-1].name
+            else:
+                raise FileNotFoundError(f"Revision {revision} not found in {cache_dir}")
+        
+        snapshot_dir = snapshots_dir / sha
+        if not snapshot_dir.is_dir():
+            raise FileNotFoundError(f"Snapshot {sha} not found in {cache_dir}")
+        return snapshot_dir, sha
+    
+    def _build_model_info(self, model_name: str, model_dir: Path, sha: Optional[str]) -> ModelInfo:
+        """Assemble a ModelInfo from the files in a model directory."""
+        files = self._list_files(model_dir)
+        size_breakdown = self.size_calculator.calculate(files)
+        card = self._load_card_metadata(model_dir)
+        
+        pipeline_tag = card.get("pipeline_tag")
+        tags = card.get("tags") or []
+        if isinstance(tags, str):
+            tags = [tags]
+        
+        model_info = ModelInfo(
+            name=model_name,
+            author=model_name.split("/")[0] if "/" in model_name else "unknown",
+            description=None,
+            tags=list(tags),
+            pipeline_tag=pipeline_tag,
+            library_name=card.get("library_name"),
+            license=card.get("license"),
+            downloads=0,
+            likes=0,
+            created_at="",
+            last_modified=self._last_modified(model_dir),
+            model_size=size_breakdown["weights_bytes"] or None,
+            config=self._load_config(model_dir),
+            files=files,
+            sha=sha,
+            size_breakdown=size_breakdown,
+            small_files={
+                f["name"]: str(model_dir / f["name"])
+                for f in files.matching(self.settings.small_file_patterns)
+                if f["size"] <= self.settings.small_file_max_bytes
+            }
+        )
+        
+        if self.settings.inspect_safetensors:
+            model_info.safetensors = self._read_safetensors_headers(model_dir, files, model_info.incomplete)
+        
+        if self.settings.hash_local_files:
+            # Cache blobs named by an LFS sha256 already carry their hash
+            model_info.file_hashes = self.file_hasher.hash_files({
+                f["name"]: str(model_dir / f["name"]) for f in files if not f["sha256"]
+            })
+        
+        return model_info
+    
+    def _list_files(self, model_dir: Path) -> FileTable:
+        """List repository files with sizes and, where known, content hashes."""
+        files = FileTable()
+        for dirpath, dirnames, filenames in os.walk(model_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+            for filename in sorted(filenames):
+                path = Path(dirpath) / filename
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    # Dangling symlink, e.g. a blob that was never downloaded
+                    continue
+                
+                file_info = {
+                    "name": path.relative_to(model_dir).as_posix(),
+                    "size": size,
+                    "blob_id": None,
+                    "sha256": None
+                }
+                
+                if path.is_symlink():
+                    etag = Path(os.readlink(path)).name
+                    if SHA256_PATTERN.match(etag):
+                        file_info["sha256"] = etag
+                    elif GIT_OID_PATTERN.match(etag):
+                        file_info["blob_id"] = etag
+                
+                files.append(file_info)
+        return files
+    
+    def _load_config(self, model_dir: Path) -> Dict[str, Any]:
+        """Load config.json, if the model has one."""
+        config_path = model_dir / "config.json"
+        if not config_path.is_file():
+            return {}
+        try:
+            config = json.loads(config_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read {config_path}: {e}")
+            return {}
+        return config if isinstance(config, dict) else {}
+    
+    def _load_card_metadata(self, model_dir: Path) -> Dict[str, Any]:
+        """Load the YAML metadata block of the model card, if present."""
+        readme_path = model_dir / "README.md"
+        if not readme_path.is_file():
+            return {}
+        try:
+            return metadata_load(readme_path) or {}
+        except Exception as e:
+            logger.warning(f"Failed to read model card metadata from {readme_path}: {e}")
+            return {}
+    
+    def _last_modified(self, model_dir: Path) -> str:
+        mtime = model_dir.stat().st_mtime
+        return str(datetime.fromtimestamp(mtime, tz=timezone.utc))
+    
+    def _read_safetensors_headers(
+        self,
+        model_dir: Path,
+        files: FileTable,
+        incomplete: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Read the headers of local .safetensors files."""
+        file_names = [f["name"] for f in files if f["name"].endswith(".safetensors")]
+        file_names = file_names[:self.settings.safetensors_max_files]
+        
+        headers = {}
+        for file_name in file_names:
+            try:
+                headers[file_name] = self._summarize_safetensors_header(model_dir / file_name)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to read safetensors header {model_dir / file_name}: {e}")
+                incomplete.append(f"safetensors:{file_name}")
+        return headers
+    
+    def _summarize_safetensors_header(self, path: Path) -> Dict[str, Any]:
+        """Parse a safetensors header into the same summary the Hub source produces."""
+        with open(path, "rb") as f:
+            prefix = f.read(8)
+            if len(prefix) != 8:
+                raise ValueError("file is too short")
+            (header_len,) = struct.unpack("<Q", prefix)
+            if header_len > SAFETENSORS_MAX_HEADER_BYTES:
+                raise ValueError(f"header length {header_len} is implausibly large")
+            header = json.loads(f.read(header_len))
+        
+        metadata = header.pop("__metadata__", None) or {}
+        parameters_by_dtype: Dict[str, int] = {}
+        for tensor in header.values():
+            count = 1
+            for dim in tensor["shape"]:
+                count *= dim
+            parameters_by_dtype[tensor["dtype"]] = parameters_by_dtype.get(tensor["dtype"], 0) + count
+        
+        summary: Dict[str, Any] = {
+            "parameter_count": sum(parameters_by_dtype.values()),
+            "parameters_by_dtype": parameters_by_dtype,
+            "tensor_count": len(header),
+            "metadata": dict(metadata),
+        }
+        
+        if self.settings.safetensors_include_tensors:
+            summary["tensors"] = [
+                {"name": name, "dtype": tensor["dtype"], "shape": list(tensor["shape"])}
+                for name, tensor in header.items()
+            ]
+        
+        return summary
+    
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run blocking filesystem work off the event loop."""
+        return await asyncio.get_event_loop().run_in_executor(None, partial(func, *args, **kwargs))
+
+
+class ArchiveModelSource(LocalDirectoryModelSource):
+    """
+    Model source that reads repositories from tar or zip archives.
+    
+    `path` is either a single archive or a directory of archives named after
+    the model (`org--name.tar.gz`). Archives may hold a bare model directory,
+    `org/name` directories or a Hugging Face cache layout. Each archive is
+    extracted once into `cache_dir/archives` and reused on later runs.
+    """
+    
+    def __init__(self, path: str, settings: HuggingFaceSettings):
+        super().__init__(path, settings)
+        self.extract_root = Path(settings.cache_dir) / "archives"
+    
+    async def initialize(self) -> None:
+        """Check that the archive or archive directory exists."""
+        logger.info(f"Initializing archive model source at {self.root}...")
+        
+        if not self.root.exists():
+            raise FileNotFoundError(f"Model archive not found: {self.root}")
+    
+    def locate(self, model_name: str, revision: Optional[str] = None) -> Tuple[Path, Optional[str]]:
+        """Extract the archive holding a model and find the model inside it."""
+        archive = self._find_archive(model_name)
+        extracted = self._extract(archive)
+        
+        try:
+            return LocalDirectoryModelSource(str(extracted), self.settings).locate(model_name, revision)
+        except FileNotFoundError:
+            pass
+        
+        # Single-model archive: the model sits at the top level, possibly
+        # wrapped in one directory
+        entries = [p for p in extracted.iterdir() if p.name not in SKIPPED_DIRS]
+        if len(entries) == 1 and entries[0].is_dir():
+            return entries[0], None
+        return extracted, None
+    
+    def _cache_repo_dir(self, model_name: str) -> Optional[Path]:
+        """Hugging Face cache folder of a model inside its archive, if any."""
+        extracted = self._extract(self._find_archive(model_name))
+        return LocalDirectoryModelSource(str(extracted), self.settings)._cache_repo_dir(model_name)
+    
+    def _find_archive(self, model_name: str) -> Path:
+        if self.root.is_file():
+            return self.root
+        
+        stem = model_name.replace("/", "--")
+        for suffix in ARCHIVE_SUFFIXES:
+            candidate = self.root / f"{stem}{suffix}"
+            if candidate.is_file():
+                return candidate
+        raise FileNotFoundError(f"No archive for {model_name} under {self.root}")
+    
+    def _extract(self, archive: Path) -> Path:
+        """Extract an archive once, keyed by its path, size and mtime."""
+        stat = archive.stat()
+        key = f"{archive.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        target = self.extract_root / hashlib.sha256(key.encode()).hexdigest()[:16]
+        if target.is_dir():
+            return target
+        
+        logger.info(f"Extracting {archive} to {target}")
+        tmp_dir = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        
+        try:
+            if archive.name.endswith(".zip"):
+                self._extract_zip(archive, tmp_dir)
+            else:
+                self._extract_tar(archive, tmp_dir)
+            os.replace(tmp_dir, target)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if target.is_dir():
+                # Another process finished extracting first
+                return target
+            raise
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return target
+    
+    def _extract_tar(self, archive: Path, dest: Path) -> None:
+        with tarfile.open(archive) as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(dest, filter="data")
+                return
+            
+            # Older Pythons: refuse members that would land outside dest
+            dest_root = dest.resolve()
+            for member in tar.getmembers():
+                member_path = (dest / member.name).resolve()
+                if dest_root not in member_path.parents and member_path != dest_root:
+                    raise ValueError(f"Unsafe path in archive {archive}: {member.name}")
+                if member.issym() or member.islnk():
+                    link_base = member_path.parent if member.issym() else dest_root
+                    link_path = (link_base / member.linkname).resolve()
+                    if dest_root not in link_path.parents:
+                        raise ValueError(f"Unsafe link in archive {archive}: {member.name}")
+                elif not (member.isfile() or member.isdir()):
+                    raise ValueError(f"Unsupported member in archive {archive}: {member.name}")
+            tar.extractall(dest)
+    
+    def _extract_zip(self, archive: Path, dest: Path) -> None:
+        dest_root = dest.resolve()
+        with zipfile.ZipFile(archive) as zf:
+            for name in zf.namelist():
+                member_path = (dest / name).resolve()
+                if dest_root not in member_path.parents and member_path != dest_root:
+                    raise ValueError(f"Unsafe path in archive {archive}: {name}")
+            zf.extractall(dest)
@@ -0,0 +1,92 @@
+"""Persistent cache of Hugging Face model metadata keyed by commit sha."""
+
+import dataclasses
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..models.analysis_result import ModelInfo
+from .disk_cache import CacheEntry, DiskCache
+
+COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+# Bump whenever the shape of cached ModelInfo data changes
+CACHE_FORMAT_VERSION = 8
+
+
+def is_commit_sha(revision: Optional[str]) -> bool:
+    """Whether revision is a full commit sha (and therefore immutable)."""
+    return bool(revision and COMMIT_SHA_PATTERN.match(revision))
+
+
+class ModelMetadataCache:
+    """
+    Disk-backed cache of ModelInfo objects.
+    
+    Metadata is stored once per (repo id, commit sha) pair. Because a commit
+    never changes, those entries only leave the cache through LRU eviction.
+    A second, small "ref" entry records which sha a branch or tag resolved
+    to and when that was last confirmed against the Hub, so callers can
+    decide whether a cheap revalidation is due.
+    """
+    
+    def __init__(self, cache_dir: str, ttl: int, max_bytes: int):
+        self.ttl = ttl
+        self.store = DiskCache(Path(cache_dir) / "metadata", max_bytes)
+    
+    def resolve(self, repo_id: str, revision: Optional[str]) -> Optional[CacheEntry]:
+        """Return the cached ref entry ({"sha", "last_modified"}) for a revision."""
+        return self.store.get(self._ref_key(repo_id, revision))
+    
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether a ref entry is young enough to skip revalidation."""
+        return entry.age < self.ttl
+    
+    def get(self, repo_id: str, sha: str) -> Optional[ModelInfo]:
+        """Return cached metadata for a repo at a specific commit."""
+        entry = self.store.get(self._sha_key(repo_id, sha))
+        if entry is None:
+            return None
+        try:
+            return ModelInfo(**entry.value)
+        except TypeError:
+            # Written by an incompatible version of ModelInfo
+            self.store.delete(self._sha_key(repo_id, sha))
+            return None
+    
+    def put(self, model_info: ModelInfo, revision: Optional[str] = None) -> None:
+        """Store metadata and record the sha the revision resolved to."""
+        if not model_info.sha:
+            return
+        self.store.put(
+            self._sha_key(model_info.name, model_info.sha),
+            self._to_dict(model_info)
+        )
+        self.mark_validated(model_info.name, revision, model_info.sha, model_info.last_modified)
+    
+    def mark_validated(
+        self,
+        repo_id: str,
+        revision: Optional[str],
+        sha: str,
+        last_modified: str
+    ) -> None:
+        """Record that revision was just confirmed to point at sha."""
+        if is_commit_sha(revision):
+            return
+        self.store.put(
+            self._ref_key(repo_id, revision),
+            {"sha": sha, "last_modified": last_modified}
+        )
+    
+    def _to_dict(self, model_info: ModelInfo) -> Dict[str, Any]:
+        # Shallow field copy: the file table is stored in its columnar form
+        data = {f.name: getattr(model_info, f.name) for f in dataclasses.fields(model_info)}
+        data["files"] = model_info.files.to_dict()
+        return data
+    
+    def _sha_key(self, repo_id: str, sha: str) -> str:
+        return f"model:v{CACHE_FORMAT_VERSION}:{repo_id}@{sha}"
+    
+    def _ref_key(self, repo_id: str, revision: Optional[str]) -> str:
+        return f"ref:{repo_id}@{revision or 'main'}"
@@ -0,0 +1,153 @@
+"""Model source abstraction used by the orchestrators."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from ..config.settings import Settings
+from ..models.analysis_result import ModelFetchResult, ModelInfo, ModelListing, ModelRevision
+
+MODEL_SOURCE_TYPES = ("hub", "local", "archive")
+
+
+class ModelSource(ABC):
+    """
+    Provides model metadata and files to the analysis pipeline.
+    
+    The Hugging Face Hub is one implementation; local directories (including
+    an existing Hugging Face cache) and model archives are others, which
+    lets air-gapped and offline scans run without network access.
+    """
+    
+    # Default number of models fetched at once by get_model_infos
+    max_concurrency: int = 8
+    
+    async def initialize(self) -> None:
+        """Prepare the source for use."""
+    
+    @abstractmethod
+    async def get_model_info(self, model_name: str, revision: Optional[str] = None) -> ModelInfo:
+        """
+        Fetch comprehensive information about a model.
+        
+        Args:
+            model_name: Name of the model (e.g., 'microsoft/DialoGPT-medium')
+            revision: Branch, tag or commit sha, where the source has revisions
+        
+        Returns:
+            ModelInfo object with model details
+        """
+    
+    @abstractmethod
+    async def download_model_files(
+        self,
+        model_name: str,
+        file_patterns: List[str],
+        revision: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Make model files matching the patterns available on local disk.
+        
+        Args:
+            model_name: Name of the model
+            file_patterns: List of file patterns to fetch
+            revision: Branch, tag or commit sha, where the source has revisions
+        
+        Returns:
+            Dictionary mapping file names to local paths
+        """
+    
+    async def list_revisions(self, model_name: str) -> List[ModelRevision]:
+        """
+        List the revisions of a model, oldest first.
+        
+        Sources without revision history raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide revision history")
+    
+    def iter_models(
+        self,
+        author: Optional[str] = None,
+        pipeline_tag: Optional[str] = None,
+        search: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        min_downloads: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[ModelListing]:
+        """
+        Stream the models that match a set of filters.
+        
+        Sources without a searchable listing raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support model listing")
+    
+    async def get_model_infos(
+        self,
+        model_names: Iterable[str],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[ModelFetchResult]:
+        """
+        Fetch information for many models, yielding results as they complete.
+        
+        A failure for one model is reported in its result instead of
+        aborting the rest of the batch.
+        
+        Args:
+            model_names: Names of the models to fetch
+            concurrency: Maximum number of models fetched at once
+                (defaults to the source's max_concurrency)
+        
+        Returns:
+            Async iterator of ModelFetchResult objects in completion order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.max_concurrency)
+        
+        async def fetch(name: str) -> ModelFetchResult:
+            async with semaphore:
+                try:
+                    return ModelFetchResult(model_name=name, model_info=await self.get_model_info(name))
+                except Exception as e:
+                    return ModelFetchResult(model_name=name, error=e)
+        
+        tasks = [asyncio.ensure_future(fetch(name)) for name in model_names]
+        logger.info(f"Fetching model info for {len(tasks)} models")
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def status(self) -> Dict[str, Any]:
+        """Describe the source for status reporting."""
+        return {"source": type(self).__name__}
+    
+    async def cleanup(self) -> None:
+        """Release resources held by the source."""
+
+
+def create_model_source(settings: Settings) -> ModelSource:
+    """Build the model source selected by `settings.model_source`."""
+    source_type = settings.model_source.lower()
+    
+    if source_type == "hub":
+        from .huggingface_service import HuggingFaceService
+        return HuggingFaceService(settings.huggingface)
+    
+    if source_type not in MODEL_SOURCE_TYPES:
+        raise ValueError(
+            f"Unknown model source '{settings.model_source}', "
+            f"expected one of: {', '.join(MODEL_SOURCE_TYPES)}"
+        )
+    
+    if not settings.model_source_path:
+        raise ValueError(f"model_source_path is required for the '{source_type}' model source")
+    
+    from .local_model_source import ArchiveModelSource, LocalDirectoryModelSource
+    
+    if source_type == "local":
+        return LocalDirectoryModelSource(settings.model_source_path, settings.huggingface)
+    return ArchiveModelSource(settings.model_source_path, settings.huggingface)
@@ -0,0 +1,472 @@
+"""Streaming scanner for pickle-based model weight files."""
+
+import asyncio
+import os
+import pickle
+import pickletools
+import struct
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Dict, List, Optional
+
+from loguru import logger
+
+from ..config.settings import AIBOMSettings
+from ..models.analysis_result import SecurityAnalysis
+
+# Imports that legitimate torch / numpy checkpoints need to rebuild tensors
+SAFE_GLOBALS = {
+    ("collections", "OrderedDict"),
+    ("torch._utils", "_rebuild_tensor"),
+    ("torch._utils", "_rebuild_tensor_v2"),
+    ("torch._utils", "_rebuild_tensor_v3"),
+    ("torch._utils", "_rebuild_parameter"),
+    ("torch._utils", "_rebuild_parameter_with_state"),
+    ("torch._utils", "_rebuild_qtensor"),
+    ("torch._utils", "_rebuild_sparse_tensor"),
+    ("torch._utils", "_rebuild_meta_tensor_no_storage"),
+    ("torch._utils", "_rebuild_device_tensor_from_numpy"),
+    ("torch._tensor", "_rebuild_from_type_v2"),
+    ("torch", "Size"),
+    ("torch", "device"),
+    ("torch", "dtype"),
+    ("torch", "bfloat16"),
+    ("torch", "float16"),
+    ("torch", "float32"),
+    ("torch", "float64"),
+    ("torch", "int8"),
+    ("torch", "int16"),
+    ("torch", "int32"),
+    ("torch", "int64"),
+    ("torch", "uint8"),
+    ("torch", "bool"),
+    ("torch", "BFloat16Storage"),
+    ("torch", "BoolStorage"),
+    ("torch", "ByteStorage"),
+    ("torch", "CharStorage"),
+    ("torch", "DoubleStorage"),
+    ("torch", "FloatStorage"),
+    ("torch", "HalfStorage"),
+    ("torch", "IntStorage"),
+    ("torch", "LongStorage"),
+    ("torch", "ShortStorage"),
+    ("torch.storage", "UntypedStorage"),
+    ("torch.storage", "_load_from_bytes"),
+    ("numpy", "dtype"),
+    ("numpy", "ndarray"),
+    ("numpy.core.multiarray", "_reconstruct"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "_reconstruct"),
+    ("numpy._core.multiarray", "scalar"),
+    ("_codecs", "encode"),
+    ("builtins", "set"),
+    ("builtins", "frozenset"),
+    ("builtins", "slice"),
+    ("__builtin__", "set"),
+}
+
+# Modules whose import from a model file means code execution or system access
+DANGEROUS_MODULES = {
+    "os", "posix", "nt", "subprocess", "sys", "socket", "shutil", "runpy",
+    "importlib", "pickle", "_pickle", "marshal", "pty", "commands", "code",
+    "ctypes", "multiprocessing", "webbrowser", "requests", "urllib", "http",
+    "httplib", "asyncio", "signal", "tempfile", "pathlib", "platform",
+}
+
+DANGEROUS_BUILTINS = {
+    "eval", "exec", "execfile", "compile", "open", "getattr", "setattr",
+    "delattr", "globals", "locals", "vars", "__import__", "apply", "input",
+    "breakpoint", "memoryview",
+}
+
+# Opcodes that invoke a callable produced by an import
+CALL_OPCODES = {"REDUCE", "INST", "OBJ", "NEWOBJ", "NEWOBJ_EX"}
+
+# Opcodes that push a string that STACK_GLOBAL may later consume
+STRING_OPCODES = {
+    "SHORT_BINUNICODE", "BINUNICODE", "BINUNICODE8", "UNICODE",
+    "SHORT_BINSTRING", "BINSTRING", "STRING",
+}
+
+MAX_STRING_LENGTH = 1024
+
+# torch.load only opens a file as a zip checkpoint when it starts with a
+# local file header; anything else is unpickled from its first byte, even
+# if a zip archive is appended (which zipfile.is_zipfile would accept)
+ZIP_LOCAL_MAGIC = b"PK\x03\x04"
+MAX_PICKLES_PER_STREAM = 8
+
+# Legacy (non-zip) torch.save output: five pickles (magic number, protocol
+# version, sys info, data, storage keys) followed by raw storage bytes
+LEGACY_TORCH_MAGIC = 0x1950a86a20f9469cfc6c
+LEGACY_TORCH_PICKLES = 5
+LEGACY_TORCH_MARKERS = (
+    pickle.dumps(LEGACY_TORCH_MAGIC, protocol=2)[2:-1],  # LONG1 opcode and argument
+    str(LEGACY_TORCH_MAGIC).encode("ascii"),  # protocol 0/1 text form
+)
+
+_OPCODES = {op.code.encode("latin-1"): op for op in pickletools.opcodes}
+
+
+@dataclass
+class PickleScanResult:
+    """Findings for a single pickle-based file."""
+    file_name: str
+    imports: List[str] = field(default_factory=list)
+    dangerous_imports: List[str] = field(default_factory=list)
+    unknown_imports: List[str] = field(default_factory=list)
+    call_count: int = 0
+    error: Optional[str] = None
+    legacy_torch: bool = False
+    # False when the content is not pickle data at all (e.g. a GGML .bin)
+    is_pickle: bool = True
+    
+    @property
+    def is_dangerous(self) -> bool:
+        """Whether the file imports something that enables code execution."""
+        return bool(self.dangerous_imports)
+
+
+class _NotAPickle(Exception):
+    """Raised when a stream stops looking like pickle opcodes."""
+
+
+class PickleScanner:
+    """
+    Scans pickle-based weight files without unpickling them.
+    
+    The scanner walks pickle opcodes straight from the file (including the
+    data.pkl entries inside zip-packaged torch checkpoints), recording every
+    GLOBAL/STACK_GLOBAL import and how often imported callables are invoked.
+    Large byte payloads are skipped in bounded chunks, so memory stays flat
+    regardless of shard size. Files are scanned in parallel processes.
+    """
+    
+    def __init__(self, settings: AIBOMSettings):
+        self.settings = settings
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    async def scan_files(self, paths: Dict[str, str]) -> List[PickleScanResult]:
+        """
+        Scan local files in parallel.
+        
+        Args:
+            paths: Mapping of repository file names to local paths
+        
+        Returns:
+            One PickleScanResult per file
+        """
+        if not paths:
+            return []
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.settings.pickle_scan_workers or os.cpu_count()
+            )
+        
+        logger.info(f"Scanning {len(paths)} pickle-based files")
+        loop = asyncio.get_event_loop()
+        tasks = [
+            loop.run_in_executor(
+                self._executor, scan_file, name, path, self.settings.pickle_scan_chunk_size
+            )
+            for name, path in paths.items()
+        ]
+        return list(await asyncio.gather(*tasks))
+    
+    def apply_results(
+        self,
+        security_analysis: SecurityAnalysis,
+        results: List[PickleScanResult]
+    ) -> None:
+        """Merge scan findings into a security analysis."""
+        flagged = False
+        
+        for result in results:
+            if not result.is_pickle:
+                logger.info(f"{result.file_name} is not pickle data; nothing to scan")
+                continue
+            
+            # Imports found before a scan error are still reported; the error
+            # itself is a finding, since torch.load may get further than we did
+            if result.error:
+                flagged = True
+                logger.warning(f"Could not fully scan {result.file_name}: {result.error}")
+                self._add_unique(
+                    security_analysis.unsafe_formats,
+                    f"{result.file_name}: pickle could not be fully scanned ({result.error})"
+                )
+                self._add_unique(security_analysis.suspicious_files, result.file_name)
+                security_analysis.vulnerabilities.append({
+                    "type": "unscannable-pickle",
+                    "severity": "HIGH",
+                    "description": (
+                        f"{result.file_name} is a pickle-based file that could not be fully "
+                        f"scanned ({result.error}); its imports cannot be verified"
+                    ),
+                })
+            
+            if result.is_dangerous:
+                flagged = True
+                imports = ", ".join(result.dangerous_imports)
+                self._add_unique(
+                    security_analysis.unsafe_formats,
+                    f"{result.file_name}: pickle imports {imports}"
+                )
+                self._add_unique(security_analysis.suspicious_files, result.file_name)
+                security_analysis.vulnerabilities.append({
+                    "type": "unsafe-deserialization",
+                    "severity": "CRITICAL",
+                    "description": (
+                        f"{result.file_name} executes {imports} when loaded with pickle/torch.load"
+                    ),
+                })
+            elif result.unknown_imports:
+                flagged = True
+                imports = ", ".join(result.unknown_imports)
+                self._add_unique(
+                    security_analysis.unsafe_formats,
+                    f"{result.file_name}: pickle imports non-standard globals {imports}"
+                )
+                self._add_unique(security_analysis.suspicious_files, result.file_name)
+        
+        if flagged:
+            self._add_unique(
+                security_analysis.recommendations,
+                "Load pickle-based weights only with torch.load(weights_only=True) or convert them to safetensors"
+            )
+    
+    def _add_unique(self, items: List[str], item: str) -> None:
+        if item not in items:
+            items.append(item)
+    
+    async def cleanup(self) -> None:
+        """Shut down scanner worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def scan_file(file_name: str, path: str, chunk_size: int = 1024 * 1024) -> PickleScanResult:
+    """Scan one file; runs in a worker process."""
+    result = PickleScanResult(file_name=file_name)
+    imports: Dict[str, None] = {}
+    
+    try:
+        with open(path, "rb", buffering=chunk_size) as stream:
+            is_zip = stream.read(len(ZIP_LOCAL_MAGIC)) == ZIP_LOCAL_MAGIC
+            stream.seek(0)
+            if is_zip:
+                with zipfile.ZipFile(stream) as archive:
+                    for entry in archive.namelist():
+                        if entry.endswith(".pkl"):
+                            with archive.open(entry) as entry_stream:
+                                result.call_count += _scan_stream(entry_stream, imports, chunk_size)
+            else:
+                result.legacy_torch = _is_legacy_torch(stream)
+                if result.legacy_torch:
+                    result.call_count += _scan_legacy_torch(stream, imports, chunk_size)
+                else:
+                    result.call_count += _scan_stream(stream, imports, chunk_size)
+    except _NotAPickle:
+        result.is_pickle = False
+    except Exception as e:
+        # Imports collected so far are kept below
+        result.error = str(e) or type(e).__name__
+    
+    for name in imports:
+        module, _, attribute = name.rpartition(".")
+        result.imports.append(name)
+        if _is_dangerous(module, attribute):
+            result.dangerous_imports.append(name)
+        elif (module, attribute) not in SAFE_GLOBALS:
+            result.unknown_imports.append(name)
+    
+    return result
+
+
+def _is_dangerous(module: str, attribute: str) -> bool:
+    if module.split(".")[0] in DANGEROUS_MODULES:
+        return True
+    return module in ("builtins", "__builtin__", "__builtins__") and attribute in DANGEROUS_BUILTINS
+
+
+def _is_legacy_torch(stream: IO[bytes]) -> bool:
+    """Whether a file starts with the legacy torch.save magic number pickle."""
+    head = stream.read(64)
+    stream.seek(0)
+    return any(marker in head for marker in LEGACY_TORCH_MARKERS)
+
+
+def _scan_legacy_torch(stream: IO[bytes], imports: Dict[str, None], chunk_size: int) -> int:
+    """
+    Walk exactly the pickles of a legacy torch file.
+    
+    The raw storage bytes after the storage-keys pickle are never parsed:
+    tensor data can look like opcodes and would yield spurious imports.
+    """
+    calls = 0
+    for _ in range(LEGACY_TORCH_PICKLES):
+        try:
+            calls += _scan_pickle(stream, imports, chunk_size)
+        except (_NotAPickle, EOFError):
+            raise ValueError("truncated or malformed legacy torch file")
+    return calls
+
+
+def _scan_stream(stream: IO[bytes], imports: Dict[str, None], chunk_size: int) -> int:
+    """
+    Walk the pickles in a stream and collect their imports.
+    
+    Files may hold several pickles back to back; scanning stops at the end
+    of the stream or the first pickle boundary that is not a valid opcode.
+    """
+    calls = 0
+    for index in range(MAX_PICKLES_PER_STREAM):
+        try:
+            calls += _scan_pickle(stream, imports, chunk_size)
+        except _NotAPickle:
+            if index == 0:
+                raise
+            break
+        except EOFError:
+            if index == 0:
+                raise _NotAPickle
+            break
+        except (ValueError, struct.error):
+            # Bytes that break down before importing anything cannot run
+            # code when unpickled; they are some other binary format
+            if index == 0 and not imports:
+                raise _NotAPickle
+            raise
+    return calls
+
+
+def _scan_pickle(stream: IO[bytes], imports: Dict[str, None], chunk_size: int) -> int:
+    """Walk one pickle up to its STOP opcode. Returns the number of call opcodes."""
+    calls = 0
+    memo: Dict[int, Optional[str]] = {}
+    memo_count = 0
+    # Values of the two most recently pushed objects (None if not a string)
+    recent: List[Optional[str]] = [None, None]
+    
+    first = True
+    while True:
+        code = stream.read(1)
+        if not code:
+            if first:
+                raise EOFError
+            raise ValueError("unexpected end of pickle stream")
+        
+        op = _OPCODES.get(code)
+        if op is None:
+            raise _NotAPickle
+        first = False
+        name = op.name
+        
+        if name == "STOP":
+            return calls
+        
+        if name in ("GLOBAL", "INST"):
+            module = _read_line(stream)
+            attribute = _read_line(stream)
+            imports[f"{module}.{attribute}"] = None
+            recent = [recent[1], None]
+            if name == "INST":
+                calls += 1
+            continue
+        
+        value = _read_argument(stream, op, chunk_size)
+        
+        if name == "STACK_GLOBAL":
+            module, attribute = recent
+            imports[f"{module or '?'}.{attribute or '?'}"] = None
+            recent = [None, None]
+        elif name in STRING_OPCODES:
+            recent = [recent[1], value if isinstance(value, str) else None]
+        elif name == "MEMOIZE":
+            memo[memo_count] = recent[1]
+            memo_count += 1
+        elif name in ("PUT", "BINPUT", "LONG_BINPUT"):
+            memo[int(value)] = recent[1]
+        elif name in ("GET", "BINGET", "LONG_BINGET"):
+            recent = [recent[1], memo.get(int(value))]
+        elif op.stack_after:
+            recent = [recent[1], None]
+        
+        if name in CALL_OPCODES:
+            calls += 1
+
+
+def _read_argument(stream: IO[bytes], op: pickletools.OpcodeInfo, chunk_size: int) -> object:
+    """Read (or skip) an opcode's argument, returning short strings and integers."""
+    arg = op.arg
+    if arg is None:
+        return None
+    
+    if arg.n >= 0:
+        data = _read_exact(stream, arg.n)
+        if op.name in ("BINPUT", "BINGET"):
+            return data[0]
+        if op.name in ("LONG_BINPUT", "LONG_BINGET"):
+            return struct.unpack("<I", data)[0]
+        return None
+    
+    if arg.n == pickletools.UP_TO_NEWLINE:
+        line = _read_line(stream)
+        if op.name in ("PUT", "GET"):
+            return int(line)
+        if op.name in ("UNICODE", "STRING"):
+            return line.strip("'\"")
+        return None
+    
+    length_sizes = {
+        pickletools.TAKEN_FROM_ARGUMENT1: ("<B", 1),
+        pickletools.TAKEN_FROM_ARGUMENT4: ("<i", 4),
+        pickletools.TAKEN_FROM_ARGUMENT4U: ("<I", 4),
+        pickletools.TAKEN_FROM_ARGUMENT8U: ("<Q", 8),
+    }
+    fmt, size = length_sizes[arg.n]
+    length = struct.unpack(fmt, _read_exact(stream, size))[0]
+    if length < 0:
+        raise ValueError(f"negative length in {op.name}")
+    
+    if op.name in STRING_OPCODES and length <= MAX_STRING_LENGTH:
+        return _read_exact(stream, length).decode("utf-8", errors="replace")
+    
+    _skip(stream, length, chunk_size)
+    return None
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("unexpected end of pickle stream")
+    return data
+
+
+def _read_line(stream: IO[bytes]) -> str:
+    """Read a newline-terminated argument, keeping at most MAX_STRING_LENGTH bytes."""
+    parts: List[bytes] = []
+    kept = 0
+    while True:
+        chunk = stream.readline(MAX_STRING_LENGTH)
+        if not chunk:
+            raise ValueError("unexpected end of pickle stream")
+        if kept < MAX_STRING_LENGTH:
+            parts.append(chunk[:MAX_STRING_LENGTH - kept])
+            kept += len(parts[-1])
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(parts).rstrip(b"\r\n").decode("utf-8", errors="replace")
+
+
+def _skip(stream: IO[bytes], length: int, chunk_size: int) -> None:
+    """Skip a payload without holding more than one chunk in memory."""
+    remaining = length
+    while remaining > 0:
+        data = stream.read(min(remaining, chunk_size))
+        if not data:
+            raise ValueError("unexpected end of pickle stream")
+        remaining -= len(data)
@@ -0,0 +1,212 @@
+"""Client-side rate limiting for Hugging Face Hub requests."""
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from ..config.settings import HuggingFaceSettings
+
+# Responses that mean "slow down and try again"
+RETRYABLE_STATUS_CODES = {429, 503}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Callers reserve a token and are told how long to wait before using it,
+    so waiting happens outside the lock and callers are served in order.
+    The bucket is shared across event loops and threads.
+    """
+    
+    def __init__(self, rate_per_minute: float, burst: int):
+        self._lock = threading.Lock()
+        self._rate = rate_per_minute / 60.0
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+    
+    @property
+    def rate_per_minute(self) -> float:
+        return self._rate * 60.0
+    
+    def set_rate(self, rate_per_minute: float) -> None:
+        """Change the refill rate, keeping the tokens accumulated so far."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = rate_per_minute / 60.0
+    
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for at least `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Drain the burst so requests resume at the steady rate
+            self._tokens = min(self._tokens, 0.0)
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class HubRateLimiter:
+    """
+    Paces Hub requests and retries throttled ones.
+    
+    API requests (/api/*) take a token from a bucket sized for the current
+    authentication tier. File resolves and downloads (hf_hub_download,
+    snapshot_download, safetensors range reads) are limited separately by
+    the Hub, so they draw from their own bucket, or are not paced at all
+    when `rate_limit_resolve_rpm` is 0. A 429 or 503 response pauses the
+    callers of the same bucket for the server's Retry-After, or for a
+    jittered exponential backoff when the server gives none, and the
+    request is retried.
+    """
+    
+    def __init__(self, settings: HuggingFaceSettings, authenticated: bool = False):
+        self.settings = settings
+        self.bucket = TokenBucket(self._rate_for(authenticated), settings.rate_limit_burst)
+        self.resolve_bucket: Optional[TokenBucket] = None
+        if settings.rate_limit_resolve_rpm > 0:
+            self.resolve_bucket = TokenBucket(settings.rate_limit_resolve_rpm, settings.rate_limit_resolve_burst)
+        self._counters_lock = threading.Lock()
+        self.counters: Dict[str, float] = {
+            "requests": 0,
+            "throttled": 0,
+            "retries": 0,
+            "gave_up": 0,
+            "wait_seconds": 0.0,
+        }
+    
+    def set_authenticated(self, authenticated: bool) -> None:
+        """Switch the bucket to the anonymous or authenticated request rate."""
+        rate = self._rate_for(authenticated)
+        if rate != self.bucket.rate_per_minute:
+            logger.info(f"Hub request rate set to {rate:.0f} per minute")
+            self.bucket.set_rate(rate)
+    
+    async def call(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        description: str = "Hub request",
+        resolve: bool = False
+    ) -> Any:
+        """
+        Run a Hub request under the rate limit, retrying when throttled.
+        
+        Args:
+            run: Zero-argument coroutine function performing the request
+            description: Label used in log messages
+            resolve: Whether this is file resolve/download traffic rather than an API call
+        
+        Returns:
+            Result of the request
+        """
+        bucket = self.resolve_bucket if resolve else self.bucket
+        attempt = 0
+        while True:
+            await self.acquire(resolve)
+            self._count("requests")
+            
+            try:
+                return await run()
+            except Exception as e:
+                status_code = self._status_code(e)
+                if status_code not in RETRYABLE_STATUS_CODES:
+                    raise
+                
+                self._count("throttled")
+                if attempt >= self.settings.rate_limit_max_retries:
+                    self._count("gave_up")
+                    logger.error(f"{description} still throttled after {attempt} retries")
+                    raise
+                
+                delay = self._retry_after(e)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                attempt += 1
+                self._count("retries")
+                
+                logger.warning(
+                    f"{description} throttled (HTTP {status_code}), "
+                    f"retry {attempt}/{self.settings.rate_limit_max_retries} in {delay:.1f}s"
+                )
+                if bucket is not None:
+                    bucket.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the throttling counters and current rate."""
+        with self._counters_lock:
+            stats: Dict[str, Any] = dict(self.counters)
+        stats["rate_per_minute"] = self.bucket.rate_per_minute
+        stats["resolve_rate_per_minute"] = (
+            self.resolve_bucket.rate_per_minute if self.resolve_bucket is not None else None
+        )
+        return stats
+    
+    async def acquire(self, resolve: bool = False) -> None:
+        """Wait for a token; for requests that cannot simply be retried."""
+        bucket = self.resolve_bucket if resolve else self.bucket
+        if bucket is None:
+            return
+        wait = bucket.reserve()
+        if wait > 0:
+            self._count("wait_seconds", wait)
+            await asyncio.sleep(wait)
+    
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._counters_lock:
+            self.counters[name] += amount
+    
+    def _rate_for(self, authenticated: bool) -> float:
+        if authenticated:
+            return self.settings.rate_limit_authenticated_rpm
+        return self.settings.rate_limit_anonymous_rpm
+    
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(self.settings.rate_limit_backoff_max, self.settings.rate_limit_backoff_base * 2 ** attempt)
+        return random.uniform(0, ceiling)
+    
+    @staticmethod
+    def _status_code(error: Exception) -> Optional[int]:
+        response = getattr(error, 'response', None)
+        return getattr(response, 'status_code', None)
+    
+    def _retry_after(self, error: Exception) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        
+        return max(seconds, 0.0)
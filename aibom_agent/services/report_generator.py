@@ -1,22 +1,26 @@
 """Report generator for creating HTML reports from analysis results."""
 
+import asyncio
 import json
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from jinja2 import Environment, FileSystemLoader, Template
 from loguru import logger
 
-from ..models.analysis_result import AnalysisResult, ComparisonResult
+from ..models.analysis_result import AnalysisResult, ComparisonResult, RevisionAIBOM
+from .aibom_serializer import AIBOMSerializer
 
 
 class ReportGenerator:
     """Service for generating HTML reports from AIBOM analysis results."""
     
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, pretty_json: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.serializer = AIBOMSerializer(pretty=pretty_json)
         
         # Initialize Jinja2 environment
         self.jinja_env = Environment(
@@ -110,6 +114,54 @@ class ReportGenerator:
             logger.error(f"Failed to generate comparison report: {e}")
             raise
     
+    async def write_aibom(self, result: AnalysisResult) -> str:
+        """
+        Write the AIBOM of an analysis as a CycloneDX JSON document.
+        
+        Args:
+            result: AnalysisResult whose AIBOM to write
+            
+        Returns:
+            Path to the written .cdx.json file
+        """
+        version = result.model_info.sha[:12] if result.model_info.sha else datetime.now().strftime('%Y%m%d_%H%M%S')
+        aibom_path = self.output_dir / f"aibom_{result.model_name.replace('/', '_')}_{version}.cdx.json"
+        
+        written = await asyncio.get_event_loop().run_in_executor(
+            None, self.serializer.write_file, result.aibom, aibom_path
+        )
+        
+        logger.info(f"CycloneDX AIBOM written: {aibom_path} ({written} bytes, {self.serializer.backend})")
+        return str(aibom_path)
+    
+    async def generate_backfill_report(self, model_name: str, results: List[RevisionAIBOM]) -> str:
+        """
+        Write the AIBOMs of a revision backfill as a JSON document.
+        
+        Args:
+            model_name: Name of the model
+            results: Per-revision AIBOMs, oldest first
+            
+        Returns:
+            Path to the generated JSON file
+        """
+        logger.info(f"Writing revision backfill for {model_name} ({len(results)} revisions)")
+        
+        report_filename = f"aibom_backfill_{model_name.replace('/', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report_path = self.output_dir / report_filename
+        
+        document = {
+            "model_name": model_name,
+            "generated_at": datetime.now().isoformat(),
+            "revisions": [asdict(result) for result in results]
+        }
+        
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, default=str)
+        
+        logger.info(f"Revision backfill written: {report_path}")
+        return str(report_path)
+    
     def _create_default_templates(self) -> None:
         """Create default HTML templates if they don't exist."""
         
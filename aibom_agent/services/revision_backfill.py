@@ -0,0 +1,208 @@
+"""AIBOM generation across the revision history of a model."""
+
+import asyncio
+import glob
+from collections import deque
+from dataclasses import asdict, replace
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from ..config.settings import AIBOMSettings
+from ..models.analysis_result import ModelInfo, ModelRevision, RevisionAIBOM
+from .aibom_generator import AIBOMGenerator, FileClassification
+from .blob_store import content_id
+from .model_source import ModelSource
+from .pickle_scanner import PickleScanner, PickleScanResult
+
+
+def diff_files(
+    previous: Iterable[Dict[str, Any]],
+    current: Iterable[Dict[str, Any]]
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Compare the file lists of two revisions by content.
+    
+    Files without a content address are compared by size.
+    
+    Returns:
+        Tuple of added, modified and removed file names
+    """
+    def identity(file_info: Dict[str, Any]) -> Any:
+        return content_id(file_info) or ("size", file_info.get("size"))
+    
+    before = {f["name"]: identity(f) for f in previous}
+    after = {f["name"]: identity(f) for f in current}
+    
+    added = [name for name in after if name not in before]
+    modified = [name for name in after if name in before and before[name] != after[name]]
+    removed = [name for name in before if name not in after]
+    return added, modified, removed
+
+
+class RevisionBackfiller:
+    """
+    Generates an AIBOM for every revision of a model.
+    
+    Revisions are processed oldest first. Per-file classification results,
+    safetensors headers and pickle scans are keyed by file content, so each
+    revision only does work for the files that changed since the previous
+    one; everything else is reused.
+    """
+    
+    def __init__(
+        self,
+        model_source: ModelSource,
+        aibom_generator: AIBOMGenerator,
+        pickle_scanner: PickleScanner,
+        settings: AIBOMSettings
+    ):
+        self.model_source = model_source
+        self.aibom_generator = aibom_generator
+        self.pickle_scanner = pickle_scanner
+        self.settings = settings
+    
+    async def backfill(self, model_name: str, max_revisions: Optional[int] = None) -> List[RevisionAIBOM]:
+        """
+        Generate AIBOMs for the history of a model.
+        
+        Args:
+            model_name: Name of the model
+            max_revisions: Only process the most recent N revisions
+        
+        Returns:
+            One RevisionAIBOM per revision, oldest first; revisions that could
+            not be fetched or processed carry an error instead of an AIBOM
+        """
+        revisions = await self.model_source.list_revisions(model_name)
+        if max_revisions:
+            revisions = revisions[-max_revisions:]
+        logger.info(f"Backfilling AIBOMs for {len(revisions)} revisions of {model_name}")
+        
+        file_memo: Dict[Tuple, FileClassification] = {}
+        scan_memo: Dict[str, PickleScanResult] = {}
+        previous_files: Iterable[Dict[str, Any]] = []
+        results = []
+        
+        async for revision, model_info, error in self._fetch_revisions(model_name, revisions):
+            if error is None:
+                try:
+                    result = await self._process_revision(model_info, revision, previous_files, file_memo, scan_memo)
+                except Exception as e:
+                    error = e
+                else:
+                    previous_files = model_info.files
+            
+            if error is not None:
+                # A gated, deleted or broken revision does not stop the backfill
+                logger.warning(f"{model_name}@{revision.sha[:8]}: skipped ({error})")
+                result = RevisionAIBOM(model_name=model_name, revision=revision, aibom=None, error=str(error))
+            results.append(result)
+        
+        return results
+    
+    async def _process_revision(
+        self,
+        model_info: ModelInfo,
+        revision: ModelRevision,
+        previous_files: Iterable[Dict[str, Any]],
+        file_memo: Dict[Tuple, FileClassification],
+        scan_memo: Dict[str, PickleScanResult]
+    ) -> RevisionAIBOM:
+        """Generate the AIBOM of one revision, reusing work for unchanged files."""
+        added, modified, removed = diff_files(previous_files, model_info.files)
+        
+        aibom = await self.aibom_generator.generate_aibom(model_info, file_memo)
+        
+        pickle_findings = []
+        if self.settings.deep_scan_enabled:
+            scan_results = await self._scan_pickles(model_info, scan_memo)
+            pickle_findings = [asdict(result) for result in scan_results]
+        
+        reused = len(model_info.files) - len(added) - len(modified)
+        logger.info(
+            f"{model_info.name}@{revision.sha[:8]}: {len(added)} added, {len(modified)} modified, "
+            f"{len(removed)} removed, {reused} reused"
+        )
+        
+        return RevisionAIBOM(
+            model_name=model_info.name,
+            revision=revision,
+            aibom=aibom,
+            added_files=added,
+            modified_files=modified,
+            removed_files=removed,
+            reused_files=reused,
+            pickle_findings=pickle_findings
+        )
+    
+    async def _fetch_revisions(
+        self,
+        model_name: str,
+        revisions: List[ModelRevision]
+    ) -> AsyncIterator[Tuple[ModelRevision, Optional[ModelInfo], Optional[Exception]]]:
+        """
+        Yield (revision, model info, error) in order, fetching ahead in a bounded window.
+        
+        At most `max_concurrency` revisions are fetched or held at a time,
+        so memory does not grow with the length of the history.
+        """
+        window = max(1, self.model_source.max_concurrency)
+        remaining = iter(revisions)
+        pending: Deque[Tuple[ModelRevision, "asyncio.Future[ModelInfo]"]] = deque()
+        
+        def fill() -> None:
+            while len(pending) < window:
+                revision = next(remaining, None)
+                if revision is None:
+                    return
+                fetch = self.model_source.get_model_info(model_name, revision=revision.sha)
+                pending.append((revision, asyncio.ensure_future(fetch)))
+        
+        try:
+            fill()
+            while pending:
+                revision, future = pending.popleft()
+                try:
+                    model_info = await future
+                except Exception as e:
+                    model_info, error = None, e
+                else:
+                    error = None
+                # Fetch the next revision while this one is processed
+                fill()
+                yield revision, model_info, error
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    async def _scan_pickles(
+        self,
+        model_info: ModelInfo,
+        scan_memo: Dict[str, PickleScanResult]
+    ) -> List[PickleScanResult]:
+        """Scan the pickle-based files of a revision, reusing results for unchanged content."""
+        pickle_files = model_info.files.matching(self.settings.pickle_scan_patterns)
+        
+        to_scan = [f for f in pickle_files if content_id(f) not in scan_memo]
+        if to_scan:
+            # download_model_files takes fnmatch patterns; match these names literally
+            local_files = await self.model_source.download_model_files(
+                model_info.name, [glob.escape(f["name"]) for f in to_scan], revision=model_info.sha
+            )
+            scanned = {result.file_name: result for result in await self.pickle_scanner.scan_files(local_files)}
+            for file_info in to_scan:
+                file_content = content_id(file_info)
+                if file_content is not None and file_info["name"] in scanned:
+                    scan_memo[file_content] = scanned[file_info["name"]]
+        else:
+            scanned = {}
+        
+        results = []
+        for file_info in pickle_files:
+            if file_info["name"] in scanned:
+                results.append(scanned[file_info["name"]])
+            elif content_id(file_info) in scan_memo:
+                # Same bytes as an earlier revision, possibly under another name
+                results.append(replace(scan_memo[content_id(file_info)], file_name=file_info["name"]))
+        return results
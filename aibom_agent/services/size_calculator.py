@@ -0,0 +1,135 @@
+"""Exact model size computation from repository file metadata."""
+
+import posixpath
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Weight file extensions and the serialization format they belong to
+WEIGHT_FORMATS = {
+    ".safetensors": "safetensors",
+    ".bin": "pytorch",
+    ".pt": "pytorch",
+    ".pth": "pytorch",
+    ".ckpt": "pytorch",
+    ".h5": "tensorflow",
+    ".keras": "tensorflow",
+    ".tflite": "tflite",
+    ".msgpack": "flax",
+    ".onnx": "onnx",
+    ".gguf": "gguf",
+    ".ggml": "ggml",
+}
+
+# Pickled training state that shares weight extensions but is not model weights
+NON_WEIGHT_STEMS = {"training_args", "optimizer", "scheduler", "scaler", "trainer_state"}
+
+# When a directory ships the same weights in several formats, a loader only
+# pulls one of them. Earlier entries win.
+FORMAT_PREFERENCE = [
+    "safetensors",
+    "pytorch",
+    "tensorflow",
+    "flax",
+    "onnx",
+    "gguf",
+    "ggml",
+    "tflite",
+]
+
+# e.g. model-00001-of-00004.safetensors, pytorch_model-00002-of-00002.bin
+SHARD_PATTERN = re.compile(r"^(?P<stem>.+?)-(?P<index>\d+)-of-(?P<count>\d+)$")
+
+
+class ModelSizeCalculator:
+    """
+    Computes model sizes from Hub file metadata without downloading anything.
+    
+    Sharded checkpoints are grouped into a single logical checkpoint, and
+    weights duplicated across formats in the same directory (for example
+    both pytorch_model.bin and model.safetensors) are only counted once in
+    the weights total.
+    """
+    
+    def calculate(self, files: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute the size breakdown for a repository.
+        
+        Args:
+            files: File entries with "name" and "size" keys
+        
+        Returns:
+            Dictionary with total bytes, single-copy weights bytes, bytes per
+            weight format and the list of logical checkpoints
+        """
+        total_bytes = 0
+        unknown_size_files = 0
+        checkpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        for file_info in files:
+            size = file_info.get("size")
+            if size is None:
+                unknown_size_files += 1
+                size = 0
+            total_bytes += size
+            
+            weight_format, checkpoint_name, shard_count = self._parse_weight_file(file_info["name"])
+            if weight_format is None:
+                continue
+            
+            key = (checkpoint_name, weight_format)
+            checkpoint = checkpoints.setdefault(key, {
+                "name": checkpoint_name,
+                "format": weight_format,
+                "bytes": 0,
+                "shards": 0,
+                "expected_shards": shard_count,
+            })
+            checkpoint["bytes"] += size
+            checkpoint["shards"] += 1
+        
+        bytes_by_format: Dict[str, int] = defaultdict(int)
+        formats_by_directory: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        
+        for checkpoint in checkpoints.values():
+            bytes_by_format[checkpoint["format"]] += checkpoint["bytes"]
+            directory = posixpath.dirname(checkpoint["name"])
+            formats_by_directory[directory][checkpoint["format"]] += checkpoint["bytes"]
+        
+        weights_bytes = sum(
+            directory_formats[self._preferred_format(directory_formats)]
+            for directory_formats in formats_by_directory.values()
+        )
+        
+        return {
+            "total_bytes": total_bytes,
+            "weights_bytes": weights_bytes,
+            "bytes_by_format": dict(bytes_by_format),
+            "checkpoints": sorted(checkpoints.values(), key=lambda c: (c["name"], c["format"])),
+            "unknown_size_files": unknown_size_files,
+        }
+    
+    def _parse_weight_file(
+        self,
+        file_name: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        """Return (format, logical checkpoint name, expected shard count) for a file."""
+        directory, base_name = posixpath.split(file_name)
+        stem, extension = posixpath.splitext(base_name)
+        weight_format = WEIGHT_FORMATS.get(extension.lower())
+        if weight_format is None or stem in NON_WEIGHT_STEMS or stem.startswith("rng_state"):
+            return None, None, None
+        
+        shard_count: Optional[int] = 1
+        match = SHARD_PATTERN.match(stem)
+        if match:
+            stem = match.group("stem")
+            shard_count = int(match.group("count"))
+        
+        return weight_format, posixpath.join(directory, stem + extension), shard_count
+    
+    def _preferred_format(self, directory_formats: Dict[str, int]) -> str:
+        for weight_format in FORMAT_PREFERENCE:
+            if weight_format in directory_formats:
+                return weight_format
+        return max(directory_formats, key=directory_formats.get)
@@ -14,6 +14,7 @@ from rich.panel import Panel
 
 from aibom_agent.core.agent_orchestrator import AIBOMAgentOrchestrator
 from aibom_agent.config.settings import Settings
+from aibom_agent.services.aibom_validator import AIBOMValidationService
 
 console = Console()
 
@@ -42,11 +43,28 @@ def cli():
     "-c",
     help="Path to configuration file",
 )
+@click.option(
+    "--deep-scan",
+    is_flag=True,
+    help="Download pickle-based weights and scan them for unsafe imports",
+)
+@click.option(
+    "--source",
+    type=click.Choice(["hub", "local", "archive"]),
+    help="Where to read models from (defaults to the Hugging Face Hub)",
+)
+@click.option(
+    "--source-path",
+    help="Model directory, Hugging Face cache or archive for local/archive sources",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def analyze(
     models: tuple[str, ...],
     output_dir: str,
     config_file: str | None,
+    deep_scan: bool,
+    source: str | None,
+    source_path: str | None,
     verbose: bool,
 ) -> None:
     """Analyze AI models locally (for development/testing)."""
@@ -68,6 +86,12 @@ def analyze(
         # Load configuration
         settings = Settings.load(config_file)
         settings.output_dir = output_dir
+        if deep_scan:
+            settings.aibom.deep_scan_enabled = True
+        if source:
+            settings.model_source = source
+        if source_path:
+            settings.model_source_path = source_path
         
         # Initialize orchestrator
         orchestrator = AIBOMAgentOrchestrator(settings, "cli-session")
@@ -86,6 +110,169 @@ def analyze(
         sys.exit(1)
 
 
+@cli.command()
+@click.option("--author", "-a", help="Only models owned by this user or organization")
+@click.option("--pipeline-tag", "-p", help="Only models with this task, e.g. text-generation")
+@click.option("--search", "-s", help="Substring to match against model names")
+@click.option("--tag", "-t", "tags", multiple=True, help="Only models with this tag (can specify multiple)")
+@click.option("--min-downloads", type=int, help="Only models with at least this many downloads")
+@click.option("--limit", "-n", type=int, help="Maximum number of models to analyze")
+@click.option("--concurrency", type=int, help="Number of models analyzed at once")
+@click.option(
+    "--output-dir",
+    "-o",
+    default="./reports",
+    help="Output directory for generated reports",
+)
+@click.option(
+    "--config-file",
+    "-c",
+    help="Path to configuration file",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def crawl(
+    author: str | None,
+    pipeline_tag: str | None,
+    search: str | None,
+    tags: tuple[str, ...],
+    min_downloads: int | None,
+    limit: int | None,
+    concurrency: int | None,
+    output_dir: str,
+    config_file: str | None,
+    verbose: bool,
+) -> None:
+    """Analyze every Hub model matching the given filters."""
+    
+    # Configure logging
+    logger.remove()
+    log_level = "DEBUG" if verbose else "INFO"
+    logger.add(sys.stderr, level=log_level, format="{time} | {level} | {message}")
+    
+    if not any([author, pipeline_tag, search, tags, min_downloads, limit]):
+        console.print("[yellow]Refusing to crawl the whole Hub. Specify at least one filter or --limit.[/yellow]")
+        sys.exit(1)
+    
+    try:
+        settings = Settings.load(config_file)
+        settings.output_dir = output_dir
+        
+        orchestrator = AIBOMAgentOrchestrator(settings, "cli-session")
+        filters = {
+            "author": author,
+            "pipeline_tag": pipeline_tag,
+            "search": search,
+            "tags": list(tags) or None,
+            "min_downloads": min_downloads,
+            "limit": limit,
+        }
+        asyncio.run(run_crawl(orchestrator, filters, concurrency))
+        
+    except Exception as e:
+        logger.error(f"Failed to crawl models: {e}")
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--model", "-m", required=True, help="Hugging Face model name to backfill")
+@click.option(
+    "--max-revisions",
+    type=int,
+    help="Only process the most recent N revisions",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    default="./reports",
+    help="Output directory for the generated AIBOMs",
+)
+@click.option(
+    "--config-file",
+    "-c",
+    help="Path to configuration file",
+)
+@click.option(
+    "--deep-scan",
+    is_flag=True,
+    help="Download pickle-based weights and scan them for unsafe imports",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def backfill(
+    model: str,
+    max_revisions: int | None,
+    output_dir: str,
+    config_file: str | None,
+    deep_scan: bool,
+    verbose: bool,
+) -> None:
+    """Generate an AIBOM for every historical revision of a model."""
+    
+    # Configure logging
+    logger.remove()
+    log_level = "DEBUG" if verbose else "INFO"
+    logger.add(sys.stderr, level=log_level, format="{time} | {level} | {message}")
+    
+    try:
+        settings = Settings.load(config_file)
+        settings.output_dir = output_dir
+        if deep_scan:
+            settings.aibom.deep_scan_enabled = True
+        
+        orchestrator = AIBOMAgentOrchestrator(settings, "cli-session")
+        report_path = asyncio.run(run_backfill(orchestrator, model, max_revisions))
+        
+        console.print(f"[green]✓[/green] Revision backfill completed for {model}")
+        console.print(f"AIBOMs saved to: {report_path}")
+        
+    except Exception as e:
+        logger.error(f"Failed to backfill revisions: {e}")
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--config-file",
+    "-c",
+    help="Path to configuration file",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def validate(paths: tuple[str, ...], config_file: str | None, verbose: bool) -> None:
+    """Validate CycloneDX AIBOM files (or directories of .cdx.json files) against the schema."""
+    
+    # Configure logging
+    logger.remove()
+    log_level = "DEBUG" if verbose else "INFO"
+    logger.add(sys.stderr, level=log_level, format="{time} | {level} | {message}")
+    
+    files = []
+    for path in paths:
+        if Path(path).is_dir():
+            files.extend(str(p) for p in sorted(Path(path).rglob("*.cdx.json")))
+        else:
+            files.append(path)
+    
+    try:
+        settings = Settings.load(config_file)
+        results = asyncio.run(run_validate(settings, files))
+    except Exception as e:
+        logger.error(f"Failed to validate AIBOMs: {e}")
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    
+    invalid = {path: errors for path, errors in results.items() if errors}
+    for path, errors in invalid.items():
+        console.print(f"[red]✗[/red] {path}: {len(errors)} schema violations")
+        for error in errors[:5]:
+            console.print(f"    {error}")
+    
+    console.print(f"\n{len(results) - len(invalid)} of {len(results)} AIBOMs are valid CycloneDX 1.5")
+    if invalid:
+        sys.exit(1)
+
+
 @cli.command()
 @click.option("--port", "-p", default=8000, help="Port to run the development server on")
 def serve(port: int) -> None:
@@ -179,6 +366,10 @@ def config() -> None:
         console.print(f"  Token: {'Set' if settings.huggingface.token else 'Not set'}")
         console.print(f"  Cache Dir: {settings.huggingface.cache_dir}")
         
+        console.print(f"\n[bold]Model Source:[/bold]")
+        console.print(f"  Type: {settings.model_source}")
+        console.print(f"  Path: {settings.model_source_path or 'Not set'}")
+        
         console.print(f"\n[bold]Output Settings:[/bold]")
         console.print(f"  Output Dir: {settings.output_dir}")
         console.print(f"  Temp Dir: {settings.temp_dir}")
@@ -221,5 +412,54 @@ async def run_local_analysis(
     console.print(f"• Report location: {result.report_path}")
 
 
+async def run_crawl(
+    orchestrator: AIBOMAgentOrchestrator,
+    filters: dict,
+    concurrency: int | None
+) -> None:
+    """Stream crawled models through the analysis pipeline."""
+    analyzed = failed = 0
+    
+    try:
+        async for outcome in orchestrator.analyze_crawl(concurrency=concurrency, **filters):
+            if outcome.succeeded:
+                analyzed += 1
+                console.print(
+                    f"[green]✓[/green] {outcome.model_name}: "
+                    f"{outcome.result.security_issues_count} security issues, "
+                    f"report at {outcome.result.report_path}"
+                )
+            else:
+                failed += 1
+                console.print(f"[red]✗[/red] {outcome.model_name}: {outcome.error}")
+    finally:
+        await orchestrator.cleanup()
+    
+    console.print("\n[bold]Crawl Summary:[/bold]")
+    console.print(f"• Models analyzed: {analyzed}")
+    console.print(f"• Models failed: {failed}")
+
+
+async def run_backfill(
+    orchestrator: AIBOMAgentOrchestrator,
+    model: str,
+    max_revisions: int | None
+) -> str:
+    """Run a revision backfill and release resources afterwards."""
+    try:
+        return await orchestrator.backfill_revisions(model, max_revisions)
+    finally:
+        await orchestrator.cleanup()
+
+
+async def run_validate(settings: Settings, files: list[str]) -> dict:
+    """Validate AIBOM files in parallel batches."""
+    validation = AIBOMValidationService(settings.aibom)
+    try:
+        return await validation.validate_files(files)
+    finally:
+        await validation.cleanup()
+
+
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -51,6 +51,11 @@ def invoke(payload: Dict[str, Any], context) -> Dict[str, Any]:
         "model_names": ["microsoft/DialoGPT-medium", "facebook/blenderbot-400M-distill"]
     }
     
+    Service status (model source and Hugging Face authentication):
+    {
+        "action": "status"
+    }
+    
     Args:
         payload: Request payload with action and parameters
         context: AgentCore request context with session_id
@@ -118,10 +123,17 @@ def invoke(payload: Dict[str, Any], context) -> Dict[str, Any]:
                 }
             }
             
+        elif action == "status":
+            return {
+                "success": True,
+                "action": "status",
+                **orch.status()
+            }
+            
         else:
             return {
                 "error": f"Unknown action: {action}",
-                "supported_actions": ["analyze_model", "compare_models"]
+                "supported_actions": ["analyze_model", "compare_models", "status"]
             }
             
     except Exception as e:
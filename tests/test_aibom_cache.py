@@ -0,0 +1,93 @@
+"""Tests for the AIBOM cache and how the generator uses it."""
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings, HuggingFaceSettings
+from aibom_agent.models.analysis_result import AIBOM, ModelInfo
+from aibom_agent.services.aibom_cache import AIBOMCache
+from aibom_agent.services.aibom_generator import AIBOMGenerator
+
+SHA = "b" * 40
+
+
+def make_aibom(serial="urn:uuid:1") -> AIBOM:
+    return AIBOM(
+        bom_format="CycloneDX", spec_version="1.5", serial_number=serial, version=1,
+        metadata={}, components=[], dependencies=[], vulnerabilities=[], compositions=[]
+    )
+
+
+def make_model_info(**overrides) -> ModelInfo:
+    fields = dict(
+        name="org/model", author="org", description="d", tags=[], pipeline_tag=None,
+        library_name=None, license="mit", downloads=0, likes=0, created_at="",
+        last_modified="", model_size=None, config={},
+        files=[{"name": "model.safetensors", "size": 3, "blob_id": None, "sha256": "a" * 64}], sha=SHA
+    )
+    fields.update(overrides)
+    return ModelInfo(**fields)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    settings = AIBOMSettings(cache_dir=str(tmp_path), validation_mode="off")
+    return AIBOMGenerator(settings, HuggingFaceSettings())
+
+
+def test_entries_are_keyed_by_version_and_config(tmp_path):
+    cache = AIBOMCache(str(tmp_path), max_bytes=1 << 20)
+    cache.put("org/model", SHA, "1.0", "config-a", make_aibom())
+    
+    assert cache.get("org/model", SHA, "1.0", "config-a") == make_aibom()
+    assert cache.get("org/model", SHA, "1.1", "config-a") is None
+    assert cache.get("org/model", SHA, "1.0", "config-b") is None
+    assert cache.get("org/model", "c" * 40, "1.0", "config-a") is None
+
+
+def test_only_commit_pinned_content_is_cached(tmp_path):
+    cache = AIBOMCache(str(tmp_path), max_bytes=1 << 20)
+    cache.put("org/model", "main", "1.0", "config", make_aibom())
+    cache.put("org/model", None, "1.0", "config", make_aibom())
+    
+    assert cache.get("org/model", "main", "1.0", "config") is None
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_incompatible_entries_are_dropped(tmp_path):
+    cache = AIBOMCache(str(tmp_path), max_bytes=1 << 20)
+    cache.store.put(cache._key("org/model", SHA, "1.0", "config"), {"unexpected": 1})
+    
+    assert cache.get("org/model", SHA, "1.0", "config") is None
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_config_hash_follows_output_settings(generator):
+    before = generator.config_hash
+    
+    generator.source_settings.inspect_safetensors = not generator.source_settings.inspect_safetensors
+    assert generator.config_hash != before
+    
+    generator.source_settings.inspect_safetensors = not generator.source_settings.inspect_safetensors
+    generator.settings.include_dependencies = not generator.settings.include_dependencies
+    assert generator.config_hash != before
+
+
+@pytest.mark.asyncio
+async def test_generator_reuses_cached_aiboms(generator):
+    await generator.initialize()
+    
+    first = await generator.generate_aibom(make_model_info())
+    second = await generator.generate_aibom(make_model_info(description="changed"))
+    
+    # Same commit, generator and config: served from the cache
+    assert second.serial_number == first.serial_number
+    assert second.content_hash == first.content_hash
+
+
+@pytest.mark.asyncio
+async def test_generator_does_not_cache_incomplete_inputs(generator):
+    await generator.initialize()
+    
+    await generator.generate_aibom(make_model_info(incomplete=["safetensors:model.safetensors"]))
+    
+    assert generator.cache.get("org/model", SHA, generator.generator_version, generator.config_hash) is None
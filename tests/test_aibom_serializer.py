@@ -0,0 +1,92 @@
+"""Tests for streaming AIBOM serialization."""
+
+import io
+import json
+
+import pytest
+
+from aibom_agent.models.analysis_result import AIBOM
+from aibom_agent.services import aibom_serializer
+from aibom_agent.services.aibom_serializer import CHUNK_SIZE, AIBOMSerializer
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(
+    aibom_serializer.orjson is None, reason="orjson is not installed"
+))]
+
+
+def make_aibom(components: int = 3) -> AIBOM:
+    return AIBOM(
+        bom_format="CycloneDX", spec_version="1.5", serial_number="urn:uuid:1", version=1,
+        metadata={"component": {"name": "org/modèle", "description": "line one\nline two"}},
+        components=[
+            {"type": "file", "bom-ref": f"file-{i}", "name": f"shard-{i}.safetensors",
+             "properties": [{"name": "aibom:format", "value": "safetensors"}]}
+            for i in range(components)
+        ],
+        dependencies=[{"ref": "org/modèle", "dependsOn": ["pkg:pypi/torch"]}],
+        vulnerabilities=[],
+        compositions=[],
+        generated_at="2024-01-01T00:00:00+00:00"
+    )
+
+
+def expected_bytes(aibom: AIBOM, pretty: bool) -> bytes:
+    if pretty:
+        return json.dumps(aibom.to_cyclonedx(), indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(aibom.to_cyclonedx(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", BACKENDS)
+@pytest.mark.parametrize("pretty", [False, True])
+def test_matches_a_single_dump(pretty, use_orjson):
+    aibom = make_aibom()
+    
+    output = b"".join(AIBOMSerializer(pretty=pretty, use_orjson=use_orjson).iter_chunks(aibom))
+    
+    assert output == expected_bytes(aibom, pretty)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_large_documents_are_chunked(pretty):
+    aibom = make_aibom(components=2000)
+    serializer = AIBOMSerializer(pretty=pretty, use_orjson=False)
+    
+    chunks = list(serializer.iter_chunks(aibom))
+    
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2 * CHUNK_SIZE for chunk in chunks)
+    assert b"".join(chunks) == expected_bytes(aibom, pretty)
+
+
+def test_write_file_replaces_atomically(tmp_path):
+    path = tmp_path / "out" / "aibom.json"
+    aibom = make_aibom()
+    
+    written = AIBOMSerializer(use_orjson=False).write_file(aibom, path)
+    
+    assert written == path.stat().st_size
+    assert json.loads(path.read_bytes()) == aibom.to_cyclonedx()
+    assert [p.name for p in path.parent.iterdir()] == ["aibom.json"]
+
+
+@pytest.mark.asyncio
+async def test_stream_drains_after_each_chunk():
+    class Writer:
+        def __init__(self):
+            self.buffer = io.BytesIO()
+            self.drains = 0
+        
+        def write(self, data):
+            self.buffer.write(data)
+        
+        async def drain(self):
+            self.drains += 1
+    
+    writer = Writer()
+    aibom = make_aibom(components=2000)
+    
+    written = await AIBOMSerializer(use_orjson=False).stream(aibom, writer)
+    
+    assert written == len(writer.buffer.getvalue())
+    assert writer.drains > 1
+    assert writer.buffer.getvalue() == expected_bytes(aibom, pretty=False)
@@ -0,0 +1,142 @@
+"""Tests for CycloneDX schema validation of AIBOMs."""
+
+import copy
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings, HuggingFaceSettings
+from aibom_agent.models.analysis_result import AIBOM, ModelInfo
+from aibom_agent.services.aibom_generator import AIBOMGenerator
+from aibom_agent.services.aibom_validator import AIBOMValidationError, AIBOMValidationService, AIBOMValidator
+
+MODEL = "org/model"
+
+DOCUMENT = {
+    "bomFormat": "CycloneDX",
+    "specVersion": "1.5",
+    "serialNumber": "urn:uuid:3e671687-395b-41f5-a30f-a58921a69b79",
+    "version": 1,
+    "metadata": {"component": {"type": "machine-learning-model", "bom-ref": MODEL, "name": MODEL}},
+    "components": [
+        {"type": "file", "bom-ref": "model.safetensors", "name": "model.safetensors"},
+        {"type": "library", "bom-ref": "pkg:pypi/torch", "name": "torch", "purl": "pkg:pypi/torch"},
+    ],
+    "dependencies": [{"ref": MODEL, "dependsOn": ["pkg:pypi/torch"]}],
+    "vulnerabilities": [],
+    "compositions": [],
+}
+
+
+@pytest.fixture(scope="module")
+def validator():
+    try:
+        return AIBOMValidator()
+    except ImportError as e:
+        pytest.skip(f"CycloneDX JSON validation is not installed: {e}")
+
+
+def make_model_info() -> ModelInfo:
+    return ModelInfo(
+        name=MODEL, author="org", description=None, tags=[], pipeline_tag=None,
+        library_name="transformers", license=None, downloads=0, likes=0, created_at="",
+        last_modified="2024-01-01T00:00:00+00:00", model_size=None, config={"torch_dtype": "float32"},
+        files=[
+            {"name": name, "size": 3, "blob_id": "b" * 40, "sha256": None}
+            for name in ["model.safetensors", "pytorch_model.bin", "config.json", "tokenizer.model", "modeling_x.py"]
+        ],
+        sha="c" * 40
+    )
+
+
+def test_valid_document(validator):
+    assert validator.validate_document(DOCUMENT) == []
+
+
+def test_element_errors_point_into_the_document(validator):
+    document = copy.deepcopy(DOCUMENT)
+    document["components"][1]["type"] = "model-weights"
+    document["components"][0]["supplier"] = "org"
+    
+    errors = validator.validate_document(document)
+    
+    assert any(error.startswith("/components/1/type:") for error in errors)
+    assert any(error.startswith("/components/0/supplier:") for error in errors)
+
+
+def test_duplicate_section_items(validator):
+    document = copy.deepcopy(DOCUMENT)
+    document["dependencies"].append(copy.deepcopy(document["dependencies"][0]))
+    
+    errors = validator.validate_document(document)
+    
+    assert "/dependencies/1: duplicate of /dependencies/0 (uniqueItems)" in errors
+    assert any(error.startswith("/dependencies/1/ref:") and "already has an entry" in error for error in errors)
+
+
+def test_duplicate_bom_refs(validator):
+    document = copy.deepcopy(DOCUMENT)
+    document["components"][1]["bom-ref"] = "model.safetensors"
+    document["dependencies"] = []
+    
+    errors = validator.validate_document(document)
+    
+    assert errors == ["/components/1/bom-ref: 'model.safetensors' is already used by /components/0"]
+
+
+def test_duplicate_depends_on(validator):
+    document = copy.deepcopy(DOCUMENT)
+    document["dependencies"][0]["dependsOn"].append("pkg:pypi/torch")
+    
+    assert [error for error in validator.validate_document(document) if error.startswith("/dependencies/0/dependsOn")]
+
+
+def test_dangling_dependency_refs(validator):
+    document = copy.deepcopy(DOCUMENT)
+    document["dependencies"] = [{"ref": "other", "dependsOn": ["pkg:pypi/numpy"]}]
+    
+    assert validator.validate_document(document) == [
+        "/dependencies/0/ref: 'other' does not match any bom-ref",
+        "/dependencies/0/dependsOn/0: 'pkg:pypi/numpy' does not match any bom-ref",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generated_aibom_is_valid(validator, tmp_path):
+    settings = AIBOMSettings(cache_enabled=False, validation_mode="strict", cache_dir=str(tmp_path))
+    generator = AIBOMGenerator(settings, HuggingFaceSettings())
+    generator.validation.validator = validator
+    
+    aibom = await generator.generate_aibom(make_model_info())
+    
+    assert aibom.validation_errors == []
+    assert aibom.dependency_components()
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_raises_instead_of_falling_back(tmp_path):
+    class RejectingValidator:
+        def validate(self, aibom, sections=None):
+            return ["/components/0/type: not allowed"]
+    
+    settings = AIBOMSettings(cache_enabled=False, validation_mode="strict", cache_dir=str(tmp_path))
+    generator = AIBOMGenerator(settings, HuggingFaceSettings())
+    generator.validation.validator = RejectingValidator()
+    
+    with pytest.raises(AIBOMValidationError) as raised:
+        await generator.generate_aibom(make_model_info())
+    assert raised.value.errors == ["/components/0/type: not allowed"]
+
+
+def test_warn_mode_records_errors():
+    class RejectingValidator:
+        def validate(self, aibom, sections=None):
+            return ["/version: bad"]
+    
+    service = AIBOMValidationService(AIBOMSettings(validation_mode="warn"))
+    service.validator = RejectingValidator()
+    aibom = AIBOM(
+        bom_format="CycloneDX", spec_version="1.5", serial_number="urn:uuid:1", version=1,
+        metadata={}, components=[], dependencies=[], vulnerabilities=[], compositions=[]
+    )
+    
+    assert service.check(aibom, MODEL).validation_errors == ["/version: bad"]
@@ -0,0 +1,156 @@
+"""Tests for dependency inference from repository files."""
+
+import json
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings, HuggingFaceSettings
+from aibom_agent.models.analysis_result import ModelInfo
+from aibom_agent.services.aibom_generator import AIBOMGenerator
+from aibom_agent.services.dependency_inference import (
+    DependencyInferrer, dependency_component, parse_requirement, tomllib
+)
+
+needs_toml = pytest.mark.skipif(tomllib is None, reason="no TOML parser available")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Write repository files and return the small_files mapping for them."""
+    def repo(**files):
+        small_files = {}
+        for name, content in files.items():
+            name = name.replace("__", "/")
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content if isinstance(content, str) else json.dumps(content))
+            small_files[name] = str(path)
+        return small_files
+    return repo
+
+
+def by_name(dependencies):
+    return {dependency["name"]: dependency for dependency in dependencies}
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("torch==2.1.0", ("torch", "2.1.0")),
+    ("transformers[torch] >= 4.30, <5 ; python_version > '3.8'", ("transformers", ">=4.30,<5")),
+    ("numpy", ("numpy", "unknown")),
+    ("# comment", None),
+    ("-r other.txt", None),
+    ("git+https://github.com/org/repo.git", None),
+])
+def test_parse_requirement(line, expected):
+    assert parse_requirement(line) == expected
+
+
+def test_infers_from_config_and_packaging_files(repo):
+    small_files = repo(**{
+        "config.json": {"transformers_version": "4.40.0", "torch_dtype": "bfloat16",
+                        "architectures": ["LlamaForCausalLM"], "auto_map": {"AutoModel": "org/other--modeling.Model"}},
+        "requirements.txt": "torch>=2.0\nnumpy==1.26.4\n",
+        "setup.py": "from setuptools import setup\nsetup(name='x', install_requires=['einops>=0.7'])\n",
+        "1_Pooling__config_sentence_transformers.json": {"__version__": {"sentence_transformers": "2.2.2", "pytorch": "2.1.0"}},
+    })
+    
+    found = by_name(DependencyInferrer().infer({"library_name": "transformers", "small_files": small_files}))
+    
+    assert found["transformers"]["version"] == "4.40.0"
+    assert found["transformers"]["architectures"] == ["LlamaForCausalLM"]
+    assert found["transformers"]["sources"] == ["model card library_name", "config.json"]
+    assert found["torch"]["version"] == "2.1.0"
+    assert found["torch"]["dtype"] == "bfloat16"
+    assert found["numpy"]["version"] == "1.26.4"
+    assert found["einops"]["version"] == ">=0.7"
+    assert found["org/other/modeling.py"]["type"] == "remote-code"
+
+
+def test_results_do_not_leak_between_calls(repo):
+    inferrer = DependencyInferrer()
+    inferrer.infer({"small_files": repo(**{"requirements.txt": "torch\n"})})
+    
+    assert inferrer.infer({"small_files": {}}) == []
+
+
+@pytest.mark.parametrize("setup_args", ["install_requires=[1, 'torch']", "install_requires='torch>=2'", "install_requires=(1, 2)"])
+def test_setup_py_with_unexpected_types(repo, setup_args):
+    small_files = repo(**{"setup.py": f"from setuptools import setup\nsetup({setup_args})\n"})
+    
+    found = by_name(DependencyInferrer().infer({"small_files": small_files}))
+    
+    assert set(found) <= {"torch"}
+    assert all(len(name) > 1 for name in found)
+
+
+@needs_toml
+@pytest.mark.parametrize("pyproject", [
+    "project = 1\n",
+    "[project]\ndependencies = 'torch'\n",
+    "tool = 1\n",
+    "[tool]\npoetry = []\n",
+    "[tool.poetry]\ndependencies = ['torch']\n",
+    "[tool.poetry.dependencies]\ntorch = [{version = '^2.0', python = '<3.12'}, {version = '^2.1'}]\n",
+])
+def test_pyproject_with_unexpected_types(repo, pyproject):
+    small_files = repo(**{"pyproject.toml": pyproject, "requirements.txt": "numpy\n"})
+    
+    found = by_name(DependencyInferrer().infer({"small_files": small_files}))
+    
+    # The other files are still read
+    assert "numpy" in found
+    assert found.get("torch", {"version": "unknown"})["version"] == "unknown"
+
+
+@pytest.mark.parametrize("config", [[1, 2], {"architectures": "X", "transformers_version": 4}, {"torch_dtype": {}}])
+def test_config_with_unexpected_types(repo, config):
+    small_files = repo(**{"requirements.txt": "numpy\n"})
+    
+    found = by_name(DependencyInferrer().infer({"config": config, "small_files": small_files}))
+    
+    assert list(found) == ["numpy"]
+
+
+def test_dependency_component():
+    exact = dependency_component({
+        "type": "framework", "name": "Sentence_Transformers", "version": "2.2.2+cu118",
+        "description": "d", "supplier": "community", "sources": ["a", "b"], "dtype": "float16",
+    })
+    ranged = dependency_component({
+        "type": "library", "name": "torch", "version": ">=2.0", "description": "d",
+        "supplier": "community", "sources": ["requirements.txt"],
+    })
+    remote = dependency_component({
+        "type": "remote-code", "name": "org/repo/modeling.py", "version": "unknown",
+        "description": "d", "supplier": "org", "sources": ["config.json"],
+    })
+    
+    assert exact["bom-ref"] == exact["purl"] == "pkg:pypi/sentence-transformers@2.2.2%2Bcu118"
+    assert exact["version"] == "2.2.2+cu118"
+    assert {"name": "aibom:dtype", "value": "float16"} in exact["properties"]
+    assert ranged["purl"] == "pkg:pypi/torch"
+    assert "version" not in ranged
+    assert {"name": "aibom:version-constraint", "value": ">=2.0"} in ranged["properties"]
+    assert remote["type"] == "file"
+    assert remote["bom-ref"] == "remote-code:org/repo/modeling.py"
+    assert remote["purl"] == "pkg:huggingface/org/repo"
+
+
+@pytest.mark.asyncio
+async def test_malformed_files_do_not_replace_the_aibom(repo, tmp_path):
+    small_files = repo(**{"setup.py": "setup(install_requires=[1])\n", "pyproject.toml": "project = 1\n"})
+    model_info = ModelInfo(
+        name="org/model", author="org", description=None, tags=[], pipeline_tag=None,
+        library_name="transformers", license=None, downloads=0, likes=0, created_at="",
+        last_modified="", model_size=None, config={"torch_dtype": "float32"},
+        files=[{"name": "pytorch_model.bin", "size": 3, "blob_id": "b" * 40, "sha256": None}],
+        small_files=small_files
+    )
+    generator = AIBOMGenerator(
+        AIBOMSettings(cache_enabled=False, validation_mode="off", cache_dir=str(tmp_path)), HuggingFaceSettings()
+    )
+    
+    aibom = await generator.generate_aibom(model_info)
+    
+    assert {c["name"] for c in aibom.dependency_components()} == {"transformers", "torch"}
+    assert any(c["name"] == "pytorch_model.bin" for c in aibom.components)
@@ -0,0 +1,85 @@
+"""Tests for the disk cache and the metadata cache built on it."""
+
+import os
+
+from aibom_agent.models.analysis_result import ModelInfo
+from aibom_agent.services.disk_cache import DiskCache
+from aibom_agent.services.metadata_cache import ModelMetadataCache, is_commit_sha
+
+SHA = "a" * 40
+
+
+def make_model_info(**overrides) -> ModelInfo:
+    fields = dict(
+        name="org/model", author="org", description=None, tags=[], pipeline_tag=None,
+        library_name=None, license="mit", downloads=0, likes=0, created_at="",
+        last_modified="2024-01-01T00:00:00+00:00", model_size=None, config={},
+        files=[{"name": "config.json", "size": 10}], sha=SHA
+    )
+    fields.update(overrides)
+    return ModelInfo(**fields)
+
+
+def test_round_trip(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=1 << 20)
+    cache.put("key", {"a": [1, 2]})
+    
+    entry = cache.get("key")
+    assert entry.value == {"a": [1, 2]}
+    assert entry.age >= 0
+    assert cache.get("other") is None
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=1 << 20)
+    cache.put("key", 1)
+    path = cache._path("key")
+    path.write_text("{not json")
+    
+    assert cache.get("key") is None
+    assert not path.exists()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=700)
+    value = "x" * 100
+    for i in range(4):
+        cache.put(f"key{i}", value)
+        os.utime(cache._path(f"key{i}"), (i, i))
+    
+    # A read makes key0 the most recently used entry, so key1 goes first
+    assert cache.get("key0") is not None
+    cache.put("key4", value)
+    
+    assert cache.get("key0") is not None
+    assert cache.get("key1") is None
+    assert cache.get("key4") is not None
+    assert sum(p.stat().st_size for p in tmp_path.glob("*/*.json")) <= 700
+
+
+def test_is_commit_sha():
+    assert is_commit_sha(SHA)
+    assert not is_commit_sha("main")
+    assert not is_commit_sha(None)
+    assert not is_commit_sha("A" * 40)
+
+
+def test_metadata_cache_round_trip(tmp_path):
+    cache = ModelMetadataCache(str(tmp_path), ttl=60, max_bytes=1 << 20)
+    cache.put(make_model_info(), revision="main")
+    
+    ref = cache.resolve("org/model", "main")
+    assert ref.value["sha"] == SHA
+    assert cache.is_fresh(ref)
+    
+    info = cache.get("org/model", SHA)
+    assert list(info.files.names()) == ["config.json"]
+    assert cache.get("org/model", "b" * 40) is None
+
+
+def test_metadata_cache_pins_no_ref_for_commit_revisions(tmp_path):
+    cache = ModelMetadataCache(str(tmp_path), ttl=60, max_bytes=1 << 20)
+    cache.put(make_model_info(), revision=SHA)
+    
+    assert cache.resolve("org/model", SHA) is None
+    assert cache.get("org/model", SHA) is not None
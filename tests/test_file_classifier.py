@@ -0,0 +1,86 @@
+"""Tests for rule-based file classification."""
+
+import json
+from fnmatch import fnmatchcase
+
+import pytest
+
+from aibom_agent.services.file_classifier import DEFAULT_RULES, FileClassifier
+
+NAMES = [
+    "model.safetensors", "pytorch_model.bin", "sub/dir/model-00001-of-00002.bin", "ggml-model-q4_0.BIN",
+    "model.mlpackage/Data/com.apple.CoreML/weights/weight.bin", "model.mlpackage/Manifest.json",
+    "saved_model/variables/variables.data-00000-of-00001", "saved_model/variables/variables.index",
+    "saved_model/saved_model.pb", "tf_model.h5", "model.onnx", "onnx/model.onnx_data",
+    "tokenizer.model", "spiece.model", "vocab.txt", "merges.txt", "config.json", "README.md",
+    "modeling_x.py", "convert_pickle_to_safetensors.py", "weights.npz", "model.ckpt.index",
+    "LICENSE", ".gitattributes", "checkpoint", "x.pkl",
+]
+
+
+def naive_classify(rules, name):
+    """Reference: the first rule with a matching pattern."""
+    for rule in rules:
+        if any(fnmatchcase(name.lower(), pattern.lower()) for pattern in rule.patterns):
+            return rule
+    return None
+
+
+def test_matches_first_rule_in_order():
+    classifier = FileClassifier()
+    
+    for name in NAMES:
+        assert classifier.classify(name) == naive_classify(classifier.rules, name), name
+    assert classifier.classify_all(NAMES) == [classifier.classify(name) for name in NAMES]
+
+
+@pytest.mark.parametrize("name, component_type, file_format", [
+    ("model.mlpackage/Data/com.apple.CoreML/weights/weight.bin", "model-weights", "coreml"),
+    ("saved_model/variables/variables.data-00000-of-00001", "model-weights", "tensorflow"),
+    ("convert_pickle_to_safetensors.py", "source-code", None),
+    ("modeling_x.py", "source-code", None),
+    ("tokenizer.model", "tokenizer", None),
+    ("model.mlpackage/Manifest.json", "model-weights", "coreml"),
+])
+def test_path_specific_rules_win(name, component_type, file_format):
+    rule = FileClassifier().classify(name)
+    
+    assert rule.component_type == component_type
+    assert rule.format == file_format
+
+
+def test_bin_is_an_unverified_pickle():
+    rule = FileClassifier().classify("pytorch_model.bin")
+    
+    assert rule.format == "pickle"
+    assert rule.risk_tags == ["pickle", "unverified-format"]
+
+
+def test_unmatched_files():
+    classifier = FileClassifier()
+    
+    assert classifier.classify("README.md") is None
+    assert classifier.classify("LICENSE") is None
+
+
+def test_rules_file_takes_precedence(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps([
+        {"patterns": ["*.md"], "component_type": "documentation", "description": "Model card"},
+        {"patterns": ["*.bin"], "component_type": "model-weights", "description": "GGML weights", "format": "ggml"},
+    ]))
+    
+    classifier = FileClassifier.from_settings(str(rules_file))
+    
+    assert classifier.classify("README.md").component_type == "documentation"
+    assert classifier.classify("pytorch_model.bin").format == "ggml"
+    assert classifier.rules_hash != FileClassifier().rules_hash
+
+
+def test_unreadable_rules_file_falls_back_to_defaults(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text("not json")
+    
+    classifier = FileClassifier.from_settings(str(rules_file))
+    
+    assert len(classifier.rules) == len(DEFAULT_RULES)
@@ -0,0 +1,59 @@
+"""Tests for the columnar file table."""
+
+import json
+
+from aibom_agent.models.analysis_result import ModelInfo
+from aibom_agent.models.file_table import FileTable
+
+RECORDS = [
+    {"name": "config.json", "size": 700, "blob_id": "1" * 40, "sha256": None},
+    {"name": "model.safetensors", "size": 5_000_000_000, "blob_id": "2" * 40, "sha256": "ab" * 32},
+    {"name": "onnx/model.onnx", "size": None, "blob_id": None, "sha256": None},
+    {"name": "onnx/weird.bin", "size": 1, "blob_id": "not-hex", "sha256": None},
+]
+
+
+def test_rows_match_records():
+    table = FileTable(RECORDS)
+    
+    assert len(table) == 4
+    assert table[0] == {"name": "config.json", "size": 700, "blob_id": "1" * 40, "sha256": None, "kind": "git"}
+    # The LFS sha256 wins over the pointer's git blob id
+    assert table[1]["sha256"] == "ab" * 32
+    assert table[1]["blob_id"] is None
+    assert table[2] == {"name": "onnx/model.onnx", "size": None, "blob_id": None, "sha256": None, "kind": None}
+    assert table[-1]["blob_id"] == "not-hex"
+
+
+def test_names_and_matching():
+    table = FileTable(RECORDS)
+    
+    assert list(table.names()) == [r["name"] for r in RECORDS]
+    assert [r["name"] for r in table.matching(["*.json", "onnx/"])] == [
+        "config.json", "onnx/model.onnx", "onnx/weird.bin"
+    ]
+
+
+def test_dict_round_trip_through_json():
+    table = FileTable(RECORDS)
+    
+    restored = FileTable.from_dict(json.loads(json.dumps(table.to_dict())))
+    
+    assert restored == table
+    assert restored.to_records() == table.to_records()
+    restored.append({"name": "onnx/extra.txt", "size": 2})
+    assert restored[-1]["name"] == "onnx/extra.txt"
+
+
+def test_model_info_accepts_every_file_form():
+    def model_info(files):
+        return ModelInfo(
+            name="org/model", author="org", description=None, tags=[], pipeline_tag=None,
+            library_name=None, license=None, downloads=0, likes=0, created_at="",
+            last_modified="", model_size=None, config={}, files=files
+        )
+    
+    table = FileTable(RECORDS)
+    assert model_info(RECORDS).files == table
+    assert model_info(table.to_dict()).files == table
+    assert model_info(table).files is table
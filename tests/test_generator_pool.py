@@ -0,0 +1,84 @@
+"""Tests for the generator worker pool, using a small line-delimited JSON worker."""
+
+import asyncio
+import shlex
+import sys
+import threading
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings
+from aibom_agent.services.generator_pool import GeneratorPool, GeneratorWorkerError
+
+# Answers requests in order; a manifest may ask for a delay, an error or an exit
+WORKER_SCRIPT = """
+import json, sys, time
+for line in sys.stdin:
+    request = json.loads(line)
+    manifest = request.get("manifest", {})
+    time.sleep(manifest.get("sleep", 0))
+    if manifest.get("exit"):
+        sys.exit(3)
+    if manifest.get("fail"):
+        response = {"id": request["id"], "error": "generation failed"}
+    else:
+        response = {"id": request["id"], "result": {"echo": manifest.get("value")}}
+    print(json.dumps(response), flush=True)
+"""
+
+
+@pytest.fixture
+def pool(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(WORKER_SCRIPT)
+    settings = AIBOMSettings(
+        owasp_generator_path=str(tmp_path),
+        generator_command=f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}",
+        generator_pool_size=1,
+        generator_timeout=5.0,
+        generator_health_interval=0
+    )
+    pool = GeneratorPool(settings)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def reader_alive() -> bool:
+    return any(thread.name == "aibom-generator-0-stdout" for thread in threading.enumerate())
+
+
+@pytest.mark.asyncio
+async def test_generate_returns_result(pool):
+    assert await pool.generate({"value": 1}) == {"echo": 1}
+    assert pool.stats()["workers"][0]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_error_is_raised(pool):
+    with pytest.raises(GeneratorWorkerError, match="generation failed"):
+        await pool.generate({"fail": True})
+    assert await pool.generate({"value": 2}) == {"echo": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_break_the_worker(pool):
+    task = asyncio.ensure_future(pool.generate({"sleep": 0.3, "value": 1}))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    # The worker answers the cancelled request first; the reader must skip it
+    assert await pool.generate({"value": 2}) == {"echo": 2}
+    assert reader_alive()
+    assert pool.stats()["workers"][0]["restarts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_exited_worker_is_restarted(pool):
+    with pytest.raises(GeneratorWorkerError, match="exited"):
+        await pool.generate({"exit": True})
+    
+    assert await pool.generate({"value": 3}) == {"echo": 3}
+    assert pool.stats()["workers"][0]["restarts"] == 1
@@ -0,0 +1,34 @@
+"""Tests for the pooled Hub HTTP client."""
+
+import pytest
+
+hf_http = pytest.importorskip("huggingface_hub.utils._http")
+
+from aibom_agent.config.settings import HuggingFaceSettings
+from aibom_agent.services.hub_http import _build_httpx_client
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(hf_http, "hf_request_event_hook"),
+    reason="huggingface_hub uses the requests backend"
+)
+
+
+def test_client_has_default_timeouts():
+    settings = HuggingFaceSettings(http_connect_timeout=3.0, http_read_timeout=7.0)
+    with _build_httpx_client(settings) as client:
+        assert client.timeout.connect == 3.0
+        assert client.timeout.read == 7.0
+
+
+def test_client_keeps_hf_event_hook():
+    with _build_httpx_client(HuggingFaceSettings()) as client:
+        assert hf_http.hf_request_event_hook in client.event_hooks["request"]
+
+
+def test_each_call_builds_a_new_client():
+    settings = HuggingFaceSettings()
+    first = _build_httpx_client(settings)
+    first.close()
+    with _build_httpx_client(settings) as second:
+        assert second is not first
+        assert not second.is_closed
@@ -0,0 +1,105 @@
+"""Tests for the local directory and archive model sources."""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import pytest
+
+from aibom_agent.config.settings import HuggingFaceSettings
+from aibom_agent.services.local_model_source import ArchiveModelSource, LocalDirectoryModelSource
+
+SHA = "c" * 40
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return HuggingFaceSettings(cache_dir=str(tmp_path / "cache"), inspect_safetensors=False)
+
+
+def write_model(model_dir):
+    model_dir.mkdir(parents=True)
+    (model_dir / "config.json").write_text(json.dumps({"model_type": "bert"}))
+    (model_dir / "pytorch_model.bin").write_bytes(b"\0" * 64)
+
+
+def add_tar_member(tar, name, data=b"", **attributes):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    for key, value in attributes.items():
+        setattr(info, key, value)
+    tar.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.asyncio
+async def test_directory_source_reads_model(tmp_path, settings):
+    write_model(tmp_path / "models" / "org" / "model")
+    source = LocalDirectoryModelSource(str(tmp_path / "models"), settings)
+    
+    info = await source.get_model_info("org/model")
+    
+    assert sorted(info.files.names()) == ["config.json", "pytorch_model.bin"]
+    assert info.config == {"model_type": "bert"}
+    assert info.author == "org"
+    assert "config.json" in info.small_files
+    assert info.sha is None
+
+
+def test_directory_source_resolves_cache_refs(tmp_path, settings):
+    repo = tmp_path / "hub" / "models--org--model"
+    write_model(repo / "snapshots" / SHA)
+    (repo / "refs").mkdir()
+    (repo / "refs" / "main").write_text(SHA)
+    source = LocalDirectoryModelSource(str(tmp_path / "hub"), settings)
+    
+    assert source.locate("org/model") == (repo / "snapshots" / SHA, SHA)
+    with pytest.raises(FileNotFoundError):
+        source.locate("org/model", "v2")
+
+
+def test_archive_source_extracts_single_model_tar(tmp_path, settings):
+    write_model(tmp_path / "src" / "model")
+    archive = tmp_path / "org--model.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(tmp_path / "src" / "model", arcname="model")
+    source = ArchiveModelSource(str(tmp_path), settings)
+    
+    model_dir, sha = source.locate("org/model")
+    
+    assert (model_dir / "config.json").is_file()
+    assert sha is None
+    # A second lookup reuses the extraction
+    assert source.locate("org/model")[0] == model_dir
+
+
+@pytest.mark.parametrize("member", [
+    {"name": "../escape.txt", "data": b"x"},
+    {"name": "link", "type": tarfile.SYMTYPE, "linkname": "/etc/passwd"},
+])
+def test_archive_source_refuses_unsafe_tar_members(tmp_path, settings, member):
+    archive = tmp_path / "archives" / "org--model.tar"
+    archive.parent.mkdir()
+    with tarfile.open(archive, "w") as tar:
+        add_tar_member(tar, "model/config.json", b"{}")
+        add_tar_member(tar, **member)
+    source = ArchiveModelSource(str(archive.parent), settings)
+    
+    with pytest.raises((ValueError, tarfile.TarError)):
+        source.locate("org/model")
+    assert not (tmp_path / "escape.txt").exists()
+    assert not any((tmp_path / "cache" / "archives").iterdir())
+
+
+def test_archive_source_refuses_zip_path_traversal(tmp_path, settings):
+    archive = tmp_path / "archives" / "org--model.zip"
+    archive.parent.mkdir()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("model/config.json", "{}")
+        zf.writestr("../../escape.txt", "x")
+    source = ArchiveModelSource(str(archive.parent), settings)
+    
+    with pytest.raises(ValueError):
+        source.locate("org/model")
+    assert not (tmp_path / "escape.txt").exists()
+    assert not any((tmp_path / "cache" / "archives").iterdir())
@@ -0,0 +1,125 @@
+"""Tests for the pickle scanner."""
+
+import io
+import os
+import pickle
+import zipfile
+from collections import OrderedDict
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings
+from aibom_agent.models.analysis_result import SecurityAnalysis
+from aibom_agent.services.pickle_scanner import LEGACY_TORCH_MAGIC, PickleScanner, scan_file
+
+
+class Exploit:
+    """Pickles to a call of os.system; never unpickled by these tests."""
+    
+    def __reduce__(self):
+        return (os.system, ("echo pwned",))
+
+
+def malicious_pickle() -> bytes:
+    return pickle.dumps({"weights": [1.0, 2.0], "x": Exploit()}, protocol=2)
+
+
+def zip_checkpoint(data_pkl: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("archive/data.pkl", data_pkl)
+        archive.writestr("archive/data/0", b"\0" * 16)
+    return buffer.getvalue()
+
+
+def legacy_checkpoint(data: object) -> bytes:
+    buffer = io.BytesIO()
+    for obj in (LEGACY_TORCH_MAGIC, 1001, {"protocol_version": 1001}, data, ["0"]):
+        pickle.dump(obj, buffer, protocol=2)
+    return buffer.getvalue()
+
+
+def empty_analysis() -> SecurityAnalysis:
+    return SecurityAnalysis(
+        risk_score=0.0, risk_level="LOW", vulnerabilities=[], compliance_issues=[],
+        recommendations=[], unsafe_formats=[], suspicious_files=[], license_issues=[]
+    )
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(name: str, content: bytes) -> str:
+        path = tmp_path / name
+        path.write_bytes(content)
+        return str(path)
+    return write
+
+
+def test_clean_pickle(write):
+    result = scan_file("model.pkl", write("model.pkl", pickle.dumps(OrderedDict(a=1), protocol=2)))
+    
+    assert result.is_pickle
+    assert result.imports == ["collections.OrderedDict"]
+    assert not result.is_dangerous
+    assert not result.unknown_imports
+
+
+def test_malicious_pickle(write):
+    result = scan_file("model.pkl", write("model.pkl", malicious_pickle()))
+    
+    assert result.dangerous_imports == [f"{os.system.__module__}.system"]
+    assert result.error is None
+
+
+def test_malicious_zip_checkpoint(write):
+    result = scan_file("pytorch_model.bin", write("pytorch_model.bin", zip_checkpoint(malicious_pickle())))
+    
+    assert result.is_dangerous
+
+
+def test_pickle_with_appended_zip_is_scanned_as_pickle(write):
+    # torch.load unpickles the leading bytes; only the appended zip is an archive
+    content = malicious_pickle() + zip_checkpoint(pickle.dumps([], protocol=2))
+    path = write("pytorch_model.bin", content)
+    assert zipfile.is_zipfile(path)
+    
+    result = scan_file("pytorch_model.bin", path)
+    
+    assert result.is_pickle
+    assert result.is_dangerous
+
+
+def test_legacy_checkpoint_ignores_storage_bytes(write):
+    # Raw storage bytes that happen to look like an import must not be reported
+    storage = b"\x80\x02cposix\nsystem\nq\x00."
+    result = scan_file("model.bin", write("model.bin", legacy_checkpoint(OrderedDict(w=1)) + storage))
+    
+    assert result.legacy_torch
+    assert result.error is None
+    assert not result.is_dangerous
+
+
+def test_truncated_legacy_checkpoint_keeps_imports(write):
+    content = legacy_checkpoint({"x": Exploit()})
+    result = scan_file("model.bin", write("model.bin", content[:-5]))
+    
+    assert result.error
+    assert result.is_dangerous
+
+
+def test_non_pickle_bin(write):
+    result = scan_file("ggml-model.bin", write("ggml-model.bin", b"GGUF" + bytes(range(256)) * 4))
+    
+    assert not result.is_pickle
+    assert not result.imports
+
+
+def test_apply_results_reports_scan_errors(write):
+    results = [scan_file("model.bin", write("model.bin", legacy_checkpoint({"x": Exploit()})[:-5]))]
+    analysis = empty_analysis()
+    
+    PickleScanner(AIBOMSettings()).apply_results(analysis, results)
+    
+    assert {v["type"] for v in analysis.vulnerabilities} == {"unscannable-pickle", "unsafe-deserialization"}
+    assert analysis.suspicious_files == ["model.bin"]
+    assert analysis.recommendations
@@ -0,0 +1,121 @@
+"""Tests for the Hub rate limiter."""
+
+import pytest
+
+from aibom_agent.config.settings import HuggingFaceSettings
+from aibom_agent.services.rate_limiter import HubRateLimiter, TokenBucket
+
+
+class Throttled(Exception):
+    """An HTTP error carrying a response, like huggingface_hub's HfHubHTTPError."""
+    
+    def __init__(self, status_code=429, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = type("Response", (), {"status_code": status_code, "headers": headers or {}})()
+
+
+def make_limiter(**overrides) -> HubRateLimiter:
+    settings = HuggingFaceSettings(**{
+        "rate_limit_anonymous_rpm": 60.0,
+        "rate_limit_burst": 2,
+        "rate_limit_backoff_base": 0.0,
+        **overrides,
+    })
+    return HubRateLimiter(settings)
+
+
+def test_bucket_allows_a_burst_then_paces():
+    bucket = TokenBucket(rate_per_minute=60.0, burst=2)
+    
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+
+def test_bucket_pause_holds_back_callers():
+    bucket = TokenBucket(rate_per_minute=6000.0, burst=10)
+    bucket.pause(5.0)
+    
+    assert bucket.reserve() == pytest.approx(5.0, abs=0.05)
+
+
+def test_set_authenticated_changes_rate():
+    limiter = make_limiter(rate_limit_authenticated_rpm=600.0)
+    limiter.set_authenticated(True)
+    
+    assert limiter.stats()["rate_per_minute"] == 600.0
+
+
+@pytest.mark.asyncio
+async def test_call_retries_throttled_requests():
+    limiter = make_limiter(rate_limit_anonymous_rpm=6000.0)
+    attempts = []
+    
+    async def run():
+        attempts.append(None)
+        if len(attempts) < 3:
+            raise Throttled(headers={"Retry-After": "0"})
+        return "ok"
+    
+    assert await limiter.call(run) == "ok"
+    stats = limiter.stats()
+    assert stats["throttled"] == 2
+    assert stats["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_call_gives_up_after_max_retries():
+    limiter = make_limiter(rate_limit_anonymous_rpm=6000.0, rate_limit_max_retries=1)
+    
+    async def run():
+        raise Throttled(503)
+    
+    with pytest.raises(Throttled):
+        await limiter.call(run)
+    assert limiter.stats()["gave_up"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_does_not_retry_other_errors():
+    limiter = make_limiter()
+    
+    async def run():
+        raise Throttled(404)
+    
+    with pytest.raises(Throttled):
+        await limiter.call(run)
+    assert limiter.stats()["retries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resolve_traffic_does_not_use_api_tokens():
+    limiter = make_limiter(rate_limit_resolve_rpm=6000.0, rate_limit_resolve_burst=100)
+    
+    async def run():
+        return None
+    
+    for _ in range(10):
+        await limiter.call(run, resolve=True)
+    
+    # The two-token API burst is untouched
+    assert limiter.bucket.reserve() == 0.0
+    assert limiter.bucket.reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_resolve_traffic_can_be_exempt():
+    limiter = make_limiter(rate_limit_resolve_rpm=0)
+    
+    await limiter.acquire(resolve=True)
+    
+    assert limiter.resolve_bucket is None
+    assert limiter.stats()["resolve_rate_per_minute"] is None
+
+
+def test_retry_after_accepts_http_dates():
+    limiter = make_limiter()
+    
+    assert limiter._retry_after(Throttled(headers={"Retry-After": "12"})) == 12.0
+    assert limiter._retry_after(Throttled(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert limiter._retry_after(Throttled()) is None
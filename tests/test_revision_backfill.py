@@ -0,0 +1,118 @@
+"""Tests for the revision history backfill."""
+
+import asyncio
+
+import pytest
+
+from aibom_agent.config.settings import AIBOMSettings
+from aibom_agent.models.analysis_result import ModelInfo, ModelRevision
+from aibom_agent.services.pickle_scanner import PickleScanResult
+from aibom_agent.services.revision_backfill import RevisionBackfiller, diff_files
+
+
+def make_model_info(name, sha, files) -> ModelInfo:
+    return ModelInfo(
+        name=name, author="org", description=None, tags=[], pipeline_tag=None,
+        library_name=None, license="mit", downloads=0, likes=0, created_at="",
+        last_modified="", model_size=None, config={}, files=files, sha=sha
+    )
+
+
+def lfs_file(name, digit):
+    return {"name": name, "size": 3, "blob_id": None, "sha256": str(digit) * 64}
+
+
+class FakeSource:
+    """Serves revision i with a weights file whose content changes every other revision."""
+    
+    def __init__(self, revisions=6, max_concurrency=2, failing=()):
+        self.revisions = [ModelRevision(sha=f"{i:040x}") for i in range(revisions)]
+        self.max_concurrency = max_concurrency
+        self.failing = set(failing)
+        self.live = 0
+        self.peak = 0
+        self.downloads = []
+    
+    async def list_revisions(self, model_name):
+        return self.revisions
+    
+    async def get_model_info(self, model_name, revision=None):
+        self.live += 1
+        self.peak = max(self.peak, self.live)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.live -= 1
+        index = int(revision, 16)
+        if index in self.failing:
+            raise PermissionError("gated")
+        files = [lfs_file("w[1].bin", index // 2), lfs_file("config.json", 0)]
+        return make_model_info(model_name, revision, files)
+    
+    async def download_model_files(self, model_name, file_patterns, revision=None):
+        self.downloads.append(file_patterns)
+        return {"w[1].bin": f"/tmp/{revision}"}
+
+
+class FakeGenerator:
+    async def generate_aibom(self, model_info, file_memo=None):
+        return f"aibom:{model_info.sha}"
+
+
+class FakeScanner:
+    def __init__(self):
+        self.scanned = 0
+    
+    async def scan_files(self, paths):
+        self.scanned += len(paths)
+        return [PickleScanResult(file_name=name) for name in paths]
+
+
+def make_backfiller(source, scanner=None):
+    settings = AIBOMSettings(deep_scan_enabled=True, pickle_scan_patterns=["*.bin"])
+    return RevisionBackfiller(source, FakeGenerator(), scanner or FakeScanner(), settings)
+
+
+def test_diff_files():
+    before = [lfs_file("a", 1), lfs_file("b", 2), {"name": "c", "size": 1, "blob_id": None, "sha256": None}]
+    after = [lfs_file("a", 1), lfs_file("b", 3), {"name": "c", "size": 2, "blob_id": None, "sha256": None},
+             lfs_file("d", 4)]
+    
+    assert diff_files(before, after) == (["d"], ["b", "c"], [])
+    assert diff_files(after, before) == ([], ["b", "c"], ["d"])
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_failed_revisions():
+    source = FakeSource(failing={3})
+    
+    results = await make_backfiller(source).backfill("org/model")
+    
+    assert [r.aibom is not None for r in results] == [True, True, True, False, True, True]
+    assert results[3].error == "gated"
+    # Revision 4 is compared with revision 2, the last one processed
+    assert results[4].modified_files == ["w[1].bin"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_fetches_in_a_bounded_window():
+    source = FakeSource(revisions=10, max_concurrency=2)
+    
+    results = await make_backfiller(source).backfill("org/model", max_revisions=8)
+    
+    assert len(results) == 8
+    assert source.peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_backfill_reuses_pickle_scans_for_unchanged_content():
+    source = FakeSource(revisions=4)
+    scanner = FakeScanner()
+    
+    results = await make_backfiller(source, scanner).backfill("org/model")
+    
+    # Weights change at revisions 0 and 2 only
+    assert scanner.scanned == 2
+    assert all(len(r.pickle_findings) == 1 for r in results)
+    # File names are passed as literal patterns
+    assert source.downloads == [["w[[]1].bin"], ["w[[]1].bin"]]